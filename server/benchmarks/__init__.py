@@ -0,0 +1 @@
+"""Load-test and benchmark suite for the Django app (see benchmarks.run)."""
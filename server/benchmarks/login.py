@@ -0,0 +1,175 @@
+"""
+Benchmark the authentication path on one CPU core.
+
+Logs a user in repeatedly through the login_user view with each password
+hasher of settings.PASSWORD_HASHER_CLASSES, then loads the resulting session
+with each session engine the way SessionMiddleware does on every
+authenticated request. Everything runs in this process on one thread against
+a throwaway database, so "per core" figures are requests per CPU second.
+
+Each user starts with a PBKDF2 hash, as users registered before the hasher
+change have, so the report also shows whether the first login rehashed the
+password with the selected hasher.
+
+Usage (from the server/ directory):
+    $ python -m benchmarks.login --logins 20 --lookups 5000
+    $ python -m benchmarks.login --hashers pbkdf2 argon2 --sessions db cached_db
+
+Output:
+    {"hashers": {"pbkdf2": {"logins": 20, "mean_ms": 480.4,
+                            "logins_per_core_s": 2.1,
+                            "stored_as": "pbkdf2_sha256"}, ...},
+     "sessions": {"db": {"lookups": 5000, "mean_us": 708.0,
+                         "lookups_per_core_s": 1438.2,
+                         "queries_per_lookup": 1.0}, ...}}
+"""
+
+import argparse
+from importlib import import_module
+from importlib.util import find_spec
+import json
+import os
+import tempfile
+import time
+
+PASSWORD = "bench-Password-1"
+
+SESSION_ENGINES = ("db", "cached_db", "signed_cookies")
+
+
+def _login_client():
+    from django.test import Client
+
+    return Client(HTTP_HOST="localhost")
+
+
+def _login(client, username):
+    response = client.post(
+        "/djangoapp/login",
+        json.dumps({"userName": username, "password": PASSWORD}),
+        content_type="application/json",
+    )
+    if response.json().get("status") != "Authenticated":
+        raise SystemExit(f"Login of {username} failed: {response.content!r}")
+
+
+def bench_hasher(name, count):
+    """
+    Times ``count`` logins with ``name`` as the preferred password hasher.
+
+    Returns:
+        dict: logins, mean_ms, logins_per_core_s, stored_as (the algorithm of
+              the stored hash after the first login)
+    """
+    from django.conf import settings
+    from django.contrib.auth.hashers import make_password
+    from django.contrib.auth.models import User
+    from django.test import override_settings
+
+    classes = settings.PASSWORD_HASHER_CLASSES
+    hashers = [classes[name]] + [path for key, path in classes.items() if key != name]
+    with override_settings(PASSWORD_HASHERS=hashers):
+        user = User.objects.create(
+            username=f"bench-{name}",
+            password=make_password(PASSWORD, hasher="pbkdf2_sha256"),
+        )
+        client = _login_client()
+        _login(client, user.username)  # rehashes the PBKDF2 hash
+        user.refresh_from_db()
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        for _ in range(count):
+            _login(client, user.username)
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return {
+        "logins": count,
+        "mean_ms": round(wall / count * 1000, 3),
+        "logins_per_core_s": round(count / cpu, 1),
+        "stored_as": user.password.split("$", 1)[0],
+    }
+
+
+def bench_session(engine, count):
+    """
+    Times ``count`` loads of a logged-in session with ``engine``.
+
+    Returns:
+        dict: lookups, mean_us, lookups_per_core_s, queries_per_lookup
+    """
+    from django.conf import settings
+    from django.contrib.auth import SESSION_KEY
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.test import override_settings
+    from django.test.utils import CaptureQueriesContext
+
+    with override_settings(SESSION_ENGINE=f"django.contrib.sessions.backends.{engine}"):
+        user = User.objects.create_user(f"bench-session-{engine}", password=PASSWORD)
+        client = _login_client()
+        _login(client, user.username)
+        session_key = client.cookies[settings.SESSION_COOKIE_NAME].value
+        store = import_module(settings.SESSION_ENGINE).SessionStore
+
+        with CaptureQueriesContext(connection) as queries:
+            wall, cpu = time.perf_counter(), time.process_time()
+            for _ in range(count):
+                if store(session_key).get(SESSION_KEY) is None:
+                    raise SystemExit(f"Session lost with the {engine} engine")
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return {
+        "lookups": count,
+        "mean_us": round(wall / count * 1e6, 3),
+        "lookups_per_core_s": round(count / cpu, 1),
+        "queries_per_lookup": round(len(queries) / count, 3),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark login and sessions")
+    parser.add_argument("--logins", type=int, default=20, help="per hasher")
+    parser.add_argument("--lookups", type=int, default=2000, help="per engine")
+    parser.add_argument("--hashers", nargs="*", help="default: all available")
+    parser.add_argument("--sessions", nargs="*", choices=SESSION_ENGINES)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DJANGO_SETTINGS_MODULE"] = "benchmarks.settings"
+        os.environ["BENCHMARK_DB"] = os.path.join(tmp, "benchmark.sqlite3")
+        import django
+        from django.conf import settings
+        from django.core.management import call_command
+
+        django.setup()
+        call_command("migrate", verbosity=0)
+
+        hashers = args.hashers or [
+            name
+            for name in settings.PASSWORD_HASHER_CLASSES
+            if name != "argon2" or find_spec("argon2") is not None
+        ]
+        unknown = set(hashers) - set(settings.PASSWORD_HASHER_CLASSES)
+        if unknown:
+            raise SystemExit(f"Unknown hashers: {', '.join(sorted(unknown))}")
+        results = {
+            "hashers": {name: bench_hasher(name, args.logins) for name in hashers},
+            "sessions": {
+                engine: bench_session(engine, args.lookups)
+                for engine in args.sessions or SESSION_ENGINES
+            },
+        }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,402 @@
+"""
+Load-test the Django app against local upstream stubs.
+
+Starts the stub Node backend and sentiment service (benchmarks.stubs) with a
+simulated latency, serves the app on a throwaway database, drives every
+route of djangoapp/urls.py at a set concurrency and reports latency
+percentiles and throughput per route as JSON. With --baseline the results
+are compared against a stored run and the exit status is 1 when a route
+regressed, so the check can gate a deploy.
+
+Usage (from the server/ directory):
+    $ python -m benchmarks.run --concurrency 16 --requests 400 \\
+        --backend-latency 20 --sentiment-latency 5 --output results.json
+
+    # Store a baseline on the reference machine, then check against it
+    $ python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    $ python -m benchmarks.run --baseline benchmarks/baseline.json
+
+Output:
+    {"config": {...},
+     "routes": {"get_dealers": {"requests": 400, "errors": 0,
+                                "p50_ms": 3.1, "p95_ms": 7.9, "p99_ms": 12.4,
+                                "mean_ms": 3.8, "throughput_rps": 2630.2}, ...}}
+
+Baselines are machine specific: record them on the machine that runs the
+check.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+import requests
+
+from benchmarks.stubs import start_backend, start_sentiment
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PASSWORD = "bench-Password-1"
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Client:
+    """
+    Per-thread HTTP sessions against the app under test.
+
+    ``anonymous`` is used for public routes and for the login/logout/register
+    routes; ``user`` stays logged in for the routes that need it.
+    """
+
+    def __init__(self, base_url, username):
+        self.base_url = base_url
+        self.username = username
+        self._local = threading.local()
+
+    def _session(self, name):
+        session = getattr(self._local, name, None)
+        if session is None:
+            session = requests.Session()
+            if name == "user":
+                session.post(
+                    f"{self.base_url}/djangoapp/login",
+                    json={"userName": self.username, "password": PASSWORD},
+                )
+            setattr(self._local, name, session)
+        return session
+
+    @property
+    def anonymous(self):
+        return self._session("anonymous")
+
+    @property
+    def user(self):
+        return self._session("user")
+
+
+def _review(i):
+    return {
+        "name": "Bench User",
+        "dealership": i % 50 + 1,
+        "review": f"Benchmark review number {i}, great service!",
+        "purchase": True,
+        "purchase_date": "01/01/2024",
+        "car_make": "Audi",
+        "car_model": "A6",
+        "car_year": 2020,
+    }
+
+
+# One scenario per URL name of djangoapp/urls.py: (session, method, path, body)
+SCENARIOS = {
+    "login": lambda c, i: (
+        c.anonymous,
+        "post",
+        "/djangoapp/login",
+        {"userName": c.username, "password": PASSWORD},
+    ),
+    "logout": lambda c, i: (c.anonymous, "get", "/djangoapp/logout", None),
+    "register": lambda c, i: (
+        c.anonymous,
+        "post",
+        "/djangoapp/register",
+        {
+            "userName": f"bench-{uuid.uuid4().hex[:12]}",
+            "password": PASSWORD,
+            "firstName": "Bench",
+            "lastName": "User",
+            "email": "bench@example.com",
+        },
+    ),
+    "get_cars": lambda c, i: (c.anonymous, "get", "/djangoapp/get_cars", None),
+    "get_dealers": lambda c, i: (c.anonymous, "get", "/djangoapp/get_dealers", None),
+    "get_dealers_by_state": lambda c, i: (
+        c.anonymous,
+        "get",
+        "/djangoapp/get_dealers/" + ("Texas", "California", "Kansas")[i % 3],
+        None,
+    ),
+    "get_dealer_details": lambda c, i: (
+        c.anonymous,
+        "get",
+        f"/djangoapp/get_dealer/{i % 50 + 1}",
+        None,
+    ),
+    "get_dealer_reviews": lambda c, i: (
+        c.anonymous,
+        "get",
+        f"/djangoapp/reviews/dealer/{i % 50 + 1}",
+        None,
+    ),
+    "add_review": lambda c, i: (c.user, "post", "/djangoapp/add_review", _review(i)),
+    "sentiment_cache_stats": lambda c, i: (
+        c.anonymous,
+        "get",
+        "/djangoapp/sentiment_cache_stats",
+        None,
+    ),
+    "metrics": lambda c, i: (c.anonymous, "get", "/djangoapp/metrics", None),
+}
+
+
+def route_names():
+    """Returns the URL names declared in djangoapp/urls.py."""
+    import django
+
+    django.setup()
+    from djangoapp.urls import urlpatterns
+
+    return [p.name for p in urlpatterns if getattr(p, "name", None)]
+
+
+def summarize(latencies, errors, elapsed):
+    """
+    Summarizes the latencies of one route.
+
+    Args:
+        latencies (list[float]): Request latencies, in seconds
+        errors (int): Number of failed requests
+        elapsed (float): Wall-clock duration of the run, in seconds
+
+    Returns:
+        dict: requests, errors, p50_ms, p95_ms, p99_ms, mean_ms, throughput_rps
+    """
+    ms = sorted(latency * 1000 for latency in latencies)
+    cuts = (
+        statistics.quantiles(ms, n=100, method="inclusive") if len(ms) > 1 else ms * 99
+    )
+    return {
+        "requests": len(ms),
+        "errors": errors,
+        "p50_ms": round(cuts[49], 3),
+        "p95_ms": round(cuts[94], 3),
+        "p99_ms": round(cuts[98], 3),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "throughput_rps": round(len(ms) / elapsed, 1),
+    }
+
+
+def run_route(client, name, count, concurrency):
+    """Sends ``count`` requests of a scenario with ``concurrency`` threads."""
+    scenario = SCENARIOS[name]
+
+    def call(i):
+        session, method, path, body = scenario(client, i)
+        started = time.perf_counter()
+        try:
+            response = session.request(method, client.base_url + path, json=body)
+            failed = response.status_code >= 400
+        except requests.RequestException:
+            failed = True
+        return time.perf_counter() - started, failed
+
+    # Log the user sessions in before the clock starts
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(lambda _: client.user, range(concurrency)))
+        started = time.perf_counter()
+        results = list(pool.map(call, range(count)))
+        elapsed = time.perf_counter() - started
+    return summarize(
+        [latency for latency, _ in results],
+        sum(1 for _, failed in results if failed),
+        elapsed,
+    )
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """
+    Compares a run against a baseline.
+
+    A route regresses when its p95 latency grows by more than ``tolerance``
+    (and by at least ``min_delta_ms``), its throughput drops by more than
+    ``tolerance`` or it has errors the baseline did not have.
+
+    Returns:
+        list[str]: One message per regression
+    """
+    regressions = []
+    for name, base in baseline["routes"].items():
+        current = results["routes"].get(name)
+        if current is None:
+            continue
+        p95_limit = max(base["p95_ms"] * (1 + tolerance), base["p95_ms"] + min_delta_ms)
+        if current["p95_ms"] > p95_limit:
+            regressions.append(
+                f"{name}: p95 {current['p95_ms']} ms > {base['p95_ms']} ms baseline"
+            )
+        if current["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {current['throughput_rps']} rps < "
+                f"{base['throughput_rps']} rps baseline"
+            )
+        if current["errors"] > base["errors"]:
+            regressions.append(
+                f"{name}: {current['errors']} errors, baseline had {base['errors']}"
+            )
+    return regressions
+
+
+def _server_command(args, port):
+    if args.server == "gunicorn":
+        return [
+            sys.executable, "-m", "gunicorn", "djangoproj.wsgi",
+            "-b", f"127.0.0.1:{port}", "-w", str(args.workers),
+            "--threads", str(args.threads),
+        ]  # fmt: skip
+    if args.server == "uvicorn":
+        return [
+            sys.executable, "-m", "uvicorn", "djangoproj.asgi:application",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(args.workers), "--no-access-log",
+        ]  # fmt: skip
+    return [sys.executable, "manage.py", "runserver", "--noreload", f"127.0.0.1:{port}"]
+
+
+def _wait_until_up(base_url, process, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit("The app server exited during startup")
+        try:
+            requests.get(f"{base_url}/djangoapp/get_cars", timeout=1)
+            return
+        except requests.RequestException:
+            time.sleep(0.2)
+    raise SystemExit("The app server did not start in time")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Django app routes")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="per route")
+    parser.add_argument("--routes", nargs="*", help="only run these URL names")
+    parser.add_argument("--backend-latency", type=float, default=10.0, help="ms")
+    parser.add_argument("--sentiment-latency", type=float, default=5.0, help="ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="ms")
+    parser.add_argument(
+        "--server", choices=("gunicorn", "uvicorn", "runserver"), default="gunicorn"
+    )
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--save-baseline", help="write the results as a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--min-delta-ms", type=float, default=2.0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    names = args.routes or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Unknown routes: {', '.join(unknown)}")
+
+    backend = start_backend(latency=args.backend_latency, jitter=args.jitter)
+    sentiment = start_sentiment(latency=args.sentiment_latency, jitter=args.jitter)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            DJANGO_SETTINGS_MODULE="benchmarks.settings",
+            BENCHMARK_DB=os.path.join(tmp, "benchmark.sqlite3"),
+            backend_url=f"http://127.0.0.1:{backend.server_address[1]}",
+            sentiment_analyzer_url=f"http://127.0.0.1:{sentiment.server_address[1]}/",
+        )
+        os.environ.update(env)
+        missing = set(route_names()) - set(SCENARIOS)
+        if missing:
+            print(
+                f"No scenario for routes: {', '.join(sorted(missing))}", file=sys.stderr
+            )
+
+        for command in (["migrate", "--noinput"], ["createcachetable"]):
+            subprocess.run(
+                [sys.executable, "manage.py", *command, "-v", "0"],
+                cwd=SERVER_DIR,
+                env=env,
+                check=True,
+            )
+        username = f"bench-{uuid.uuid4().hex[:8]}"
+        subprocess.run(
+            [sys.executable, "manage.py", "shell", "-c",
+             "from django.contrib.auth.models import User; "
+             f"User.objects.create_user({username!r}, password={PASSWORD!r})"],
+            cwd=SERVER_DIR,
+            env=env,
+            check=True,
+        )  # fmt: skip
+
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            _server_command(args, port),
+            cwd=SERVER_DIR,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_until_up(base_url, server)
+            client = Client(base_url, username)
+            routes = {
+                name: run_route(client, name, args.requests, args.concurrency)
+                for name in names
+            }
+        finally:
+            server.terminate()
+            server.wait()
+            backend.shutdown()
+            sentiment.shutdown()
+
+    results = {
+        "config": {
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "backend_latency_ms": args.backend_latency,
+            "sentiment_latency_ms": args.sentiment_latency,
+            "jitter_ms": args.jitter,
+            "server": args.server,
+            "workers": args.workers,
+            "threads": args.threads,
+        },
+        "routes": routes,
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            f.write(output + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
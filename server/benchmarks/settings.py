@@ -0,0 +1,37 @@
+"""
+Django settings for benchmark runs.
+
+Same as djangoproj.settings, but on a throwaway SQLite database (so users
+and cache rows created by a run never touch db.sqlite3 or the configured
+PostgreSQL database) tuned like the production SQLite profile, and with
+DEBUG off, as in production.
+"""
+
+import os
+
+from djangoproj.settings import *  # noqa: F401,F403
+
+DEBUG = False
+ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ["BENCHMARK_DB"],
+        "CONN_MAX_AGE": DB_CONN_MAX_AGE,  # noqa: F405
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "init_command": SQLITE_INIT_COMMAND,  # noqa: F405
+            "transaction_mode": "IMMEDIATE",
+        },
+    }
+}
+
+# benchmarks.login measures the cached_db engine in this single process. Without
+# DJANGO_SESSION_CACHE_URL a local-memory cache stands in for the shared one,
+# which leaves the network round trip to Redis out of the figures.
+if "sessions" not in CACHES:  # noqa: F405
+    CACHES["sessions"] = {  # noqa: F405
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "sessions",
+    }
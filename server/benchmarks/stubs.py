@@ -0,0 +1,256 @@
+"""
+Local stand-ins for the Node backend and the sentiment service.
+
+Both stubs are stdlib ``ThreadingHTTPServer``s that answer the routes the
+Django app calls, with a configurable simulated latency, so benchmarks
+measure the Django side against upstreams of a known speed.
+
+- StubBackend replays database/data/dealerships.json and reviews.json with
+  the same routes, filters and cursor pagination as server/database/routes
+- StubSentiment answers the sentiment service routes with a fixed label
+  derived from the text length, without loading VADER
+
+Usage:
+    $ python -m benchmarks.stubs --backend-port 3030 --sentiment-port 5050 \\
+        --backend-latency 20 --sentiment-latency 5
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import random
+import threading
+import time
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DATA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "database", "data"
+)
+
+LABELS = ("positive", "negative", "neutral")
+
+
+def load_data(data_dir=DATA_DIR):
+    """
+    Load the dealerships and reviews the stub backend replays.
+
+    Returns:
+        tuple: (list of dealerships, list of reviews)
+    """
+    with open(os.path.join(data_dir, "dealerships.json")) as f:
+        dealerships = json.load(f)["dealerships"]
+    with open(os.path.join(data_dir, "reviews.json")) as f:
+        reviews = json.load(f)["reviews"]
+    return dealerships, reviews
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Base handler: simulated latency, JSON responses and quiet logs."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def simulate_latency(self):
+        latency, jitter = self.server.latency
+        delay = latency + random.uniform(-jitter, jitter)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return {}
+
+    def send_json(self, payload, status=200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client gave up (e.g. its timeout expired)
+
+    def do_GET(self):
+        self.simulate_latency()
+        parts = urlsplit(self.path)
+        self.handle_get(
+            [unquote(p) for p in parts.path.split("/") if p], parse_qs(parts.query)
+        )
+
+    def do_POST(self):
+        self.simulate_latency()
+        path = [unquote(p) for p in urlsplit(self.path).path.split("/") if p]
+        self.handle_post(path, self.read_json())
+
+
+def _page(items, query):
+    after = query.get("after")
+    if after:
+        items = [item for item in items if item["id"] > int(after[0])]
+    limit = query.get("limit")
+    if limit:
+        items = items[: int(limit[0])]
+    return items
+
+
+class BackendHandler(StubHandler):
+    """Routes of server/database/routes/dealerships.js and reviews.js."""
+
+    def handle_get(self, path, query):
+        data = self.server.data
+        if path == ["fetchDealers"]:
+            return self.send_json(data["dealerships"])
+        if len(path) == 3 and path[:2] == ["fetchDealers", "st"]:
+            st = path[2].upper()
+            return self.send_json([d for d in data["dealerships"] if d["st"] == st])
+        if len(path) == 2 and path[0] == "fetchDealers":
+            state = path[1].lower()
+            return self.send_json(
+                [d for d in data["dealerships"] if d["state"].lower() == state]
+            )
+        if len(path) == 2 and path[0] == "fetchDealer":
+            dealer = data["dealers_by_id"].get(int(path[1]))
+            return self.send_json(dealer)
+        if path == ["fetchReviews"]:
+            return self.send_json(data["reviews"])
+        if path == ["fetchReviews", "unscored"]:
+            with self.server.lock:
+                unscored = [r for r in data["reviews"] if "sentiment" not in r]
+            return self.send_json(_page(unscored, {"limit": ["100"], **query}))
+        if len(path) == 3 and path[:2] == ["fetchReviews", "dealer"]:
+            with self.server.lock:
+                reviews = list(data["reviews_by_dealer"].get(int(path[2]), []))
+            return self.send_json(_page(reviews, query))
+        self.send_json({"error": "Not found"}, status=404)
+
+    def handle_post(self, path, body):
+        data = self.server.data
+        if path == ["insert_review"]:
+            with self.server.lock:
+                review = dict(body, id=data["reviews"][-1]["id"] + 1)
+                data["reviews"].append(review)
+                dealer = review.get("dealership")
+                data["reviews_by_dealer"].setdefault(dealer, []).append(review)
+            return self.send_json(review)
+        if path == ["update_review_sentiments"]:
+            return self.send_json({"updated": len(body.get("reviews", []))})
+        self.send_json({"error": "Not found"}, status=404)
+
+
+def _scores(text):
+    label = LABELS[len(text) % len(LABELS)]
+    compound = {"positive": 0.5, "negative": -0.5, "neutral": 0.0}[label]
+    return {
+        "sentiment": label,
+        "compound": compound,
+        "pos": 0.5,
+        "neg": 0.0,
+        "neu": 0.5,
+    }
+
+
+class SentimentHandler(StubHandler):
+    """Routes of the sentiment service (djangoapp/microservices/app.py)."""
+
+    def handle_get(self, path, query):
+        if path == ["ready"]:
+            return self.send_json({"ready": True, "loaded": True})
+        if len(path) >= 2 and path[0] == "analyze":
+            text = "/".join(path[1:])
+            return self.send_json({"sentiment": _scores(text)["sentiment"]})
+        self.send_json({"error": "Not found"}, status=404)
+
+    def handle_post(self, path, body):
+        if path == ["analyze"]:
+            return self.send_json(_scores(body.get("text", "")))
+        if path == ["analyze", "batch"]:
+            scores = [_scores(text) for text in body.get("texts", [])]
+            return self.send_json(
+                {
+                    "sentiments": [s["sentiment"] for s in scores],
+                    "compounds": [s["compound"] for s in scores],
+                }
+            )
+        self.send_json({"error": "Not found"}, status=404)
+
+
+def _serve(handler, port, latency, jitter, data=None):
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    server.latency = (latency, jitter)
+    server.data = data
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def start_backend(port=0, latency=0.0, jitter=0.0, data_dir=DATA_DIR):
+    """
+    Start the stub Node backend in a background thread.
+
+    Args:
+        port (int): Port to listen on; 0 picks a free one
+        latency (float): Simulated latency per request, in milliseconds
+        jitter (float): Random +/- variation of the latency, in milliseconds
+
+    Returns:
+        ThreadingHTTPServer: The running server; ``server_address`` holds its port
+    """
+    dealerships, reviews = load_data(data_dir)
+    by_dealer = {}
+    for review in reviews:
+        by_dealer.setdefault(review["dealership"], []).append(review)
+    data = {
+        "dealerships": dealerships,
+        "dealers_by_id": {d["id"]: d for d in dealerships},
+        "reviews": reviews,
+        "reviews_by_dealer": by_dealer,
+    }
+    return _serve(BackendHandler, port, latency, jitter, data)
+
+
+def start_sentiment(port=0, latency=0.0, jitter=0.0):
+    """
+    Start the stub sentiment service in a background thread.
+
+    Args:
+        port (int): Port to listen on; 0 picks a free one
+        latency (float): Simulated latency per request, in milliseconds
+        jitter (float): Random +/- variation of the latency, in milliseconds
+
+    Returns:
+        ThreadingHTTPServer: The running server
+    """
+    return _serve(SentimentHandler, port, latency, jitter)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the upstream stubs")
+    parser.add_argument("--backend-port", type=int, default=3030)
+    parser.add_argument("--sentiment-port", type=int, default=5050)
+    parser.add_argument("--backend-latency", type=float, default=0.0, help="ms")
+    parser.add_argument("--sentiment-latency", type=float, default=0.0, help="ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="ms")
+    args = parser.parse_args()
+    start_backend(args.backend_port, args.backend_latency, args.jitter)
+    start_sentiment(args.sentiment_port, args.sentiment_latency, args.jitter)
+    print(
+        f"Backend stub on :{args.backend_port}, "
+        f"sentiment stub on :{args.sentiment_port} (Ctrl+C to stop)"
+    )
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ const express = require('express');
 const mongoose = require('mongoose');
 const fs = require('fs');
 const cors = require('cors');
+const crypto = require('crypto');
 const app = express();
 const port = 3030;
 
@@ -31,6 +32,34 @@ try {
   console.error(error);
 }
 
+// Join the caller's trace (W3C traceparent sent by the Django app) and log
+// one span per traced request as a JSON line, in the same format as the
+// Django and sentiment service span files.
+const TRACEPARENT = /^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$/;
+app.use((req, res, next) => {
+  const match = TRACEPARENT.exec((req.get('traceparent') || '').trim().toLowerCase());
+  if (!match) {
+    return next();
+  }
+  const start = Date.now() / 1000;
+  const started = process.hrtime.bigint();
+  res.set('X-Trace-Id', match[1]);
+  res.on('finish', () => {
+    console.log(JSON.stringify({
+      trace_id: match[1],
+      span_id: crypto.randomBytes(8).toString('hex'),
+      parent_id: match[2],
+      name: `${req.method} ${req.route ? req.route.path : req.path}`,
+      kind: 'server',
+      service: 'backend',
+      start: start,
+      duration_ms: Number(process.hrtime.bigint() - started) / 1e6,
+      attributes: { 'http.status_code': res.statusCode },
+    }));
+  });
+  next();
+});
+
 // Express route to home
 app.get('/', async (req, res) => {
   res.send("Welcome to the Mongoose API");
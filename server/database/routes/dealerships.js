@@ -14,12 +14,25 @@ router.get('/fetchDealers', async (req, res) => {
   }
 });
 
+// Express route to fetch Dealers by 2-letter state code (exact, indexed match)
+router.get('/fetchDealers/st/:st', async (req, res) => {
+  try {
+    const documents = await Dealerships.find({ st: req.params.st.toUpperCase() });
+    res.json(documents);
+  } catch (error) {
+    res.status(500).json({ error: 'Error fetching documents' });
+  }
+});
+
+// Escape regular expression metacharacters so user input matches literally
+const escapeRegExp = (value) => value.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
 // Express route to fetch Dealers by a particular state
 router.get('/fetchDealers/:state', async (req, res) => {
   try {
-    // Convert state parameter to lowercase for case-insensitive comparison
+    // Case-insensitive comparison; prefer /fetchDealers/st/:st, which can use an index
     const documents = await Dealerships.find({
-      state: { $regex: new RegExp(req.params.state, "i") }
+      state: { $regex: new RegExp(`^${escapeRegExp(req.params.state)}$`, "i") }
     });
     res.json(documents);
   } catch (error) {
@@ -14,10 +14,36 @@ router.get('/fetchReviews', async (req, res) => {
   }
 });
 
+// Express route to fetch reviews that have no stored sentiment yet
+// Cursor pagination: ?limit=<n>&after=<review id>, ordered by id
+router.get('/fetchReviews/unscored', async (req, res) => {
+  try {
+    const filter = { sentiment: { $exists: false } };
+    if (req.query.after !== undefined) {
+      filter.id = { $gt: Number(req.query.after) };
+    }
+    const documents = await Reviews.find(filter)
+      .sort({ id: 1 })
+      .limit(Number(req.query.limit || 100));
+    res.json(documents);
+  } catch (error) {
+    res.status(500).json({ error: 'Error fetching documents' });
+  }
+});
+
 // Express route to fetch reviews by a particular dealer
+// Optional cursor pagination: ?limit=<n>&after=<review id>, ordered by id
 router.get('/fetchReviews/dealer/:id', async (req, res) => {
   try {
-    const documents = await Reviews.find({ dealership: req.params.id });
+    const filter = { dealership: req.params.id };
+    if (req.query.after !== undefined) {
+      filter.id = { $gt: Number(req.query.after) };
+    }
+    let query = Reviews.find(filter).sort({ id: 1 });
+    if (req.query.limit !== undefined) {
+      query = query.limit(Number(req.query.limit));
+    }
+    const documents = await query;
     res.json(documents);
   } catch (error) {
     res.status(500).json({ error: 'Error fetching documents' });
@@ -40,6 +66,8 @@ router.post('/insert_review', async (req, res) => {
     "car_make": data.car_make,
     "car_model": data.car_model,
     "car_year": data.car_year,
+    "sentiment": data.sentiment,
+    "compound": data.compound,
   });
 
   try {
@@ -51,4 +79,23 @@ router.post('/insert_review', async (req, res) => {
   }
 });
 
+// Express route to store precomputed sentiment for existing reviews
+// Body: { "reviews": [{ "id": 1, "sentiment": "positive", "compound": 0.65 }, ...] }
+router.post('/update_review_sentiments', async (req, res) => {
+  const updates = (req.body.reviews || []).map((review) => ({
+    updateOne: {
+      filter: { id: review.id },
+      update: { $set: { sentiment: review.sentiment, compound: review.compound } },
+    },
+  }));
+
+  try {
+    const result = updates.length ? await Reviews.bulkWrite(updates) : { modifiedCount: 0 };
+    res.json({ updated: result.modifiedCount });
+  } catch (error) {
+    console.log(error);
+    res.status(500).json({ error: 'Error updating reviews' });
+  }
+});
+
 module.exports = router;
@@ -17,6 +17,10 @@ const dealerships = new Schema({
     type: String,
     required: true
   },
+  st: {
+    type: String,
+    required: true
+  },
   address: {
     type: String,
     required: true
@@ -42,4 +46,9 @@ const dealerships = new Schema({
   }
 });
 
+// Exact-match lookups by id and by state (full name or 2-letter code)
+dealerships.index({ id: 1 }, { unique: true });
+dealerships.index({ state: 1 });
+dealerships.index({ st: 1 });
+
 module.exports = mongoose.model('dealerships', dealerships);
@@ -41,6 +41,19 @@ const reviews = new Schema({
     type: Number,
     required: true
   },
+  // Computed once when the review is written (or by the backfill)
+  sentiment: {
+    type: String,
+    enum: ['positive', 'negative', 'neutral'],
+  },
+  compound: {
+    type: Number,
+  },
 });
 
+// Per-dealer listing and cursor pagination on id
+reviews.index({ dealership: 1, id: 1 });
+// Backfill scan of reviews without a stored sentiment
+reviews.index({ sentiment: 1, id: 1 });
+
 module.exports = mongoose.model('reviews', reviews);
@@ -0,0 +1,141 @@
+"""
+User Account Import
+
+Bulk creation of user accounts, e.g. to onboard dealer staff by the
+thousand (see the ``import_users`` management command).
+
+Rows are read with ``djangoapp.populate.read_rows`` (CSV, JSON Lines or
+JSON) and inserted in batches with ``bulk_create``. Passwords must already
+be hashed, so an import does not pay for one password hash per account and
+plain text passwords are never stored.
+"""
+
+from django.contrib.auth.hashers import identify_hasher
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from .populate import read_rows
+
+# Times a batch is retried when one of its usernames is registered meanwhile
+IMPORT_RETRIES = 3
+
+
+def _normalize_user_row(row):
+    """
+    Map a raw row to ``(username, password, email, first_name, last_name)``.
+
+    Accepts the registration payload field names (userName, firstName,
+    lastName) as well as the User field names. The password must already be
+    hashed (e.g. with ``make_password``) with one of the algorithms of
+    settings.PASSWORD_HASHERS; rows carrying anything else are rejected.
+
+    Returns:
+        tuple or None: The normalized row, or None if it cannot be loaded.
+    """
+    try:
+        username = str(row.get("username") or row.get("userName") or "").strip()
+        password = str(row["password"]).strip()
+        User.username_validator(username)
+        identify_hasher(password)
+    except (KeyError, TypeError, ValueError, ValidationError):
+        return None
+    if not username or len(username) > User._meta.get_field("username").max_length:
+        return None
+    return (
+        User.normalize_username(username),
+        password,
+        User.objects.normalize_email(str(row.get("email") or "").strip()),
+        str(row.get("first_name") or row.get("firstName") or "").strip(),
+        str(row.get("last_name") or row.get("lastName") or "").strip(),
+    )
+
+
+def _insert_new_users(batch):
+    """
+    Insert the users of ``batch`` whose username is not taken yet.
+
+    A username registered between the lookup and the INSERT makes the INSERT
+    fail, in which case it is rolled back to a savepoint and retried against
+    a fresh lookup, so the counts come from the usernames that already
+    existed rather than from what ``bulk_create`` reports.
+
+    Args:
+        batch (dict): Normalized rows keyed on their username.
+
+    Returns:
+        int: Number of users created.
+    """
+    for attempt in range(IMPORT_RETRIES):
+        existing = set(
+            User.objects.filter(username__in=batch).values_list("username", flat=True)
+        )
+        users = [
+            User(
+                username=username,
+                password=password,
+                email=email,
+                first_name=first_name,
+                last_name=last_name,
+            )
+            for username, password, email, first_name, last_name in batch.values()
+            if username not in existing
+        ]
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+        except IntegrityError:
+            if attempt == IMPORT_RETRIES - 1:
+                raise
+            continue
+        return len(users)
+
+
+def import_users(path, batch_size=1000):
+    """
+    Create the user accounts listed in a file, with pre-hashed passwords.
+
+    Rows are streamed from ``path`` and inserted in batches with
+    ``bulk_create``. Existing usernames are left untouched, so an import can
+    be rerun, and a username listed more than once is created from its first
+    row. The whole import runs in a single transaction. Rows without a valid
+    username or a recognized password hash are skipped.
+
+    Args:
+        path (str): CSV, JSON Lines or JSON file (a list of rows or a
+                    {"users": [...]} object) to load.
+        batch_size (int): Number of rows written per INSERT.
+
+    Returns:
+        dict: Number of rows read, users created, usernames that already
+              existed, repeated rows and rows skipped.
+    """
+    stats = {"read": 0, "created": 0, "existing": 0, "duplicates": 0, "skipped": 0}
+    # Usernames of the rows already batched, to drop the repeats of the file
+    seen = set()
+
+    def flush(batch):
+        created = _insert_new_users(batch)
+        stats["created"] += created
+        stats["existing"] += len(batch) - created
+
+    with transaction.atomic():
+        batch = {}
+        for raw in read_rows(path, key="users"):
+            stats["read"] += 1
+            row = _normalize_user_row(raw)
+            if row is None:
+                stats["skipped"] += 1
+                continue
+            if row[0] in seen:
+                stats["duplicates"] += 1
+                continue
+            seen.add(row[0])
+            batch[row[0]] = row
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = {}
+        if batch:
+            flush(batch)
+
+    return stats
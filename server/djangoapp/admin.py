@@ -2,13 +2,15 @@
 Admin Configuration for Car Dealership Application
 
 This module configures the admin interface for the car dealership application.
-It registers the CarMake and CarModel models with the admin site.
+It registers the CarMake, CarModel, Dealership and Task models with the admin site.
 """
 
 from django.contrib import admin
-from .models import CarMake, CarModel
+from .models import CarMake, CarModel, Dealership, Task
 
 
 # Register your models here.
 admin.site.register(CarMake)
 admin.site.register(CarModel)
+admin.site.register(Dealership)
+admin.site.register(Task)
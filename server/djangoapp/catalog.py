@@ -0,0 +1,186 @@
+"""
+Car Catalog Cache
+
+This module serves the car catalog returned by the ``get_cars`` view. The
+catalog is read with a single ``values_list`` query, serialized once and the
+resulting JSON bytes are kept in a shared Django cache together with their
+ETag. The entry is dropped by the ``post_save``/``post_delete`` signal
+receivers in ``djangoapp.signals`` whenever a CarMake or CarModel changes.
+
+Filtered requests are answered by ``get_catalog_page`` instead, which walks
+the catalog in index order with keyset (cursor) pagination so each page
+costs O(page) regardless of the catalog size.
+
+Configuration:
+- settings.CAR_CATALOG_CACHE: Django cache alias holding the catalog. It must
+  be shared by all workers so that invalidation reaches every one of them.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Q
+
+from .models import CarMake, CarModel
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CACHE_KEY = "car_catalog:v1"
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Order of both the full catalog and its pages: the column order of the
+# carmodel_*_page_idx indexes, so neither has to be sorted at query time.
+# It differs from CarModel.Meta.ordering (make name), which needs a join.
+CATALOG_ORDER = ("-year", "maker_id", "name", "id")
+
+
+def _cache():
+    return caches[getattr(settings, "CAR_CATALOG_CACHE", "default")]
+
+
+def build_catalog():
+    """
+    Serialize the car catalog.
+
+    Returns:
+        tuple[bytes, str]: The JSON body and its quoted ETag.
+    """
+    cars = [
+        {"CarModel": name, "CarMake": make}
+        for name, make in CarModel.objects.order_by(*CATALOG_ORDER).values_list(
+            "name", "maker__name"
+        )
+    ]
+    body = json.dumps({"CarModels": cars}).encode("utf-8")
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return body, etag
+
+
+def get_catalog():
+    """
+    Return the serialized car catalog, building and caching it on a miss.
+
+    Returns:
+        tuple[bytes, str]: The JSON body and its quoted ETag.
+    """
+    try:
+        cached = _cache().get(CATALOG_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Car catalog cache lookup failed: {str(e)}")
+        cached = None
+    if cached is not None:
+        return cached
+
+    catalog = build_catalog()
+    try:
+        _cache().set(CATALOG_CACHE_KEY, catalog, None)
+    except Exception as e:
+        logger.warning(f"Car catalog cache update failed: {str(e)}")
+    return catalog
+
+
+def invalidate_catalog():
+    """Drop the cached catalog so the next request rebuilds it."""
+    try:
+        _cache().delete(CATALOG_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Car catalog cache invalidation failed: {str(e)}")
+
+
+def encode_cursor(year, maker_id, name, pk):
+    """Return the opaque cursor pointing right after the given car model."""
+    raw = json.dumps([year, maker_id, name, pk]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        year, maker_id, name, pk = json.loads(base64.urlsafe_b64decode(cursor))
+        return int(year), int(maker_id), str(name), int(pk)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _page_rows(queryset, limit):
+    return list(
+        queryset.values_list("name", "maker__name", "year", "maker_id", "id")[:limit]
+    )
+
+
+def get_catalog_page(
+    make=None, type_car=None, year_min=None, year_max=None, after=None, limit=None
+):
+    """
+    Return one page of the filtered car catalog.
+
+    Rows are in ``CATALOG_ORDER``, the order of the full catalog: year
+    (newest first), make id, name and id. That is exactly the order of the
+    ``carmodel_catalog_page_idx`` index (and of ``carmodel_maker_page_idx``
+    and ``carmodel_type_page_idx`` within a make or a type), so a page is read
+    straight from an index without sorting the catalog. The page starts right
+    after the row encoded in ``after``: the rest of that row's year is read
+    first, then the earlier years, each with an index range scan, so a page
+    costs O(page) wherever it starts.
+
+    Args:
+        make (str or None): Only models of this make (case-insensitive).
+        type_car (str or None): Only models of this type (e.g. 'SUV').
+        year_min (int or None): Only models from this year on.
+        year_max (int or None): Only models up to this year.
+        after (str or None): Cursor returned as ``next`` by the previous page.
+        limit (int or None): Page size, capped at ``MAX_PAGE_SIZE``.
+
+    Returns:
+        tuple[list[dict], str or None]: The cars of the page and the cursor of
+        the next page, or None on the last page.
+
+    Raises:
+        ValueError: If ``after`` is not a valid cursor.
+    """
+    limit = min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    queryset = CarModel.objects.order_by(*CATALOG_ORDER)
+    if make:
+        # Resolved first so the page query filters on the indexed maker_id
+        maker_ids = list(
+            CarMake.objects.filter(name__iexact=make).values_list("id", flat=True)
+        )
+        queryset = queryset.filter(maker_id__in=maker_ids)
+    if type_car:
+        queryset = queryset.filter(type_car=type_car.upper())
+    if year_min is not None:
+        queryset = queryset.filter(year__gte=year_min)
+    if year_max is not None:
+        queryset = queryset.filter(year__lte=year_max)
+
+    if after:
+        year, maker_id, name, pk = decode_cursor(after)
+        # The redundant maker_id bound lets the scan start at the cursor
+        rows = _page_rows(
+            queryset.filter(year=year, maker_id__gte=maker_id).filter(
+                Q(maker_id__gt=maker_id) | Q(name__gt=name) | Q(name=name, id__gt=pk)
+            ),
+            limit + 1,
+        )
+        if len(rows) <= limit:
+            rows += _page_rows(queryset.filter(year__lt=year), limit + 1 - len(rows))
+    else:
+        rows = _page_rows(queryset, limit + 1)
+
+    cars = [{"CarModel": name, "CarMake": make} for name, make, *_ in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        name, _, year, maker_id, pk = rows[limit - 1]
+        next_cursor = encode_cursor(year, maker_id, name, pk)
+    return cars, next_cursor
@@ -0,0 +1,40 @@
+"""
+Password Hashers
+
+Argon2 hasher whose cost parameters come from settings.PASSWORD_HASHING
+instead of Django's defaults, so the price of a login can be tuned per
+deployment. settings.PASSWORD_HASHER picks which hasher hashes new passwords
+(see settings.PASSWORD_HASHERS); scrypt and PBKDF2 use Django's classes and
+parameters as they are.
+
+Existing hashes keep working: every hasher stays listed in
+settings.PASSWORD_HASHERS, and Django's ``check_password`` rehashes a
+password with the preferred hasher on the user's next successful login when
+it was stored with another algorithm or with different cost parameters.
+
+Configuration:
+- settings.PASSWORD_HASHING["ARGON2"]: TIME_COST, MEMORY_COST (KiB) and
+  PARALLELISM; requires the argon2-cffi package
+"""
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+def _options(name):
+    return getattr(settings, "PASSWORD_HASHING", {}).get(name, {})
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """
+    Argon2id hasher using the parameters of settings.PASSWORD_HASHING["ARGON2"].
+
+    Produces the same "argon2$..." encoding as Django's hasher, so hashes
+    made by either one verify with the other.
+    """
+
+    def __init__(self):
+        options = _options("ARGON2")
+        self.time_cost = options.get("TIME_COST", self.time_cost)
+        self.memory_cost = options.get("MEMORY_COST", self.memory_cost)
+        self.parallelism = options.get("PARALLELISM", self.parallelism)
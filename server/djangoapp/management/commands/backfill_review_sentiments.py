@@ -0,0 +1,67 @@
+"""
+Management command to store sentiment on reviews written without one.
+
+Reviews created before sentiment was computed at write time, or while the
+sentiment service was unavailable, are scored in batches and updated in the
+backend with their sentiment label and VADER compound score.
+
+Usage:
+    python manage.py backfill_review_sentiments
+    python manage.py backfill_review_sentiments --batch-size 500
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from djangoapp.restapis import get_request, post_review, score_review_sentiments
+
+
+class Command(BaseCommand):
+    help = "Score and store the sentiment of reviews that have none"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Reviews scored per sentiment request (default: 200)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive")
+
+        started = time.perf_counter()
+        scored = 0
+        after = 0
+        while True:
+            reviews = get_request(
+                "fetchReviews/unscored", limit=batch_size, after=after
+            )
+            if reviews is None:
+                raise CommandError("Failed to fetch unscored reviews")
+            if not reviews:
+                break
+
+            scores = score_review_sentiments([review["review"] for review in reviews])
+            if scores is None:
+                raise CommandError(f"Failed to score reviews after id {after}")
+
+            updates = [
+                {"id": review["id"], **score} for review, score in zip(reviews, scores)
+            ]
+            if post_review("update_review_sentiments", {"reviews": updates}) is None:
+                raise CommandError(f"Failed to store sentiment after id {after}")
+
+            scored += len(reviews)
+            after = reviews[-1]["id"]
+            self.stdout.write(f"Scored {scored} reviews (up to id {after})")
+            if len(reviews) < batch_size:
+                break
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"Backfilled {scored} reviews in {elapsed:.2f}s")
+        )
@@ -0,0 +1,59 @@
+"""
+Management command to bulk create user accounts from a file.
+
+Usage:
+    python manage.py import_users dealer_staff.csv
+    python manage.py import_users dealer_staff.jsonl --batch-size 5000
+
+Accepted formats: CSV (header row), JSON Lines, or a JSON document holding a
+list of rows or a {"users": [...]} object. Each row needs username (or
+userName) and password, and may have email, first_name (or firstName) and
+last_name (or lastName).
+
+Passwords must already be hashed, e.g. with
+``django.contrib.auth.hashers.make_password``, using one of the algorithms of
+settings.PASSWORD_HASHERS; rows with any other value are skipped. Usernames
+that already exist are left untouched, and a username repeated in the file is
+created from its first row.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from djangoapp.accounts import import_users
+
+
+class Command(BaseCommand):
+    help = "Create user accounts with pre-hashed passwords from a CSV or JSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Users file to load")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows written per INSERT (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive")
+
+        started = time.perf_counter()
+        try:
+            stats = import_users(options["path"], batch_size=options["batch_size"])
+        except OSError as e:
+            raise CommandError(f"Cannot read {options['path']}: {e}") from e
+        elapsed = time.perf_counter() - started
+
+        rate = stats["read"] / elapsed if elapsed else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {stats['created']} users "
+                f"({stats['existing']} already existed, {stats['duplicates']} "
+                f"repeated and {stats['skipped']} invalid rows skipped) "
+                f"from {stats['read']} rows in {elapsed:.2f}s "
+                f"({rate:.0f} rows/s)"
+            )
+        )
@@ -0,0 +1,37 @@
+"""
+Management command to invalidate the cached dealership responses.
+
+Usage:
+    # Drop every cached backend response
+    python manage.py invalidate_dealer_cache
+
+    # Drop specific endpoints only
+    python manage.py invalidate_dealer_cache fetchDealers fetchDealer/3
+"""
+
+from django.core.management.base import BaseCommand
+
+from djangoapp.restapis import response_cache
+
+
+class Command(BaseCommand):
+    help = "Invalidate cached dealership and dealer detail responses"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "endpoints",
+            nargs="*",
+            help="Backend endpoints to invalidate (e.g. 'fetchDealer/3'). "
+            "Invalidates every cached response when omitted.",
+        )
+
+    def handle(self, *args, **options):
+        endpoints = options["endpoints"]
+        if not endpoints:
+            response_cache.invalidate()
+            self.stdout.write(self.style.SUCCESS("Invalidated all cached responses"))
+            return
+
+        for endpoint in endpoints:
+            response_cache.invalidate(endpoint)
+            self.stdout.write(self.style.SUCCESS(f"Invalidated {endpoint}"))
@@ -0,0 +1,51 @@
+"""
+Management command to bulk load car makes and models from a catalog file.
+
+Usage:
+    python manage.py load_catalog database/data/car_records.json
+    python manage.py load_catalog feed.csv --batch-size 5000
+
+Accepted formats: CSV (header row), JSON Lines, or a JSON document holding a
+list of rows or a {"cars": [...]} object. Each row needs make, model (or
+name), bodyType (or type_car) and year. Every format is streamed row by row,
+so the file size is not limited by memory.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from djangoapp.populate import load_catalog
+
+
+class Command(BaseCommand):
+    help = "Upsert car makes and models from a CSV, JSON Lines or JSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Catalog file to load")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows written per INSERT (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive")
+
+        started = time.perf_counter()
+        try:
+            stats = load_catalog(options["path"], batch_size=options["batch_size"])
+        except OSError as e:
+            raise CommandError(f"Cannot read {options['path']}: {e}") from e
+        elapsed = time.perf_counter() - started
+
+        rate = stats["read"] / elapsed if elapsed else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Loaded {stats['loaded']} car models "
+                f"({stats['makes_created']} new makes, {stats['skipped']} rows skipped) "
+                f"from {stats['read']} rows in {elapsed:.2f}s ({rate:.0f} rows/s)"
+            )
+        )
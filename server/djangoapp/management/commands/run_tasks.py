@@ -0,0 +1,130 @@
+"""
+Management command running background task workers.
+
+Usage:
+    # Run 4 worker threads until interrupted
+    python manage.py run_tasks --concurrency 4
+
+    # Drain the due tasks and exit
+    python manage.py run_tasks --burst
+
+    # Put dead-lettered tasks back in the queue
+    python manage.py run_tasks --requeue-dead --burst
+
+    # Delete old finished tasks, e.g. from a daily cron job
+    python manage.py run_tasks --purge --burst
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from djangoapp.models import Task
+from djangoapp.tasks import claim_next, purge_tasks, run_task
+
+
+class Command(BaseCommand):
+    help = "Run workers for the background task queue"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of tasks run at the same time (default: 1)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when no task is due (default: 1)",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no task is due instead of polling",
+        )
+        parser.add_argument(
+            "--requeue-dead",
+            action="store_true",
+            help="Move dead-lettered tasks back to the queue before starting",
+        )
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help=(
+                "Delete done and dead-lettered tasks older than "
+                'settings.TASK_QUEUE["RETENTION"] before starting'
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be positive")
+
+        if options["requeue_dead"]:
+            requeued = Task.objects.filter(status="DEAD").update(
+                status="QUEUED", attempts=0, run_at=timezone.now()
+            )
+            self.stdout.write(f"Requeued {requeued} dead tasks")
+
+        if options["purge"]:
+            self.stdout.write(f"Purged {purge_tasks()} finished tasks")
+
+        counts = self.run_workers(
+            options["concurrency"], options["poll_interval"], options["burst"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Tasks done: {counts['DONE']}, retried: {counts['QUEUED']}, "
+                f"dead-lettered: {counts['DEAD']}"
+            )
+        )
+
+    def run_workers(self, concurrency, poll_interval, burst):
+        """
+        Run ``concurrency`` worker threads until interrupted (or, in burst
+        mode, until no task is due).
+
+        Returns:
+            dict: Number of tasks per resulting status
+        """
+        self.stop = threading.Event()
+        self.counts = {"DONE": 0, "QUEUED": 0, "DEAD": 0}
+        self.counts_lock = threading.Lock()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(self.worker, poll_interval, burst)
+                for _ in range(concurrency)
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except KeyboardInterrupt:
+                self.stop.set()
+        return self.counts
+
+    def worker(self, poll_interval, burst):
+        """Claim and run due tasks, waiting ``poll_interval`` when none is."""
+        try:
+            while not self.stop.is_set():
+                close_old_connections()
+                claimed = claim_next()
+                if claimed is not None:
+                    self.run_claimed(claimed)
+                elif burst:
+                    return
+                else:
+                    self.stop.wait(poll_interval)
+        finally:
+            connection.close()
+
+    def run_claimed(self, claimed):
+        """Run one claimed task and count its outcome."""
+        status = run_task(claimed)
+        with self.counts_lock:
+            self.counts[status] += 1
@@ -0,0 +1,39 @@
+"""
+Management command to mirror the backend dealerships into the local database.
+
+Usage:
+    python manage.py sync_dealerships
+    python manage.py sync_dealerships --prune
+
+Run it periodically (e.g. from cron or a Kubernetes CronJob) more often than
+settings.DEALERSHIP_MIRROR["MAX_STALENESS"], so dealer reads keep being
+served from the mirror.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from djangoapp.mirror import sync_dealerships
+
+
+class Command(BaseCommand):
+    help = "Mirror /fetchDealers from the backend into the Dealership table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete local dealerships the backend no longer lists",
+        )
+
+    def handle(self, *args, **options):
+        stats = sync_dealerships(prune=options["prune"])
+        if stats is None:
+            raise CommandError("Failed to fetch dealerships from the backend")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synced {stats['fetched']} dealerships: {stats['created']} created, "
+                f"{stats['updated']} updated, {stats['unchanged']} unchanged, "
+                f"{stats['deleted']} deleted"
+            )
+        )
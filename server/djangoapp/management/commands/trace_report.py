@@ -0,0 +1,107 @@
+"""
+Management command to find the slowest hop of the slowest traced requests.
+
+Reads the JSON lines span files written by djangoapp.tracing (and, when
+pointed at them too, by the sentiment service and the Node backend), groups
+the spans by trace and prints, for the slowest requests, the hop that took
+the longest.
+
+Usage:
+    python manage.py trace_report
+    python manage.py trace_report /var/log/traces.jsonl sentiment-traces.jsonl
+    python manage.py trace_report --limit 20
+"""
+
+from collections import defaultdict
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+SPAN_FIELDS = ("trace_id", "span_id", "name")
+
+
+def _is_span(span):
+    """
+    Return True when ``span`` has the fields the report reads: string ids and
+    name, and a numeric duration.
+    """
+    if not isinstance(span, dict):
+        return False
+    duration = span.get("duration_ms")
+    return all(isinstance(span.get(field), str) for field in SPAN_FIELDS) and (
+        isinstance(duration, (int, float)) and not isinstance(duration, bool)
+    )
+
+
+class Command(BaseCommand):
+    help = "List the slowest traced requests and the slowest hop of each"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help="Span files to read (default: settings.TRACING['EXPORT_PATH'])",
+        )
+        parser.add_argument("--limit", type=int, default=10)
+
+    def handle(self, *args, **options):
+        paths = options["paths"] or [
+            getattr(settings, "TRACING", {}).get("EXPORT_PATH")
+        ]
+        if not any(paths):
+            raise CommandError("No span file given and TRACING['EXPORT_PATH'] unset")
+
+        traces, malformed = self.read_spans(paths)
+
+        rows = []
+        for trace_id, spans in traces.items():
+            ids = {span["span_id"] for span in spans}
+            roots = [s for s in spans if s.get("parent_id") not in ids] or spans
+            root = max(roots, key=lambda s: s["duration_ms"])
+            hops = [s for s in spans if s is not root] or [root]
+            slowest = max(hops, key=lambda s: s["duration_ms"])
+            rows.append((root, slowest, len(spans)))
+        rows.sort(key=lambda row: row[0]["duration_ms"], reverse=True)
+
+        for root, slowest, count in rows[: options["limit"]]:
+            self.stdout.write(
+                f"{root['trace_id']}  {root['duration_ms']:>9.1f} ms  {root['name']}"
+                f"  ({count} spans)  slowest hop: "
+                f"{slowest.get('service', '?')} {slowest['name']}"
+                f" {slowest['duration_ms']:.1f} ms"
+            )
+        if malformed:
+            self.stderr.write(f"Skipped {malformed} malformed spans")
+
+    def read_spans(self, paths):
+        """
+        Group the spans of the given files by trace.
+
+        Lines that are not JSON objects with a trace_id are skipped silently,
+        as span files may be mixed with other log output. Spans missing a
+        field the report reads (see ``_is_span``) are skipped too, and
+        counted.
+
+        Returns:
+            tuple: (dict of trace id to spans, number of malformed spans)
+        """
+        traces = defaultdict(list)
+        malformed = 0
+        for path in paths:
+            try:
+                with open(path) as f:
+                    for line in f:
+                        try:
+                            span = json.loads(line)
+                        except ValueError:
+                            continue
+                        if not isinstance(span, dict) or "trace_id" not in span:
+                            continue
+                        if _is_span(span):
+                            traces[span["trace_id"]].append(span)
+                        else:
+                            malformed += 1
+            except OSError as e:
+                raise CommandError(f"Failed to read {path}: {str(e)}")
+        return traces, malformed
@@ -0,0 +1,253 @@
+"""
+Request Latency Metrics
+
+This module records where request time goes: in Django views or in the
+upstream services they call (the Node backend and the sentiment analyzer).
+Metrics live in the worker process and are rendered in the Prometheus text
+format by the ``metrics`` view.
+
+Key Features:
+1. Views (metrics_middleware):
+   - djangoapp_http_request_duration_seconds: histogram per view, method and
+     status code
+2. Upstream calls (hooked into the restapis HTTP sessions and async clients):
+   - djangoapp_upstream_request_duration_seconds: histogram per upstream,
+     method, endpoint and outcome (status class, or "error" when the call
+     raised)
+   - Numeric path segments are replaced by ":id" and query strings dropped,
+     so every dealer or review id shares one series
+3. Scrape-time collectors (register_collector):
+   - djangoapp_upstream_circuit_state: 0 closed, 1 half-open, 2 open, per
+     upstream (registered by restapis)
+4. Error rates:
+   - Derived from the status/outcome labels, e.g.
+     rate(djangoapp_upstream_request_duration_seconds_count{outcome="error"}[5m])
+
+Configuration:
+- settings.METRICS["ENABLED"]: When False the middleware is not installed,
+  upstream calls are not recorded and /metrics answers 404
+- settings.METRICS["BUCKETS"]: Histogram bucket upper bounds, in seconds
+
+Each gunicorn/uvicorn worker keeps its own counters; scrape every worker (or
+aggregate them) to get totals. Recording an observation is a bisect and a few
+dict updates under a lock.
+"""
+
+from bisect import bisect_left
+import re
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.decorators import sync_and_async_middleware
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_NUMERIC_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def _options():
+    options = {"ENABLED": True, "BUCKETS": DEFAULT_BUCKETS}
+    options.update(getattr(settings, "METRICS", {}))
+    return options
+
+
+def enabled():
+    """Returns True when metrics collection is enabled in the settings."""
+    return bool(_options()["ENABLED"])
+
+
+class Histogram:
+    """
+    Thread-safe latency histogram with one series per label combination.
+
+    Args:
+        name (str): Metric name
+        help_text (str): Description rendered as the HELP line
+        labels (tuple[str]): Label names, in the order values are passed
+        buckets (tuple[float]): Bucket upper bounds, in seconds
+    """
+
+    def __init__(self, name, help_text, labels, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, values, seconds):
+        """
+        Records one observation.
+
+        Args:
+            values (tuple[str]): Label values, in the order of ``labels``
+            seconds (float): Observed duration
+        """
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(values)
+            if series is None:
+                series = self._series[values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += seconds
+
+    def clear(self):
+        """Drops every series."""
+        with self._lock:
+            self._series.clear()
+
+    def render(self):
+        """
+        Renders the histogram in the Prometheus text exposition format.
+
+        Returns:
+            list[str]: Lines of the exposition, without trailing newlines
+        """
+        with self._lock:
+            snapshot = [(k, list(v[0]), v[1]) for k, v in self._series.items()]
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for values, counts, total in sorted(snapshot):
+            labels = ",".join(
+                f'{name}="{_escape(value)}"' for name, value in zip(self.labels, values)
+            )
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(
+                    f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            cumulative += counts[-1]
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {total}")
+            lines.append(f"{self.name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+request_duration = Histogram(
+    "djangoapp_http_request_duration_seconds",
+    "Time spent handling a request, by view.",
+    ("view", "method", "status"),
+    _options()["BUCKETS"],
+)
+
+upstream_duration = Histogram(
+    "djangoapp_upstream_request_duration_seconds",
+    "Time spent on calls to upstream services, by endpoint.",
+    ("upstream", "method", "endpoint", "outcome"),
+    _options()["BUCKETS"],
+)
+
+
+def normalize_endpoint(path):
+    """
+    Returns a low-cardinality label for an upstream URL path.
+
+    Args:
+        path (str): URL path, optionally with a query string
+
+    Returns:
+        str: The path without its query string, with numeric segments
+             replaced by ":id"
+
+    Example:
+        >>> normalize_endpoint("/fetchReviews/dealer/15?limit=50")
+        '/fetchReviews/dealer/:id'
+    """
+    return _NUMERIC_SEGMENT.sub(":id", path.split("?", 1)[0]) or "/"
+
+
+def observe_upstream(upstream, method, path, started, status=None):
+    """
+    Records the duration of one upstream call.
+
+    Args:
+        upstream (str): Name of the upstream service ("backend", "sentiment")
+        method (str): HTTP method
+        path (str): Requested URL path
+        started (float): ``time.perf_counter()`` value taken before the call
+        status (int or None): Response status code, or None if the call raised
+    """
+    if not enabled():
+        return
+    outcome = f"{status // 100}xx" if status else "error"
+    upstream_duration.observe(
+        (upstream, method, normalize_endpoint(path), outcome),
+        time.perf_counter() - started,
+    )
+
+
+def _view_name(request):
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match is not None else "unmatched"
+
+
+@sync_and_async_middleware
+def metrics_middleware(get_response):
+    """
+    Middleware recording the latency of every request by view.
+
+    Works with both sync and async views. For streaming responses the
+    recorded time is the time until the response starts.
+    """
+    if not enabled():
+        raise MiddlewareNotUsed
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            started = time.perf_counter()
+            response = await get_response(request)
+            request_duration.observe(
+                (_view_name(request), request.method, str(response.status_code)),
+                time.perf_counter() - started,
+            )
+            return response
+
+        return middleware
+
+    def middleware(request):
+        started = time.perf_counter()
+        response = get_response(request)
+        request_duration.observe(
+            (_view_name(request), request.method, str(response.status_code)),
+            time.perf_counter() - started,
+        )
+        return response
+
+    return middleware
+
+
+_collectors = []
+
+
+def register_collector(collector):
+    """
+    Adds metrics computed at scrape time to the exposition.
+
+    Args:
+        collector (callable): Returns a list of exposition lines
+    """
+    _collectors.append(collector)
+
+
+def render():
+    """
+    Renders every metric in the Prometheus text exposition format.
+
+    Returns:
+        str: The exposition, ending with a newline
+    """
+    lines = request_duration.render() + upstream_duration.render()
+    for collector in _collectors:
+        lines.extend(collector())
+    return "\n".join(lines) + "\n"
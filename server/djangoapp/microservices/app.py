@@ -13,11 +13,39 @@ Key Features:
 
 2. API Endpoints:
    - /: Returns service welcome message
-   - /analyze/<input_txt>: Analyzes sentiment of provided text
+   - /analyze (POST): Analyzes the text of a JSON body and returns the label
+     with the compound, pos, neg and neu scores
+   - /analyze/<input_txt>: Analyzes sentiment of text embedded in the path
+     (kept for compatibility; prefer POST /analyze)
+   - /analyze/batch (POST): Analyzes a list of texts in one call with the
+     vectorized batch scorer (vader_batch.py)
+   - /ready: Readiness probe, 200 once the VADER model is loaded and warmed up
+     (immediately in lazy-load mode)
+   - /stats: Hit ratio and evictions of the score cache of this worker
+
+3. Score Cache:
+   - Bounded LRU of scores keyed on whitespace-normalized text (score_cache.py)
+   - Repeated texts are answered without running VADER
 
 Configuration:
-- Runs on Flask development server
-- Debug mode enabled for development
+- Production: gunicorn with gunicorn.conf.py, which preloads the VADER model
+  in the master so forked workers share it copy-on-write
+- Development: Flask development server (debug mode with FLASK_DEBUG=1)
+- Logs one JSON object per line; level set with LOG_LEVEL (default INFO)
+- SENTIMENT_LEXICON_SNAPSHOT: Pickled lexicon built at image build time by
+  lexicon.py (default vader_lexicon.pickle next to this file); without it
+  the lexicon is parsed from the NLTK data path
+- SENTIMENT_LAZY_LOAD=1: Load the model on the first scoring request instead
+  of at import (each gunicorn worker then loads its own copy)
+- SENTIMENT_LRU_SIZE: Texts kept in the score cache (default 10000, 0 disables)
+- SENTIMENT_LRU_MAX_TEXT: Longest text cached, in characters (default 2048)
+- SENTIMENT_TRACE_FILE: JSON lines file request spans are appended to
+
+Tracing:
+- A W3C ``traceparent`` header sent by the caller (the Django app) is
+  honored: the request joins that trace, its log lines carry the trace_id
+  and span_id, and its span names the caller's span as parent
+- The trace id is returned in the ``X-Trace-Id`` response header
 - Uses NLTK's pre-trained sentiment analyzer
 
 Error Handling:
@@ -26,17 +54,193 @@ Error Handling:
 - Implements proper HTTP status codes
 
 Example Usage:
+    $ curl -X POST -H "Content-Type: application/json" \
+        -d '{"text": "Great service!"}' http://localhost:5050/analyze
+    {"sentiment": "positive", "compound": 0.6588, "pos": 0.815, "neg": 0.0, "neu": 0.185}
+
     $ curl http://localhost:5050/analyze/Great%20service!
     {"sentiment": "positive"}
+
+    $ curl -X POST -H "Content-Type: application/json" \
+        -d '{"texts": ["Great service!", "Poor experience"]}' \
+        http://localhost:5050/analyze/batch
+    {"sentiments": ["positive", "negative"], "compounds": [0.6588, -0.4767]}
 """
 
-from flask import Flask
-from nltk.sentiment import SentimentIntensityAnalyzer
 import json
+import logging
+import os
+import re
+import threading
+import time
+
+from flask import Flask, g, has_request_context, request
+
+from lexicon import SnapshotAnalyzer, load_analyzer
+from score_cache import ScoreCache
+from vader_batch import BatchScorer
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects."""
+
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if has_request_context() and "trace_id" in g:
+            entry["trace_id"] = g.trace_id
+            entry["span_id"] = g.span_id
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+handler = logging.StreamHandler()
+handler.setFormatter(JsonFormatter())
+logger = logging.getLogger("sentiment")
+logger.addHandler(handler)
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+logger.propagate = False
 
 app = Flask("Sentiment Analyzer")
 
-sia = SentimentIntensityAnalyzer()
+LEXICON_SNAPSHOT = os.getenv(
+    "SENTIMENT_LEXICON_SNAPSHOT",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "vader_lexicon.pickle"),
+)
+LAZY_LOAD = os.getenv("SENTIMENT_LAZY_LOAD") == "1"
+
+score_cache = ScoreCache(
+    max_entries=int(os.getenv("SENTIMENT_LRU_SIZE", "10000")),
+    max_text_length=int(os.getenv("SENTIMENT_LRU_MAX_TEXT", "2048")),
+)
+
+sia = None
+batch_scorer = None
+model_lock = threading.Lock()
+
+
+def load_model():
+    """
+    Load and warm up the VADER model once, returning the batch scorer.
+
+    The lexicon comes from the precompiled snapshot when available. Safe to
+    call from several threads; only the first call does the work.
+    """
+    global sia, batch_scorer
+    if batch_scorer is not None:
+        return batch_scorer
+    with model_lock:
+        if batch_scorer is None:
+            started = time.perf_counter()
+            analyzer = load_analyzer(LEXICON_SNAPSHOT)
+            # Score once so every lazily built structure exists before workers fork
+            analyzer.polarity_scores("Warm up the sentiment analyzer")
+            scorer = BatchScorer(analyzer)
+            scorer.polarity_scores_batch(["Warm up the batch scorer"])
+            sia = analyzer
+            batch_scorer = scorer
+            logger.info(
+                "Sentiment analyzer ready",
+                extra={
+                    "fields": {
+                        "load_ms": round((time.perf_counter() - started) * 1000, 1),
+                        "snapshot": isinstance(analyzer, SnapshotAnalyzer),
+                    }
+                },
+            )
+    return batch_scorer
+
+
+if not LAZY_LOAD:
+    load_model()
+
+
+TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+TRACE_FILE = os.getenv("SENTIMENT_TRACE_FILE", "")
+trace_lock = threading.Lock()
+
+
+@app.before_request
+def start_span():
+    """Time the request and join the caller's trace when it sent a traceparent."""
+    g.started = time.perf_counter()
+    g.start = time.time()
+    match = TRACEPARENT.match(request.headers.get("traceparent", "").strip().lower())
+    if match:
+        g.trace_id, g.parent_id = match.group(1), match.group(2)
+    else:
+        g.trace_id, g.parent_id = os.urandom(16).hex(), None
+    g.span_id = os.urandom(8).hex()
+
+
+def export_span(span):
+    """Append a finished span to SENTIMENT_TRACE_FILE as a JSON line."""
+    try:
+        with trace_lock, open(TRACE_FILE, "a") as f:
+            f.write(json.dumps(span) + "\n")
+    except OSError as e:
+        logger.warning(f"Failed to export span: {str(e)}")
+
+
+@app.after_request
+def log_request(response):
+    duration_ms = round((time.perf_counter() - g.started) * 1000, 2)
+    response.headers["X-Trace-Id"] = g.trace_id
+    # Requests that are part of a caller's trace are always logged
+    logger.log(
+        logging.INFO if g.parent_id else logging.DEBUG,
+        "request",
+        extra={
+            "fields": {
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "duration_ms": duration_ms,
+                "parent_id": g.parent_id,
+            }
+        },
+    )
+    if TRACE_FILE:
+        export_span(
+            {
+                "trace_id": g.trace_id,
+                "span_id": g.span_id,
+                "parent_id": g.parent_id,
+                "name": f"{request.method} {request.url_rule or request.path}",
+                "kind": "server",
+                "service": "sentiment",
+                "start": g.start,
+                "duration_ms": duration_ms,
+                "attributes": {"http.status_code": response.status_code},
+            }
+        )
+    return response
+
+
+@app.get("/ready")
+def readiness():
+    """
+    Readiness probe: 200 once the model is loaded and warmed up.
+
+    In lazy-load mode the service is ready as soon as it starts; "loaded"
+    tells whether the first scoring request has loaded the model yet.
+    """
+    loaded = batch_scorer is not None
+    if not loaded and not LAZY_LOAD:
+        return json.dumps({"ready": False, "loaded": False}), 503
+    return json.dumps({"ready": True, "loaded": loaded})
+
+
+@app.get("/stats")
+def stats():
+    """Return the score cache counters of the worker serving the request."""
+    return json.dumps({"cache": score_cache.stats()})
 
 
 @app.get("/")
@@ -45,24 +249,106 @@ def home():
     Use /analyze/text to get the sentiment"
 
 
-@app.get("/analyze/<input_txt>")
-def analyze_sentiment(input_txt):
+def classify(scores):
+    """
+    Map VADER polarity scores to a sentiment label.
+
+    Args:
+        scores (dict): Output of ``SentimentIntensityAnalyzer.polarity_scores``
 
-    scores = sia.polarity_scores(input_txt)
-    print(scores)
+    Returns:
+        str: 'positive', 'negative' or 'neutral'
+    """
     pos = float(scores["pos"])
     neg = float(scores["neg"])
     neu = float(scores["neu"])
     res = "positive"
-    print("pos neg nue ", pos, neg, neu)
     if neg > pos and neg > neu:
         res = "negative"
     elif neu > neg and neu > pos:
         res = "neutral"
-    res = json.dumps({"sentiment": res})
-    print(res)
     return res
 
 
+def score_texts(texts):
+    """
+    Score texts, answering repeated ones from the score cache.
+
+    Only the distinct texts missing from the cache are run through the batch
+    scorer, and their scores are added to the cache.
+
+    Args:
+        texts (list): Texts to score
+
+    Returns:
+        list: One ``polarity_scores`` dict per text, in the same order
+    """
+    found = score_cache.get_many(texts)
+    missing = [text for text in dict.fromkeys(texts) if text not in found]
+    if missing:
+        scored = dict(zip(missing, load_model().polarity_scores_batch(missing)))
+        score_cache.set_many(scored)
+        found.update(scored)
+    return [found[text] for text in texts]
+
+
+@app.post("/analyze")
+def analyze_sentiment_json():
+    """
+    Analyze the text of a JSON body.
+
+    Expects ``{"text": "..."}``. Unlike the GET route, the text may be of any
+    length and contain ``/``, ``?`` or ``#``. Returns the label together with
+    the VADER scores: ``{"sentiment", "compound", "pos", "neg", "neu"}``.
+    """
+    payload = request.get_json(silent=True) or {}
+    text = payload.get("text")
+    if not isinstance(text, str):
+        return json.dumps({"error": "Expected a JSON body with a text"}), 400
+    scores = score_texts([text])[0]
+    return json.dumps(
+        {
+            "sentiment": classify(scores),
+            "compound": scores["compound"],
+            "pos": scores["pos"],
+            "neg": scores["neg"],
+            "neu": scores["neu"],
+        }
+    )
+
+
+@app.get("/analyze/<input_txt>")
+def analyze_sentiment(input_txt):
+
+    scores = score_texts([input_txt])[0]
+    res = classify(scores)
+    logger.debug("scored", extra={"fields": {"scores": scores, "sentiment": res}})
+    return json.dumps({"sentiment": res})
+
+
+@app.post("/analyze/batch")
+def analyze_sentiment_batch():
+    """
+    Analyze a list of texts in a single request.
+
+    Expects a JSON body of the form ``{"texts": ["...", "..."]}`` and returns
+    ``{"sentiments": [...], "compounds": [...]}`` with one label and one VADER
+    compound score per text, in the same order. Cached texts are answered from
+    the score cache; the rest are scored together by the vectorized
+    ``BatchScorer``, which matches ``polarity_scores`` exactly.
+    """
+    payload = request.get_json(silent=True) or {}
+    texts = payload.get("texts")
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        return json.dumps({"error": "Expected a JSON body with a list of texts"}), 400
+    scores = score_texts(texts)
+    return json.dumps(
+        {
+            "sentiments": [classify(score) for score in scores],
+            "compounds": [score["compound"] for score in scores],
+        }
+    )
+
+
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run(debug=os.getenv("FLASK_DEBUG") == "1")
@@ -0,0 +1,82 @@
+"""
+Benchmark the vectorized batch scorer against per-call VADER scoring.
+
+Scores the same corpus with ``SentimentIntensityAnalyzer.polarity_scores``
+(one call per text) and with ``BatchScorer.polarity_scores_batch``, checks
+that both produce identical scores and reports docs/sec for each.
+
+The corpus is built from the review texts in server/database/data/reviews.json,
+repeated until it reaches the requested size.
+
+Usage:
+    python benchmark_vader.py [--docs 20000] [--batch-size 1000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import time
+
+from nltk.sentiment import SentimentIntensityAnalyzer
+
+from vader_batch import BatchScorer
+
+REVIEWS_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "database",
+    "data",
+    "reviews.json",
+)
+
+
+def load_corpus(docs):
+    with open(REVIEWS_FILE) as f:
+        texts = [review["review"] for review in json.load(f)["reviews"]]
+    return [texts[i % len(texts)] for i in range(docs)]
+
+
+def best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.docs)
+    sia = SentimentIntensityAnalyzer()
+    scorer = BatchScorer(sia)
+
+    per_call, expected = best_of(
+        args.repeat, lambda: [sia.polarity_scores(text) for text in corpus]
+    )
+    batched, actual = best_of(
+        args.repeat,
+        lambda: [
+            score
+            for i in range(0, len(corpus), args.batch_size)
+            for score in scorer.polarity_scores_batch(corpus[i:i + args.batch_size])
+        ],
+    )
+    if actual != expected:
+        raise SystemExit("Batch scores differ from polarity_scores")
+
+    print(f"docs: {len(corpus)}, batch size: {args.batch_size}")
+    print(f"per-call: {len(corpus) / per_call:,.0f} docs/sec")
+    print(f"batched:  {len(corpus) / batched:,.0f} docs/sec")
+    print(f"speedup:  {per_call / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
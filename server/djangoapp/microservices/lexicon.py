@@ -0,0 +1,133 @@
+"""
+Precompiled VADER lexicon snapshot for the sentiment analysis microservice.
+
+``SentimentIntensityAnalyzer()`` locates ``vader_lexicon.zip`` through the
+NLTK data path, reads it and parses ~7,500 tab-separated lines into a dict
+every time a process starts. This module does that parse once, at image build
+time, and pickles the resulting dict. At startup the service unpickles the
+snapshot instead, so neither the NLTK data lookup nor the text parse happens.
+
+The snapshot records the SHA-256 of the zip it was built from so it can be
+traced back to its source. It is a build artifact of this image and is only
+ever loaded from the image itself.
+
+Usage:
+    # At image build time
+    $ python lexicon.py sentiment/vader_lexicon.zip vader_lexicon.pickle
+
+    # At startup
+    analyzer = load_analyzer("vader_lexicon.pickle")
+"""
+
+import argparse
+import hashlib
+import logging
+import pickle
+import zipfile
+
+from nltk.sentiment import SentimentIntensityAnalyzer
+from nltk.sentiment.vader import VaderConstants
+
+logger = logging.getLogger("sentiment")
+
+LEXICON_MEMBER = "vader_lexicon/vader_lexicon.txt"
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotAnalyzer(SentimentIntensityAnalyzer):
+    """
+    SentimentIntensityAnalyzer built from an already parsed lexicon.
+
+    Args:
+        lexicon (dict): Mapping of token to valence
+    """
+
+    def __init__(self, lexicon):
+        self.lexicon_file = None
+        self.lexicon = lexicon
+        self.constants = VaderConstants()
+
+
+def parse_lexicon(zip_path):
+    """
+    Parse the VADER lexicon out of ``vader_lexicon.zip``.
+
+    Mirrors ``SentimentIntensityAnalyzer.make_lex_dict``: the first two
+    tab-separated fields of each line are the token and its mean valence.
+
+    Args:
+        zip_path (str): Path of vader_lexicon.zip
+
+    Returns:
+        dict: Mapping of token to valence
+    """
+    with zipfile.ZipFile(zip_path) as archive:
+        text = archive.read(LEXICON_MEMBER).decode("utf-8")
+    lexicon = {}
+    for line in text.rstrip("\n").split("\n"):
+        word, measure = line.strip().split("\t")[0:2]
+        lexicon[word] = float(measure)
+    return lexicon
+
+
+def build_snapshot(zip_path, snapshot_path):
+    """
+    Parse the lexicon zip and write its pickled snapshot.
+
+    Args:
+        zip_path (str): Path of vader_lexicon.zip
+        snapshot_path (str): Path of the snapshot to write
+
+    Returns:
+        int: Number of tokens in the snapshot
+    """
+    with open(zip_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    lexicon = parse_lexicon(zip_path)
+    with open(snapshot_path, "wb") as f:
+        pickle.dump(
+            {"version": SNAPSHOT_VERSION, "source_sha256": digest, "lexicon": lexicon},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    return len(lexicon)
+
+
+def load_analyzer(snapshot_path=None):
+    """
+    Return a SentimentIntensityAnalyzer, from the snapshot when possible.
+
+    Falls back to the regular NLTK loader when no snapshot path is given or
+    the snapshot is missing, and logs a warning when it is unreadable.
+
+    Args:
+        snapshot_path (str or None): Path of the pickled lexicon snapshot
+
+    Returns:
+        SentimentIntensityAnalyzer: Analyzer ready to score texts
+    """
+    if snapshot_path:
+        try:
+            with open(snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+            if snapshot.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported version {snapshot.get('version')}")
+            return SnapshotAnalyzer(snapshot["lexicon"])
+        except FileNotFoundError:
+            logger.info(f"No lexicon snapshot at {snapshot_path}, loading from NLTK")
+        except (OSError, pickle.UnpicklingError, ValueError, KeyError) as e:
+            logger.warning(f"Lexicon snapshot not used, loading from NLTK: {str(e)}")
+    return SentimentIntensityAnalyzer()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the VADER lexicon snapshot")
+    parser.add_argument("zip_path", help="Path of vader_lexicon.zip")
+    parser.add_argument("snapshot_path", help="Path of the snapshot to write")
+    args = parser.parse_args()
+    count = build_snapshot(args.zip_path, args.snapshot_path)
+    print(f"Wrote {count} tokens to {args.snapshot_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Bounded LRU cache of VADER scores for the sentiment analysis microservice.
+
+Short review strings ("Great service", "Terrible experience") recur across
+dealers, so the service memoizes the full ``polarity_scores`` dict of every
+text it scores. Hot strings are answered from memory without running VADER.
+
+Keys are the text with its whitespace collapsed. VADER splits on whitespace,
+so this never changes a score; case and punctuation are kept because VADER
+reads them (ALL CAPS emphasis, "!" and "?" amplifiers).
+
+Every gunicorn worker holds its own cache, so the counters reported by
+``stats`` are those of the worker that answered the request.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+def normalize(text):
+    """Collapse runs of whitespace and strip both ends of a text."""
+    return " ".join(text.split())
+
+
+class ScoreCache:
+    """
+    Thread-safe, size-bounded LRU mapping normalized texts to VADER scores.
+
+    Args:
+        max_entries (int): Maximum number of cached texts; 0 disables caching
+        max_text_length (int): Texts longer than this are never cached
+    """
+
+    def __init__(self, max_entries=10000, max_text_length=2048):
+        self.max_entries = max_entries
+        self.max_text_length = max_text_length
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, texts):
+        """
+        Look up the scores of several texts.
+
+        Args:
+            texts (iterable[str]): Texts to look up
+
+        Returns:
+            dict: Mapping of text to scores for every text found. Missing
+                texts are omitted.
+        """
+        found = {}
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                key = normalize(text)
+                scores = self._entries.get(key)
+                if scores is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                found[text] = scores
+        return found
+
+    def set_many(self, mapping):
+        """
+        Store the scores of several texts, evicting the least recently used.
+
+        Args:
+            mapping (dict): Mapping of text to its ``polarity_scores`` dict
+        """
+        if not self.max_entries:
+            return
+        with self._lock:
+            for text, scores in mapping.items():
+                if len(text) > self.max_text_length:
+                    continue
+                key = normalize(text)
+                self._entries[key] = scores
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: hits, misses, evictions, size, max_entries and hit_ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
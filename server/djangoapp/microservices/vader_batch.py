@@ -0,0 +1,301 @@
+"""
+Vectorized batch scoring engine for VADER sentiment analysis.
+
+``SentimentIntensityAnalyzer.polarity_scores`` scores one text at a time and
+spends most of its time on per-call overhead: it rebuilds a punctuation
+lookup table for every text, re-lowercases tokens for each rule, and
+aggregates the word valences in pure Python. ``BatchScorer`` produces the
+same scores for a whole batch of texts:
+
+1. Tokenization: each text is split once with a linear-time equivalent of
+   NLTK's ``SentiText`` punctuation stripping
+2. Valence lookup: tokens are scored against lexicon, booster and negation
+   tables compiled once at construction, with NLTK's context rules (caps
+   emphasis, boosters, negation, "never so", idioms, "least") ported as-is
+3. Aggregation: the valences of all texts are packed into one padded NumPy
+   matrix and the "but" weighting, sums, punctuation emphasis,
+   normalization and pos/neg/neu ratios are computed over the whole batch
+
+Results are identical to NLTK's. Sums are accumulated column by column so
+each text is added up in the same order as Python's ``sum``, and the final
+rounding uses Python's ``round`` rather than ``numpy.round``.
+
+Usage:
+    scorer = BatchScorer(SentimentIntensityAnalyzer())
+    scorer.polarity_scores_batch(["Great service!", "Never again."])
+"""
+
+import string
+
+import numpy as np
+from nltk.sentiment.vader import VaderConstants
+
+PUNCTUATION = frozenset(string.punctuation)
+PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
+class BatchScorer:
+    """
+    Scores batches of texts with the VADER lexicon of an existing analyzer.
+
+    Args:
+        analyzer (SentimentIntensityAnalyzer): Analyzer whose lexicon is used
+    """
+
+    def __init__(self, analyzer):
+        constants = VaderConstants()
+        self.lexicon = dict(analyzer.lexicon)
+        self.boosters = dict(constants.BOOSTER_DICT)
+        self.idioms = dict(constants.SPECIAL_CASE_IDIOMS)
+        self.negations = frozenset(constants.NEGATE)
+        self.punc_list = frozenset(constants.PUNC_LIST)
+        self.b_decr = constants.B_DECR
+        self.c_incr = constants.C_INCR
+        self.n_scalar = constants.N_SCALAR
+
+    def tokenize(self, text):
+        """
+        Split a text into words and emoticons exactly as NLTK's ``SentiText``.
+
+        A token keeps its punctuation unless stripping a leading or trailing
+        ``PUNC_LIST`` entry leaves a word of the text, which NLTK finds through
+        a table of every punctuation/word combination. Words never contain
+        punctuation, so checking the punctuation run at either end of the
+        token is equivalent and linear in the length of the text.
+
+        Args:
+            text (str): Text to tokenize
+
+        Returns:
+            list: Tokens with more than one character
+        """
+        words = {w for w in text.translate(PUNCTUATION_TABLE).split() if len(w) > 1}
+        tokens = []
+        for token in text.split():
+            if len(token) <= 1:
+                continue
+            start = 0
+            while start < len(token) and token[start] in PUNCTUATION:
+                start += 1
+            if start and token[:start] in self.punc_list and token[start:] in words:
+                token = token[start:]
+            else:
+                end = len(token)
+                while end > 0 and token[end - 1] in PUNCTUATION:
+                    end -= 1
+                if (
+                    end < len(token)
+                    and token[end:] in self.punc_list
+                    and token[:end] in words
+                ):
+                    token = token[:end]
+            tokens.append(token)
+        return tokens
+
+    def _negated(self, word):
+        word = word.lower()
+        return word in self.negations or "n't" in word
+
+    def _scalar_inc_dec(self, word, valence, is_cap_diff):
+        scalar = self.boosters.get(word.lower(), 0.0)
+        if scalar:
+            if valence < 0:
+                scalar *= -1
+            if word.isupper() and is_cap_diff:
+                scalar += self.c_incr if valence > 0 else -self.c_incr
+        return scalar
+
+    def _idioms(self, valence, tokens, i):
+        onezero = f"{tokens[i - 1]} {tokens[i]}"
+        twoonezero = f"{tokens[i - 2]} {tokens[i - 1]} {tokens[i]}"
+        twoone = f"{tokens[i - 2]} {tokens[i - 1]}"
+        threetwoone = f"{tokens[i - 3]} {tokens[i - 2]} {tokens[i - 1]}"
+        threetwo = f"{tokens[i - 3]} {tokens[i - 2]}"
+        for seq in (onezero, twoonezero, twoone, threetwoone, threetwo):
+            if seq in self.idioms:
+                valence = self.idioms[seq]
+                break
+        if len(tokens) - 1 > i:
+            zeroone = f"{tokens[i]} {tokens[i + 1]}"
+            if zeroone in self.idioms:
+                valence = self.idioms[zeroone]
+        if len(tokens) - 1 > i + 1:
+            zeroonetwo = f"{tokens[i]} {tokens[i + 1]} {tokens[i + 2]}"
+            if zeroonetwo in self.idioms:
+                valence = self.idioms[zeroonetwo]
+        if threetwo in self.boosters or twoone in self.boosters:
+            valence = valence + self.b_decr
+        return valence
+
+    def _booster(self, tokens, i, start_i, valence, is_cap_diff):
+        scalar = self._scalar_inc_dec(tokens[i - (start_i + 1)], valence, is_cap_diff)
+        if start_i == 1 and scalar != 0:
+            scalar = scalar * 0.95
+        if start_i == 2 and scalar != 0:
+            scalar = scalar * 0.9
+        return scalar
+
+    def _never(self, valence, tokens, i, start_i):
+        if start_i == 0:
+            if self._negated(tokens[i - 1]):
+                valence = valence * self.n_scalar
+        elif start_i == 1:
+            if tokens[i - 2] == "never" and tokens[i - 1] in ("so", "this"):
+                valence = valence * 1.5
+            elif self._negated(tokens[i - 2]):
+                valence = valence * self.n_scalar
+        else:
+            if (tokens[i - 3] == "never" and tokens[i - 2] in ("so", "this")) or (
+                tokens[i - 1] in ("so", "this")
+            ):
+                valence = valence * 1.25
+            elif self._negated(tokens[i - 3]):
+                valence = valence * self.n_scalar
+        return valence
+
+    def _least(self, valence, lowered, i):
+        if i > 0 and lowered[i - 1] == "least" and "least" not in self.lexicon:
+            if i == 1 or lowered[i - 2] not in ("at", "very"):
+                valence = valence * self.n_scalar
+        return valence
+
+    def _valence(self, tokens, lowered, i, is_cap_diff):
+        """
+        Compute the valence of the token at position ``i``.
+
+        This follows ``SentimentIntensityAnalyzer.sentiment_valence`` rule by
+        rule, with the booster, negation ("never"), idiom and "least" rules
+        in helpers named after NLTK's, including its use of case-sensitive
+        comparisons for "never", "so" and "this", so that results stay
+        identical.
+        """
+        lower = lowered[i]
+        if (i < len(tokens) - 1 and lower == "kind" and lowered[i + 1] == "of") or (
+            lower in self.boosters
+        ):
+            return 0
+        if lower not in self.lexicon:
+            return 0
+        valence = self.lexicon[lower]
+        if tokens[i].isupper() and is_cap_diff:
+            valence += self.c_incr if valence > 0 else -self.c_incr
+        for start_i in range(3):
+            if i <= start_i or lowered[i - (start_i + 1)] in self.lexicon:
+                continue
+            valence = valence + self._booster(tokens, i, start_i, valence, is_cap_diff)
+            valence = self._never(valence, tokens, i, start_i)
+            if start_i == 2:
+                valence = self._idioms(valence, tokens, i)
+        return self._least(valence, lowered, i)
+
+    def valences(self, text):
+        """
+        Return the per-token valences of a text and the index of its "but".
+
+        Like NLTK, a repeated token is scored in the context of its first
+        occurrence, so each distinct token is only scored once.
+
+        Args:
+            text (str): Text to score
+
+        Returns:
+            tuple: (list of valences, index of the first "but" or -1)
+        """
+        tokens = self.tokenize(text)
+        lowered = [token.lower() for token in tokens]
+        allcaps = sum(1 for token in tokens if token.isupper())
+        is_cap_diff = 0 < len(tokens) - allcaps < len(tokens)
+        first_seen = {}
+        values = []
+        for i, token in enumerate(tokens):
+            if token not in first_seen:
+                first_seen[token] = self._valence(tokens, lowered, i, is_cap_diff)
+            values.append(first_seen[token])
+        but = lowered.index("but") if "but" in lowered else -1
+        return values, but
+
+    @staticmethod
+    def _but_check(matrix, buts):
+        """
+        Halve the valences before each row's "but" and boost the ones after
+        it by half; rows without a "but" (index -1) are left unchanged.
+        """
+        columns = np.arange(matrix.shape[1])
+        weights = np.where(columns < buts[:, None], 0.5, 1.5)
+        weights[columns == buts[:, None]] = 1.0
+        return np.where(buts[:, None] >= 0, matrix * weights, matrix)
+
+    def polarity_scores_batch(self, texts):
+        """
+        Score a batch of texts.
+
+        Args:
+            texts (list): Texts to score
+
+        Returns:
+            list: One dict per text with 'neg', 'neu', 'pos' and 'compound'
+                keys, identical to ``SentimentIntensityAnalyzer.polarity_scores``
+        """
+        if not texts:
+            return []
+        scored = [self.valences(text) for text in texts]
+        lengths = np.fromiter((len(v) for v, _ in scored), dtype=np.int64)
+        width = int(lengths.max())
+        matrix = np.zeros((len(texts), width))
+        buts = np.fromiter((b for _, b in scored), dtype=np.int64)
+        for row, (values, _) in enumerate(scored):
+            matrix[row, : len(values)] = values
+
+        matrix = self._but_check(matrix, buts)
+        valid = np.arange(width) < lengths[:, None]
+
+        # Accumulate one column at a time to add up each row in token order
+        total = np.zeros(len(texts))
+        pos_sum = np.zeros(len(texts))
+        neg_sum = np.zeros(len(texts))
+        neu_count = np.zeros(len(texts))
+        for col in range(width):
+            values = matrix[:, col]
+            total += values
+            pos_sum += np.where(values > 0, values + 1, 0.0)
+            neg_sum += np.where(values < 0, values - 1, 0.0)
+            neu_count += valid[:, col] & (values == 0)
+
+        exclamations = np.fromiter((t.count("!") for t in texts), dtype=np.int64)
+        questions = np.fromiter((t.count("?") for t in texts), dtype=np.int64)
+        amplifier = np.minimum(exclamations, 4) * 0.292 + np.where(
+            questions > 3, 0.96, np.where(questions > 1, questions * 0.18, 0.0)
+        )
+
+        total = np.where(
+            total > 0,
+            total + amplifier,
+            np.where(total < 0, total - amplifier, total),
+        )
+        compound = total / np.sqrt(total * total + 15)
+        pos_wins = pos_sum > np.fabs(neg_sum)
+        neg_wins = pos_sum < np.fabs(neg_sum)
+        pos_sum = np.where(pos_wins, pos_sum + amplifier, pos_sum)
+        neg_sum = np.where(neg_wins, neg_sum - amplifier, neg_sum)
+        denominator = pos_sum + np.fabs(neg_sum) + neu_count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pos = np.fabs(pos_sum / denominator)
+            neg = np.fabs(neg_sum / denominator)
+            neu = np.fabs(neu_count / denominator)
+
+        results = []
+        for n, p, u, c, length in zip(
+            neg.tolist(), pos.tolist(), neu.tolist(), compound.tolist(), lengths
+        ):
+            if not length:
+                results.append({"neg": 0.0, "neu": 0.0, "pos": 0.0, "compound": 0.0})
+                continue
+            results.append(
+                {
+                    "neg": round(n, 3),
+                    "neu": round(u, 3),
+                    "pos": round(p, 3),
+                    "compound": round(c, 4),
+                }
+            )
+        return results
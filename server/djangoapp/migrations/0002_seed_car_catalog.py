@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+def seed_car_catalog(apps, schema_editor):
+    from djangoapp.populate import initiate
+
+    initiate(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("djangoapp", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_car_catalog, migrations.RunPython.noop),
+    ]
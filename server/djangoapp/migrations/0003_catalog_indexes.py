@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("djangoapp", "0002_seed_car_catalog"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="carmodel",
+            index=models.Index(
+                fields=["-year", "maker", "name", "id"],
+                name="carmodel_catalog_page_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="carmodel",
+            index=models.Index(
+                fields=["maker", "-year", "name", "id"],
+                name="carmodel_maker_page_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="carmodel",
+            index=models.Index(
+                fields=["type_car", "-year", "maker", "name", "id"],
+                name="carmodel_type_page_idx",
+            ),
+        ),
+    ]
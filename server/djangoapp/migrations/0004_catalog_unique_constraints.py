@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("djangoapp", "0003_catalog_indexes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="carmake",
+            constraint=models.UniqueConstraint(
+                fields=["name"], name="carmake_unique_name"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="carmodel",
+            constraint=models.UniqueConstraint(
+                fields=["maker", "name", "year"],
+                name="carmodel_unique_maker_name_year",
+            ),
+        ),
+    ]
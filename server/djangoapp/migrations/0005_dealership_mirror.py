@@ -0,0 +1,45 @@
+# Generated by Django 5.1.7 on 2026-10-18 19:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("djangoapp", "0004_catalog_unique_constraints"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Dealership",
+            fields=[
+                (
+                    "id",
+                    models.PositiveIntegerField(
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Backend Dealer ID",
+                    ),
+                ),
+                ("city", models.CharField(max_length=100)),
+                ("state", models.CharField(max_length=100)),
+                ("st", models.CharField(max_length=2, verbose_name="State Code")),
+                ("address", models.CharField(max_length=200)),
+                ("zip", models.CharField(max_length=20)),
+                ("lat", models.FloatField(blank=True, null=True)),
+                ("long", models.FloatField(blank=True, null=True)),
+                ("short_name", models.CharField(blank=True, max_length=100)),
+                ("full_name", models.CharField(max_length=200)),
+                ("synced_at", models.DateTimeField(verbose_name="Last Synced")),
+            ],
+            options={
+                "verbose_name": "Dealership",
+                "verbose_name_plural": "Dealerships",
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(fields=["st"], name="dealership_st_idx"),
+                    models.Index(fields=["synced_at"], name="dealership_synced_at_idx"),
+                ],
+            },
+        ),
+    ]
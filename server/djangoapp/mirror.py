@@ -0,0 +1,177 @@
+"""
+Local Dealership Mirror
+
+This module keeps a copy of the Node backend's dealerships in the Django
+database (the ``Dealership`` model) and serves the dealer read paths from it.
+
+- sync_dealerships: Mirrors /fetchDealers into the local table, writing only
+  new or changed rows (upsert by id) and stamping every row as synced.
+- read_dealerships / read_dealer: Read from the mirror when it is enabled and
+  was synced within the configured staleness bound; otherwise they return
+  None and callers fall back to the backend.
+
+Configuration:
+- settings.DEALERSHIP_MIRROR:
+  - ENABLED: Serve dealer reads from the mirror
+  - MAX_STALENESS: Seconds after the last sync the mirror may still be served
+"""
+
+from datetime import timedelta
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models import Dealership
+from .restapis import get_request
+
+logger = logging.getLogger(__name__)
+
+MIRROR_FIELDS = (
+    "id",
+    "city",
+    "state",
+    "st",
+    "address",
+    "zip",
+    "lat",
+    "long",
+    "short_name",
+    "full_name",
+)
+
+
+def _options():
+    options = {"ENABLED": False, "MAX_STALENESS": 60 * 60}
+    options.update(getattr(settings, "DEALERSHIP_MIRROR", {}))
+    return options
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _normalize(document):
+    """Map a backend dealership document to ``Dealership`` field values."""
+    return {
+        "id": int(document["id"]),
+        "city": document.get("city") or "",
+        "state": document.get("state") or "",
+        "st": (document.get("st") or "").upper(),
+        "address": document.get("address") or "",
+        "zip": str(document.get("zip") or ""),
+        "lat": _to_float(document.get("lat")),
+        "long": _to_float(document.get("long")),
+        "short_name": document.get("short_name") or "",
+        "full_name": document.get("full_name") or "",
+    }
+
+
+def sync_dealerships(prune=False):
+    """
+    Mirror the backend dealerships into the local database.
+
+    Args:
+        prune (bool): Also delete local rows that the backend no longer lists.
+
+    Returns:
+        dict or None: Number of dealerships fetched, created, updated,
+                      unchanged and deleted, or None if the backend call failed.
+    """
+    documents = get_request("fetchDealers")
+    if documents is None:
+        logger.error("Failed to fetch dealerships for the mirror")
+        return None
+
+    incoming = {}
+    for document in documents:
+        try:
+            row = _normalize(document)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping malformed dealership {document!r}: {str(e)}")
+            continue
+        incoming[row["id"]] = row
+
+    now = timezone.now()
+    with transaction.atomic():
+        existing = {row["id"]: row for row in Dealership.objects.values(*MIRROR_FIELDS)}
+        changed = [
+            Dealership(synced_at=now, **row)
+            for pk, row in incoming.items()
+            if existing.get(pk) != row
+        ]
+        Dealership.objects.bulk_create(
+            changed,
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=[field for field in MIRROR_FIELDS if field != "id"]
+            + ["synced_at"],
+        )
+        Dealership.objects.filter(id__in=incoming).update(synced_at=now)
+        deleted = 0
+        if prune:
+            deleted, _ = Dealership.objects.exclude(id__in=incoming).delete()
+
+    created = sum(1 for dealer in changed if dealer.id not in existing)
+    return {
+        "fetched": len(incoming),
+        "created": created,
+        "updated": len(changed) - created,
+        "unchanged": len(incoming) - len(changed),
+        "deleted": deleted,
+    }
+
+
+def mirror_is_fresh():
+    """
+    Return whether dealer reads may be served from the mirror.
+
+    Returns:
+        bool: True if the mirror is enabled and was synced within MAX_STALENESS.
+    """
+    options = _options()
+    if not options["ENABLED"]:
+        return False
+    last_sync = Dealership.objects.aggregate(last=Max("synced_at"))["last"]
+    if last_sync is None:
+        return False
+    return timezone.now() - last_sync <= timedelta(seconds=options["MAX_STALENESS"])
+
+
+def read_dealerships(state_code=None):
+    """
+    Return the mirrored dealerships, optionally only those of one state.
+
+    Args:
+        state_code (str or None): 2-letter state code, or None for all states.
+
+    Returns:
+        list[dict] or None: The dealerships, or None if the mirror cannot be used.
+    """
+    if not mirror_is_fresh():
+        return None
+    dealerships = Dealership.objects.all()
+    if state_code is not None:
+        dealerships = dealerships.filter(st=state_code)
+    return list(dealerships.values(*MIRROR_FIELDS))
+
+
+def read_dealer(dealer_id):
+    """
+    Return one mirrored dealership.
+
+    Args:
+        dealer_id (int): Backend ID of the dealership.
+
+    Returns:
+        dict or None: The dealership, or None if the mirror cannot be used or
+                      does not have it yet.
+    """
+    if not mirror_is_fresh():
+        return None
+    return Dealership.objects.filter(id=dealer_id).values(*MIRROR_FIELDS).first()
@@ -2,15 +2,25 @@
 Models for Car Dealership Application
 
 This module defines the database models for the car dealership application.
-It includes two main models:
+It includes three main models:
 
 1. CarMake: Represents a car manufacturer with details such as name, description, logo, website, and founded year.
 2. CarModel: Represents a car model with details such as name, type, year, and associated car make.
+3. Dealership: Local mirror of the dealerships served by the Node backend, kept up to date by the
+   sync_dealerships management command.
+4. Task: A background job of the database-backed task queue (see djangoapp.tasks).
 """
 
 from django.db import models
 from django.core.validators import MaxValueValidator, MinValueValidator
 
+TASK_STATUS_CHOICES = (
+    ("QUEUED", "Queued"),
+    ("RUNNING", "Running"),
+    ("DONE", "Done"),
+    ("DEAD", "Dead"),
+)
+
 CAR_TYPE_CHOICES = (
     ("SEDAN", "Sedan"),
     ("SUV", "SUV"),
@@ -40,6 +50,9 @@ class CarMake(models.Model):
 
     class Meta:
         ordering = ["name"]
+        constraints = [
+            models.UniqueConstraint(fields=["name"], name="carmake_unique_name"),
+        ]
         verbose_name = "Car Make"
         verbose_name_plural = "Car Makes"
 
@@ -74,5 +87,80 @@ class CarModel(models.Model):
 
     class Meta:
         ordering = ["-year", "maker__name", "name"]
+        indexes = [
+            # Keyset pagination of catalog.get_catalog_page: matches its
+            # ORDER BY exactly; also serves year-range filters
+            models.Index(
+                fields=["-year", "maker", "name", "id"],
+                name="carmodel_catalog_page_idx",
+            ),
+            # Pages filtered by make or by type, in the same order
+            models.Index(
+                fields=["maker", "-year", "name", "id"], name="carmodel_maker_page_idx"
+            ),
+            models.Index(
+                fields=["type_car", "-year", "maker", "name", "id"],
+                name="carmodel_type_page_idx",
+            ),
+        ]
+        constraints = [
+            # Upsert key of the catalog loader; also serves the make filter
+            models.UniqueConstraint(
+                fields=["maker", "name", "year"], name="carmodel_unique_maker_name_year"
+            ),
+        ]
         verbose_name = "Car Model"
         verbose_name_plural = "Car Models"
+
+
+class Dealership(models.Model):
+    id = models.PositiveIntegerField(primary_key=True, verbose_name="Backend Dealer ID")
+    city = models.CharField(max_length=100)
+    state = models.CharField(max_length=100)
+    st = models.CharField(max_length=2, verbose_name="State Code")
+    address = models.CharField(max_length=200)
+    zip = models.CharField(max_length=20)
+    lat = models.FloatField(null=True, blank=True)
+    long = models.FloatField(null=True, blank=True)
+    short_name = models.CharField(max_length=100, blank=True)
+    full_name = models.CharField(max_length=200)
+    synced_at = models.DateTimeField(verbose_name="Last Synced")
+
+    def __str__(self):
+        return self.full_name
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["st"], name="dealership_st_idx"),
+            models.Index(fields=["synced_at"], name="dealership_synced_at_idx"),
+        ]
+        verbose_name = "Dealership"
+        verbose_name_plural = "Dealerships"
+
+
+class Task(models.Model):
+    name = models.CharField(max_length=100, verbose_name="Task Name")
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=10, choices=TASK_STATUS_CHOICES, default="QUEUED"
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(verbose_name="Run After")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
+
+    class Meta:
+        ordering = ["run_at", "id"]
+        indexes = [
+            # Worker polling: next due task in a given status
+            models.Index(fields=["status", "run_at"], name="task_status_run_at_idx"),
+        ]
+        verbose_name = "Task"
+        verbose_name_plural = "Tasks"
@@ -3,12 +3,45 @@ Populate Database with Sample Data
 
 This module populates the database with sample car make and model data.
 It creates car makes and adds a few models for each make.
+
+The seed is applied by the ``0002_seed_car_catalog`` data migration, so it
+runs once at deploy time instead of in the request path.
+
+Larger catalogs are loaded with ``load_catalog`` (see the ``load_catalog``
+management command), which upserts makes and models in batches.
 """
 
-from .models import CarMake, CarModel
+import csv
+import json
+from pathlib import Path
+import re
+
+from django.db import transaction
+
+from .models import CAR_TYPE_CHOICES
+
+CAR_TYPES = {value for value, _ in CAR_TYPE_CHOICES}
+
+JSON_CHUNK_SIZE = 1 << 16  # characters read at a time from JSON documents
 
+_WHITESPACE = re.compile(r"\s*")
+_NUMBER_CHARS = re.compile(r"[\d.eE+-]*")
+
+
+def initiate(apps=None):
+    """
+    Create the sample car makes and models if they do not exist yet.
+
+    Args:
+        apps: App registry to load the models from. Data migrations pass their
+              historical registry; defaults to the current models.
+    """
+    if apps is None:
+        from .models import CarMake, CarModel
+    else:
+        CarMake = apps.get_model("djangoapp", "CarMake")
+        CarModel = apps.get_model("djangoapp", "CarModel")
 
-def initiate():
     car_make_data = [
         {
             "name": "Toyota",
@@ -47,56 +80,261 @@ def initiate():
         },
     ]
 
-    # Create car makes
-    for make_data in car_make_data:
-        make, created = CarMake.objects.get_or_create(
-            name=make_data["name"],
-            defaults={
-                "description": make_data["description"],
-                "logo_url": make_data["logo_url"],
-                "website": make_data["website"],
-                "founded_year": make_data["founded_year"],
-            },
+    car_model_data = {
+        "Toyota": [
+            {"name": "Camry", "type_car": "SEDAN", "year": 2023},
+            {"name": "RAV4", "type_car": "SUV", "year": 2023},
+            {"name": "Corolla", "type_car": "SEDAN", "year": 2022},
+        ],
+        "Honda": [
+            {"name": "Civic", "type_car": "SEDAN", "year": 2023},
+            {"name": "CR-V", "type_car": "SUV", "year": 2023},
+            {"name": "Accord", "type_car": "SEDAN", "year": 2022},
+        ],
+        "Ford": [
+            {"name": "F-150", "type_car": "SUV", "year": 2023},
+            {"name": "Mustang", "type_car": "SEDAN", "year": 2023},
+            {"name": "Explorer", "type_car": "SUV", "year": 2022},
+        ],
+        "BMW": [
+            {"name": "3 Series", "type_car": "SEDAN", "year": 2023},
+            {"name": "X5", "type_car": "SUV", "year": 2023},
+            {"name": "5 Series", "type_car": "SEDAN", "year": 2022},
+        ],
+        "Tesla": [
+            {"name": "Model 3", "type_car": "SEDAN", "year": 2023},
+            {"name": "Model Y", "type_car": "SUV", "year": 2023},
+            {"name": "Model S", "type_car": "SEDAN", "year": 2022},
+        ],
+    }
+
+    with transaction.atomic():
+        # Create the missing car makes; existing ones are left untouched
+        existing = set(
+            CarMake.objects.filter(
+                name__in=[make_data["name"] for make_data in car_make_data]
+            ).values_list("name", flat=True)
+        )
+        CarMake.objects.bulk_create(
+            CarMake(**make_data)
+            for make_data in car_make_data
+            if make_data["name"] not in existing
         )
 
-        # Add some models for each make
-        if created:
-            if make.name == "Toyota":
-                models = [
-                    {"name": "Camry", "type_car": "SEDAN", "year": 2023},
-                    {"name": "RAV4", "type_car": "SUV", "year": 2023},
-                    {"name": "Corolla", "type_car": "SEDAN", "year": 2022},
-                ]
-            elif make.name == "Honda":
-                models = [
-                    {"name": "Civic", "type_car": "SEDAN", "year": 2023},
-                    {"name": "CR-V", "type_car": "SUV", "year": 2023},
-                    {"name": "Accord", "type_car": "SEDAN", "year": 2022},
-                ]
-            elif make.name == "Ford":
-                models = [
-                    {"name": "F-150", "type_car": "SUV", "year": 2023},
-                    {"name": "Mustang", "type_car": "SEDAN", "year": 2023},
-                    {"name": "Explorer", "type_car": "SUV", "year": 2022},
-                ]
-            elif make.name == "BMW":
-                models = [
-                    {"name": "3 Series", "type_car": "SEDAN", "year": 2023},
-                    {"name": "X5", "type_car": "SUV", "year": 2023},
-                    {"name": "5 Series", "type_car": "SEDAN", "year": 2022},
-                ]
-            elif make.name == "Tesla":
-                models = [
-                    {"name": "Model 3", "type_car": "SEDAN", "year": 2023},
-                    {"name": "Model Y", "type_car": "SUV", "year": 2023},
-                    {"name": "Model S", "type_car": "SEDAN", "year": 2022},
-                ]
-
-            # Create car models for this make
-            for model_data in models:
-                CarModel.objects.create(
-                    maker=make,
-                    name=model_data["name"],
-                    type_car=model_data["type_car"],
-                    year=model_data["year"],
+        # Add some models for each newly created make
+        created = CarMake.objects.filter(
+            name__in=[
+                make_data["name"]
+                for make_data in car_make_data
+                if make_data["name"] not in existing
+            ]
+        )
+        CarModel.objects.bulk_create(
+            CarModel(maker=make, **model_data)
+            for make in created
+            for model_data in car_model_data[make.name]
+        )
+
+
+class _JSONStream:
+    """
+    Reads the values of a JSON document one at a time.
+
+    Only the value being decoded is held in memory (plus one chunk of the
+    file), so the rows of a large JSON catalog are streamed like those of a
+    JSON Lines file.
+    """
+
+    decoder = json.JSONDecoder()
+
+    def __init__(self, source):
+        self.source = source
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.source.read(JSON_CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        start, self.pos = self.pos, 0
+        self.buffer = self.buffer[start:] + chunk
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character, or "" at the end."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars):
+        """Consume the next character, which must be one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON document")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode and consume the next value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number running to the end of the buffer may go on in the
+            # next chunk ("12" of "12.5")
+            if not isinstance(value, (int, float)) or self.eof:
+                break
+            if not _NUMBER_CHARS.fullmatch(self.buffer, end) or not self._fill():
+                break
+        self.pos = end
+        return value
+
+    def items(self):
+        """Yield the items of the array starting at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+    def items_under(self, key):
+        """
+        Yield the items of the array that is the document itself, or that the
+        document object holds under ``key``.
+        """
+        if self.peek() == "[":
+            yield from self.items()
+            return
+        self.expect("{")
+        while self.peek() != "}":
+            name = self.value()
+            self.expect(":")
+            if name == key:
+                yield from self.items()
+                return
+            self.value()
+            if self.expect(",}") == "}":
+                break
+        raise KeyError(key)
+
+
+def read_rows(path, key="cars"):
+    """
+    Stream raw rows from a CSV, JSON Lines or JSON file.
+
+    Every format is read one row at a time. A JSON document may be a list of
+    rows or an object holding the list under ``key``, like the "cars" list of
+    ``database/data/car_records.json``.
+    """
+    suffix = Path(path).suffix.lower()
+    with open(path, newline="", encoding="utf-8") as source:
+        if suffix == ".csv":
+            yield from csv.DictReader(source)
+        elif suffix in (".jsonl", ".ndjson"):
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from _JSONStream(source).items_under(key)
+
+
+def _normalize_row(row):
+    """
+    Map a raw row to ``(make, name, type_car, year)``.
+
+    Accepts the car_records.json field names (make, model, bodyType, year) as
+    well as the model field names (make, name, type_car, year).
+
+    Returns:
+        tuple or None: The normalized row, or None if it cannot be loaded.
+    """
+    try:
+        make = str(row["make"]).strip()
+        name = str(row.get("model") or row.get("name") or "").strip()
+        type_car = str(row.get("bodyType") or row.get("type_car") or "").upper()
+        year = int(row["year"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not make or not name or type_car not in CAR_TYPES:
+        return None
+    return make, name, type_car, year
+
+
+def load_catalog(path, batch_size=1000):
+    """
+    Upsert the car makes and models listed in a catalog file.
+
+    Rows are streamed from ``path`` and written in batches with
+    ``bulk_create``: new makes are inserted, and car models are upserted on
+    (maker, name, year), updating their type. The whole load runs in a single
+    transaction, so a failure leaves the catalog untouched. Rows with missing
+    fields or a car type outside ``CAR_TYPE_CHOICES`` are skipped.
+
+    Args:
+        path (str): CSV, JSON Lines or JSON file to load.
+        batch_size (int): Number of rows written per INSERT.
+
+    Returns:
+        dict: Number of rows read, loaded and skipped, and makes created.
+    """
+    from .catalog import invalidate_catalog
+    from .models import CarMake, CarModel
+
+    stats = {"read": 0, "loaded": 0, "skipped": 0, "makes_created": 0}
+    make_ids = dict(CarMake.objects.values_list("name", "id"))
+
+    def flush(batch):
+        new_makes = {make for make, _, _, _ in batch.values()} - make_ids.keys()
+        if new_makes:
+            CarMake.objects.bulk_create(
+                [CarMake(name=make) for make in sorted(new_makes)],
+                batch_size=batch_size,
+            )
+            make_ids.update(
+                CarMake.objects.filter(name__in=new_makes).values_list("name", "id")
+            )
+            stats["makes_created"] += len(new_makes)
+        CarModel.objects.bulk_create(
+            [
+                CarModel(
+                    maker_id=make_ids[make], name=name, type_car=type_car, year=year
                 )
+                for make, name, type_car, year in batch.values()
+            ],
+            update_conflicts=True,
+            unique_fields=["maker", "name", "year"],
+            update_fields=["type_car", "updated_at"],
+        )
+        stats["loaded"] += len(batch)
+
+    with transaction.atomic():
+        # Keyed on the upsert key so a batch never touches the same row twice
+        batch = {}
+        for raw in read_rows(path):
+            stats["read"] += 1
+            row = _normalize_row(raw)
+            if row is None:
+                stats["skipped"] += 1
+                continue
+            batch[(row[0], row[1], row[3])] = row
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = {}
+        if batch:
+            flush(batch)
+
+    # bulk_create does not send post_save, so drop the cached catalog here
+    invalidate_catalog()
+    return stats
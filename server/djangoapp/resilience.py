@@ -0,0 +1,215 @@
+"""
+Upstream Resilience
+
+This module keeps a slow or failing upstream (the Node backend or the
+sentiment service) from tying up the app's workers.
+
+Key Features:
+1. Circuit breakers (one per upstream, see restapis.get_breaker):
+   - closed: calls go through; consecutive failures are counted
+   - open: after ``failure_threshold`` consecutive failures calls fail
+     immediately, without touching the network, for ``reset_timeout`` seconds
+   - half-open: then a single probe call is let through; its success closes
+     the circuit, its failure opens it again
+   - A request whose last attempt fails (connection error, timeout or 5xx)
+     counts as one failure, however many retries it made; a cancelled
+     request is not counted
+2. Per-request time budget (upstream_budget_middleware):
+   - Each incoming request gets settings.UPSTREAM_HTTP["REQUEST_BUDGET"]
+     seconds for all of its upstream calls together; every call's timeout is
+     capped to what is left, and calls made once it is spent fail at once
+
+Callers see an open circuit or a spent budget as a regular request error
+(the exceptions below subclass the requests and httpx errors they already
+handle), so they degrade the same way they do for an unreachable upstream.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.decorators import sync_and_async_middleware
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_deadline = ContextVar("djangoapp_upstream_deadline", default=None)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+
+class BudgetExceededError(requests.exceptions.Timeout):
+    """Raised instead of calling an upstream once the request budget is spent."""
+
+
+class AsyncCircuitOpenError(httpx.TransportError):
+    """httpx counterpart of ``CircuitOpenError``."""
+
+
+class AsyncBudgetExceededError(httpx.TimeoutException):
+    """httpx counterpart of ``BudgetExceededError``."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker for one upstream service.
+
+    Args:
+        name (str): Upstream name, used in log messages
+        failure_threshold (int): Consecutive failures that open the circuit
+        reset_timeout (float): Seconds the circuit stays open before a probe
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        Returns True when a call may go through.
+
+        Moves an open circuit to half-open once ``reset_timeout`` has passed
+        and lets exactly one probe call through while half-open.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if (
+                self.state == OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """Records a successful call, closing a half-open circuit."""
+        with self._lock:
+            if self.state != CLOSED:
+                logger.warning(f"Circuit for {self.name} closed")
+            self.state = CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        """Records a failed call, opening the circuit past the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    logger.warning(
+                        f"Circuit for {self.name} opened after "
+                        f"{self.failures} consecutive failures"
+                    )
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    def release(self):
+        """
+        Ends a call that had no outcome, such as a cancelled one, without
+        counting it: a half-open circuit lets the next call probe instead.
+        """
+        with self._lock:
+            self._probing = False
+
+    def stats(self):
+        """
+        Returns the breaker state.
+
+        Returns:
+            dict: state, consecutive failures and calls rejected while open
+        """
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "rejected": self.rejected,
+            }
+
+
+def remaining_budget():
+    """
+    Returns the seconds left in the current request's upstream budget.
+
+    Returns:
+        float or None: Seconds left (possibly negative), or None when no
+                       budget applies (management commands, tasks)
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextmanager
+def upstream_budget(seconds):
+    """
+    Limits the total time of the upstream calls made inside the block.
+
+    Args:
+        seconds (float or None): Budget; None leaves calls unbounded
+    """
+    if seconds is None:
+        yield
+        return
+    token = _deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _request_budget():
+    return getattr(settings, "UPSTREAM_HTTP", {}).get("REQUEST_BUDGET")
+
+
+@sync_and_async_middleware
+def upstream_budget_middleware(get_response):
+    """
+    Middleware giving each request settings.UPSTREAM_HTTP["REQUEST_BUDGET"]
+    seconds for its upstream calls. Not installed when no budget is set.
+
+    Streaming views keep the budget while streaming by iterating their
+    content in the view's context (see views._in_request_context).
+    """
+    budget = _request_budget()
+    if not budget:
+        raise MiddlewareNotUsed
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            with upstream_budget(budget):
+                return await get_response(request)
+
+        return middleware
+
+    def middleware(request):
+        with upstream_budget(budget):
+            return get_response(request)
+
+    return middleware
@@ -8,15 +8,46 @@ communication for the Django application.
 Key Features:
 1. GET Requests:
    - get_request: Handles GET requests to backend API with query parameters
-   - analyze_review_sentiments: Calls sentiment analysis service for review text
+   - get_request_cached: get_request behind the read-through response cache
 
 2. POST Requests:
    - post_review: Handles POST requests to backend API with JSON data
+   - analyze_review_sentiments: Label and VADER scores of one review text
+   - analyze_review_sentiments_batch: Analyzes many review texts in one call
+   - score_review_sentiments: Label and compound score, stored with reviews
+
+3. Connection Pooling:
+   - get_session: Returns the keep-alive requests.Session pool for a host
+   - Connect and read timeouts are set separately; idempotent GETs are
+     retried with exponential backoff, within the request's time budget
+   - Every upstream call is timed into djangoapp.metrics (per upstream and
+     endpoint) unless settings.METRICS["ENABLED"] is False
+   - With settings.TRACING["ENABLED"], every upstream call is a client span
+     of the request's trace and carries its ``traceparent`` header
+   - get_breaker: Per-upstream circuit breaker; calls to an upstream whose
+     circuit is open, or made after the request's time budget is spent,
+     fail at once (see djangoapp.resilience)
+
+4. Async API (used by the async views when served over ASGI):
+   - get_request_async: Non-blocking variant of get_request
+   - get_request_cached_async: Non-blocking variant of get_request_cached
+   - analyze_review_sentiments_batch_async: Splits the uncached texts in
+     chunks and analyzes them concurrently, bounded by a semaphore
+
+5. Sentiment Cache:
+   - SentimentCache: Two-tier (in-process LRU + shared Django cache) store of
+     sentiment labels keyed by a SHA-256 hash of the review text
+   - get_sentiment_cache_stats: Hit/miss counters of the cache
+   - ReadThroughCache: Response cache for backend GETs with per-endpoint
+     TTLs, stale-while-revalidate and single-flight loading
 
 Configuration:
 - Uses environment variables for backend URLs:
   - backend_url: Base URL for dealership backend API
   - sentiment_analyzer_url: URL for sentiment analysis service
+- Uses settings.SENTIMENT_CACHE for the sentiment cache size, TTL and shared tier
+- Uses settings.UPSTREAM_HTTP for pool sizes, timeouts and GET retries
+- Uses settings.RESPONSE_CACHE for the response cache TTLs
 
 Error Handling:
 - All functions include proper error handling and logging
@@ -31,10 +62,13 @@ Security:
 Example Usage:
     # Get dealer reviews
     reviews = get_request('fetchReviews', dealer_id=123)
-    
+
     # Analyze review sentiment
     sentiment = analyze_review_sentiments("Great service!")
-    
+
+    # Analyze several reviews with a single round trip
+    sentiments = analyze_review_sentiments_batch(["Great!", "Awful."])
+
     # Post new review
     response = post_review('insert_review', {
         'name': 'John',
@@ -42,11 +76,38 @@ Example Usage:
     })
 """
 
+from collections import OrderedDict
+import hashlib
 import logging
 import os
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+import weakref
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
 from dotenv import load_dotenv
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from djangoapp import metrics, tracing
+from djangoapp.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    AsyncBudgetExceededError,
+    AsyncCircuitOpenError,
+    BudgetExceededError,
+    CircuitBreaker,
+    CircuitOpenError,
+    remaining_budget,
+)
 
 load_dotenv()
 # Get an instance of a logger
@@ -57,6 +118,784 @@ sentiment_analyzer_url = os.getenv(
     "sentiment_analyzer_url", default="http://localhost:5050/"
 )
 
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _http_options():
+    options = {
+        "POOL_CONNECTIONS": 1,
+        "POOL_MAXSIZE": 4,
+        "CONNECT_TIMEOUT": 3.05,
+        "READ_TIMEOUT": 10,
+        "MAX_RETRIES": 2,
+        "BACKOFF_FACTOR": 0.2,
+        "SENTIMENT_CONCURRENCY": 8,
+        "SENTIMENT_CHUNK_SIZE": 25,
+        "BREAKER_FAILURE_THRESHOLD": 5,
+        "BREAKER_RESET_TIMEOUT": 30,
+    }
+    options.update(getattr(settings, "UPSTREAM_HTTP", {}))
+    return options
+
+
+def request_timeout():
+    """
+    Returns the ``(connect, read)`` timeout tuple used for upstream calls.
+    """
+    options = _http_options()
+    return (options["CONNECT_TIMEOUT"], options["READ_TIMEOUT"])
+
+
+def _upstream_name(url):
+    netloc = urlsplit(url).netloc
+    if netloc == urlsplit(backend_url).netloc:
+        return "backend"
+    if netloc == urlsplit(sentiment_analyzer_url).netloc:
+        return "sentiment"
+    return netloc
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(upstream):
+    """
+    Returns the circuit breaker of an upstream service.
+
+    Args:
+        upstream (str): Upstream name ("backend", "sentiment" or a host)
+
+    Returns:
+        CircuitBreaker: The breaker shared by every call to that upstream in
+                        this worker.
+    """
+    breaker = _breakers.get(upstream)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(upstream)
+            if breaker is None:
+                options = _http_options()
+                breaker = _breakers[upstream] = CircuitBreaker(
+                    upstream,
+                    failure_threshold=options["BREAKER_FAILURE_THRESHOLD"],
+                    reset_timeout=options["BREAKER_RESET_TIMEOUT"],
+                )
+    return breaker
+
+
+def get_breaker_stats():
+    """
+    Returns the state of every circuit breaker of this worker.
+
+    Returns:
+        dict: Mapping of upstream name to ``CircuitBreaker.stats``.
+    """
+    return {name: breaker.stats() for name, breaker in list(_breakers.items())}
+
+
+def _breaker_metrics():
+    codes = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+    lines = [
+        "# HELP djangoapp_upstream_circuit_state Circuit breaker state "
+        "(0 closed, 1 half-open, 2 open).",
+        "# TYPE djangoapp_upstream_circuit_state gauge",
+    ]
+    for name, stats in sorted(get_breaker_stats().items()):
+        lines.append(
+            f'djangoapp_upstream_circuit_state{{upstream="{name}"}} '
+            f"{codes[stats['state']]}"
+        )
+    return lines
+
+
+metrics.register_collector(_breaker_metrics)
+
+
+def _capped_timeout(timeout, remaining):
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+# Idempotent methods and gateway statuses worth another attempt
+RETRY_METHODS = frozenset({"GET"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+def _retry_delay(attempt, backoff_factor, request, budget_error):
+    """
+    Returns the seconds to wait before retry number ``attempt`` (1-based).
+
+    The delay doubles with every retry. Raises ``budget_error`` when the
+    request budget would be spent before the retry could start.
+    """
+    delay = backoff_factor * 2 ** (attempt - 1)
+    remaining = remaining_budget()
+    if remaining is not None and remaining <= delay:
+        raise budget_error("Request time budget spent", request=request)
+    return delay
+
+
+def _never_sent(error):
+    """True when a requests error happened before the upstream got the request."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _retryable_error(error, method):
+    if not isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return False
+    return method in RETRY_METHODS or _never_sent(error)
+
+
+def _retryable_async_error(error, method):
+    if not isinstance(error, httpx.TransportError):
+        return False
+    never_sent = isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+    return method in RETRY_METHODS or never_sent
+
+
+def _retryable_response(response, method):
+    return method in RETRY_METHODS and response.status_code in RETRY_STATUSES
+
+
+class _BreakerCall:
+    """
+    Records the outcome of one upstream request, retries included, on the
+    circuit breaker of its upstream: a failure if its last attempt failed, a
+    success if it got a response below 500. A request that ends without an
+    outcome (cancelled, or stopped by the budget before any attempt failed)
+    only releases the breaker.
+    """
+
+    def __init__(self, breaker):
+        self.breaker = breaker
+        self.failed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and issubclass(exc_type, asyncio.CancelledError):
+            self.breaker.release()
+        elif self.failed:
+            self.breaker.record_failure()
+        elif exc_type is None:
+            self.breaker.record_success()
+        else:
+            self.breaker.release()
+        return False
+
+
+def _start_call(request, upstream, budget_error, circuit_error):
+    """
+    Admits a request to ``upstream``, raising ``budget_error`` when the
+    request budget is spent or ``circuit_error`` when the circuit is open.
+
+    Returns:
+        _BreakerCall: Context manager recording the request's outcome.
+    """
+    remaining = remaining_budget()
+    if remaining is not None and remaining <= 0:
+        raise budget_error("Request time budget spent", request=request)
+    breaker = get_breaker(upstream)
+    if not breaker.allow():
+        raise circuit_error(f"Circuit open for {upstream}", request=request)
+    return _BreakerCall(breaker)
+
+
+class _UpstreamHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter guarding every upstream call:
+
+    - retries GETs that fail or answer 502/503/504, and any request that
+      failed before reaching the upstream, with exponential backoff; the
+      request budget is checked again before every attempt, so retries never
+      run past it
+    - rejects a request at once when the upstream's circuit is open or the
+      request budget is spent, and caps each attempt's timeout to the budget
+      left; the circuit breaker records one outcome per request, whatever
+      its number of attempts
+    - times every attempt into djangoapp.metrics and records it as a client
+      span of the current trace
+
+    Args:
+        retries (int): Retries after the first attempt
+        backoff_factor (float): Seconds before the first retry, doubled for
+                                every further one
+    """
+
+    def __init__(self, retries=0, backoff_factor=0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+    def send(self, request, *args, **kwargs):
+        upstream = _upstream_name(request.url)
+        with _start_call(
+            request, upstream, BudgetExceededError, CircuitOpenError
+        ) as call:
+            attempt = 0
+            while True:
+                try:
+                    response = self._send_attempt(request, upstream, *args, **kwargs)
+                except BudgetExceededError:
+                    raise
+                except Exception as e:
+                    call.failed = True
+                    if attempt >= self.retries or not _retryable_error(
+                        e, request.method
+                    ):
+                        raise
+                else:
+                    call.failed = response.status_code >= 500
+                    if attempt >= self.retries or not _retryable_response(
+                        response, request.method
+                    ):
+                        return response
+                    response.close()
+                attempt += 1
+                time.sleep(
+                    _retry_delay(
+                        attempt, self.backoff_factor, request, BudgetExceededError
+                    )
+                )
+
+    def _send_attempt(self, request, upstream, *args, **kwargs):
+        path = urlsplit(request.url).path
+        remaining = remaining_budget()
+        if remaining is not None:
+            if remaining <= 0:
+                raise BudgetExceededError("Request time budget spent", request=request)
+            kwargs["timeout"] = _capped_timeout(kwargs.get("timeout"), remaining)
+        with tracing.client_span(
+            f"{request.method} {path}", request.headers, upstream=upstream
+        ) as span:
+            started = time.perf_counter()
+            try:
+                response = super().send(request, *args, **kwargs)
+            except Exception:
+                metrics.observe_upstream(upstream, request.method, path, started)
+                raise
+            metrics.observe_upstream(
+                upstream, request.method, path, started, response.status_code
+            )
+            if span is not None:
+                span.attributes["http.status_code"] = response.status_code
+        return response
+
+
+class _UpstreamAsyncTransport(httpx.AsyncHTTPTransport):
+    """
+    httpx transport with the same retries and guards as _UpstreamHTTPAdapter.
+
+    A cancelled request (client disconnect, cancelled ``gather``) says
+    nothing about the upstream: it releases the circuit breaker without
+    counting a failure.
+    """
+
+    def __init__(self, retries=0, backoff_factor=0.0, **kwargs):
+        super().__init__(**kwargs)
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+
+    async def handle_async_request(self, request):
+        upstream = _upstream_name(str(request.url))
+        with _start_call(
+            request, upstream, AsyncBudgetExceededError, AsyncCircuitOpenError
+        ) as call:
+            attempt = 0
+            while True:
+                try:
+                    response = await self._send_attempt(request, upstream)
+                except AsyncBudgetExceededError:
+                    raise
+                except Exception as e:
+                    call.failed = True
+                    if attempt >= self.retries or not _retryable_async_error(
+                        e, request.method
+                    ):
+                        raise
+                else:
+                    call.failed = response.status_code >= 500
+                    if attempt >= self.retries or not _retryable_response(
+                        response, request.method
+                    ):
+                        return response
+                    await response.aclose()
+                attempt += 1
+                await asyncio.sleep(
+                    _retry_delay(
+                        attempt, self.backoff_factor, request, AsyncBudgetExceededError
+                    )
+                )
+
+    async def _send_attempt(self, request, upstream):
+        path = request.url.path
+        remaining = remaining_budget()
+        if remaining is not None:
+            if remaining <= 0:
+                raise AsyncBudgetExceededError(
+                    "Request time budget spent", request=request
+                )
+            timeout = dict(request.extensions.get("timeout", {}))
+            request.extensions["timeout"] = {
+                key: _capped_timeout(value, remaining) for key, value in timeout.items()
+            }
+        with tracing.client_span(
+            f"{request.method} {path}", request.headers, upstream=upstream
+        ) as span:
+            started = time.perf_counter()
+            try:
+                response = await super().handle_async_request(request)
+            except BaseException:
+                metrics.observe_upstream(upstream, request.method, path, started)
+                raise
+            metrics.observe_upstream(
+                upstream, request.method, path, started, response.status_code
+            )
+            if span is not None:
+                span.attributes["http.status_code"] = response.status_code
+        return response
+
+
+def _build_session():
+    options = _http_options()
+    # Retries are made by the adapter, not urllib3, so that each attempt is
+    # checked against the request budget. Only idempotent GETs are retried
+    # once the upstream got them, so a review is never inserted twice.
+    adapter = _UpstreamHTTPAdapter(
+        retries=options["MAX_RETRIES"],
+        backoff_factor=options["BACKOFF_FACTOR"],
+        pool_connections=options["POOL_CONNECTIONS"],
+        pool_maxsize=options["POOL_MAXSIZE"],
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session(url):
+    """
+    Returns the pooled, keep-alive session for the host of ``url``.
+
+    One ``requests.Session`` is kept per scheme and host so that connections
+    (and TLS handshakes) are reused across requests handled by this worker.
+
+    Args:
+        url (str): Any URL on the target host.
+
+    Returns:
+        requests.Session: The session for that host.
+    """
+    parts = urlsplit(url)
+    host = f"{parts.scheme}://{parts.netloc}"
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _sessions[host] = _build_session()
+    return session
+
+
+def close_sessions():
+    """Closes every pooled session and its idle connections."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def _reset_sessions_after_fork():
+    # Sockets must never be shared between a parent and its forked workers.
+    _sessions.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sessions_after_fork)
+
+
+class SentimentCache:
+    """
+    Two-tier cache of sentiment labels keyed by a hash of the review text.
+
+    The first tier is a thread-safe, size-bounded LRU that lives in the worker
+    process. The second, optional tier is any Django cache alias (for example a
+    database-backed cache shared by all gunicorn workers). Both tiers expire
+    entries after ``ttl`` seconds.
+
+    Args:
+        max_entries (int): Maximum number of entries kept in the in-process tier.
+        ttl (int): Time to live of an entry, in seconds.
+        shared_alias (str or None): Name of the Django cache used as shared
+                                    tier, or None to disable it.
+    """
+
+    key_prefix = "sentiment:"
+
+    def __init__(self, max_entries=10000, ttl=86400, shared_alias=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.shared_alias = shared_alias
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def key_for(cls, text):
+        """Return the cache key for a review text."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{cls.key_prefix}{digest}"
+
+    @property
+    def shared(self):
+        """The Django cache used as shared tier, or None if disabled."""
+        if not self.shared_alias:
+            return None
+        return caches[self.shared_alias]
+
+    def get_many(self, texts):
+        """
+        Look up the sentiment of several texts.
+
+        Args:
+            texts (iterable[str]): Review texts to look up.
+
+        Returns:
+            dict: Mapping of text to sentiment label for every text found in
+                  either tier. Texts missing from both tiers are omitted.
+        """
+        found = {}
+        pending = {}
+        now = time.monotonic()
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                key = self.key_for(text)
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end(key)
+                    self.local_hits += 1
+                    found[text] = entry[0]
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    pending[key] = text
+
+        if pending and self.shared is not None:
+            try:
+                shared_found = self.shared.get_many(list(pending))
+            except Exception as e:
+                logger.warning(f"Shared sentiment cache lookup failed: {str(e)}")
+                shared_found = {}
+            self._store_local(shared_found)
+            for key, sentiment in shared_found.items():
+                found[pending.pop(key)] = sentiment
+            with self._lock:
+                self.shared_hits += len(shared_found)
+
+        with self._lock:
+            self.misses += len(pending)
+        return found
+
+    def set_many(self, mapping):
+        """
+        Store sentiment labels in both tiers.
+
+        Args:
+            mapping (dict): Mapping of review text to sentiment label.
+        """
+        entries = {self.key_for(text): sentiment for text, sentiment in mapping.items()}
+        self._store_local(entries)
+        if entries and self.shared is not None:
+            try:
+                self.shared.set_many(entries, timeout=self.ttl)
+            except Exception as e:
+                logger.warning(f"Shared sentiment cache update failed: {str(e)}")
+
+    def _store_local(self, entries):
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            for key, sentiment in entries.items():
+                self._entries[key] = (sentiment, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry from the in-process tier and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.local_hits = self.shared_hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Return the cache counters of this worker process.
+
+        Returns:
+            dict: Hits per tier, misses, evictions, current size and hit ratio.
+        """
+        with self._lock:
+            hits = self.local_hits + self.shared_hits
+            lookups = hits + self.misses
+            return {
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+            }
+
+
+def _build_sentiment_cache():
+    options = getattr(settings, "SENTIMENT_CACHE", {})
+    return SentimentCache(
+        max_entries=options.get("MAX_ENTRIES", 10000),
+        ttl=options.get("TTL", 86400),
+        shared_alias=options.get("SHARED_CACHE"),
+    )
+
+
+sentiment_cache = _build_sentiment_cache()
+
+
+class _Flight:
+    """An in-progress upstream fetch that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+
+
+class ReadThroughCache:
+    """
+    Read-through cache for backend GET responses.
+
+    Entries are stored in a shared Django cache together with the time they
+    stop being fresh. A fresh entry is returned as is; a stale entry is still
+    returned immediately while a single background fetch refreshes it
+    (stale-while-revalidate). On a miss, concurrent callers for the same key
+    share one upstream fetch (single-flight) instead of each calling the
+    backend. Failed fetches (None) are never cached.
+
+    Args:
+        alias (str): Name of the Django cache holding the entries.
+        ttls (dict): Fresh lifetime in seconds per endpoint name (the first
+                     path segment, e.g. 'fetchDealers').
+        default_ttl (int): Fresh lifetime of endpoints missing from ``ttls``.
+        stale_ttl (int): How long past its freshness an entry may be served
+                         while it is being revalidated.
+    """
+
+    key_prefix = "upstream:"
+
+    def __init__(self, alias, ttls=None, default_ttl=300, stale_ttl=3600):
+        self.alias = alias
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._async_flights = weakref.WeakKeyDictionary()
+        self._background_tasks = set()
+
+    @property
+    def cache(self):
+        """The Django cache holding the entries."""
+        return caches[self.alias]
+
+    @classmethod
+    def key_for(cls, endpoint):
+        """Return the cache key for a backend endpoint."""
+        endpoint = endpoint.strip("/")
+        digest = hashlib.sha256(endpoint.encode("utf-8")).hexdigest()
+        return f"{cls.key_prefix}{digest}"
+
+    def ttl_for(self, endpoint):
+        """Return the fresh lifetime, in seconds, of a backend endpoint."""
+        name = endpoint.strip("/").split("/", 1)[0]
+        return self.ttls.get(name, self.default_ttl)
+
+    def _entry(self, endpoint, value):
+        return {"value": value, "fresh_until": time.time() + self.ttl_for(endpoint)}
+
+    def _timeout(self, endpoint):
+        return self.ttl_for(endpoint) + self.stale_ttl
+
+    def _read(self, key):
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache lookup failed: {str(e)}")
+            return None
+
+    def _write(self, key, endpoint, value):
+        try:
+            self.cache.set(key, self._entry(endpoint, value), self._timeout(endpoint))
+        except Exception as e:
+            logger.warning(f"Response cache update failed: {str(e)}")
+
+    def get(self, endpoint, loader):
+        """
+        Return the response of ``endpoint``, calling ``loader`` only if needed.
+
+        Args:
+            endpoint (str): Backend endpoint, used as cache key.
+            loader (callable): Called with no arguments to fetch the response
+                               from the backend; returns None on failure.
+
+        Returns:
+            The cached or freshly loaded response, or None if it could not be
+            loaded.
+        """
+        key = self.key_for(endpoint)
+        entry = self._read(key)
+        if entry is not None:
+            if entry["fresh_until"] <= time.time():
+                self._revalidate(key, endpoint, loader)
+            return entry["value"]
+        return self._load(key, endpoint, loader)
+
+    def _load(self, key, endpoint, loader):
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait(timeout=sum(request_timeout()))
+            return flight.value
+
+        try:
+            flight.value = loader()
+            if flight.value is not None:
+                self._write(key, endpoint, flight.value)
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.value
+
+    def refresh(self, endpoint, loader):
+        """
+        Reload ``endpoint`` now, replacing any cached response.
+
+        Returns:
+            The freshly loaded response, or None if it could not be loaded.
+        """
+        return self._load(self.key_for(endpoint), endpoint, loader)
+
+    def _revalidate(self, key, endpoint, loader):
+        with self._lock:
+            if key in self._flights:
+                return
+        threading.Thread(
+            target=self._revalidate_in_thread,
+            args=(key, endpoint, loader),
+            name=f"revalidate {endpoint}",
+            daemon=True,
+        ).start()
+
+    def _revalidate_in_thread(self, key, endpoint, loader):
+        try:
+            self._load(key, endpoint, loader)
+        except Exception as e:
+            logger.error(f"Response cache revalidation failed: {str(e)}")
+        finally:
+            # A database cache write opened connections owned by this thread
+            connections.close_all()
+
+    async def aget(self, endpoint, loader):
+        """
+        Async variant of ``get``; ``loader`` is a coroutine function.
+        """
+        key = self.key_for(endpoint)
+        entry = await sync_to_async(self._read)(key)
+        if entry is not None:
+            if entry["fresh_until"] <= time.time():
+                self._arevalidate(key, endpoint, loader)
+            return entry["value"]
+        return await self._aload(key, endpoint, loader)
+
+    def _loop_flights(self):
+        loop = asyncio.get_running_loop()
+        return self._async_flights.setdefault(loop, {})
+
+    async def _aload(self, key, endpoint, loader):
+        flights = self._loop_flights()
+        flight = flights.get(key)
+        if flight is not None:
+            return await asyncio.shield(flight)
+
+        flight = flights[key] = asyncio.get_running_loop().create_future()
+        value = None
+        try:
+            value = await loader()
+            if value is not None:
+                await sync_to_async(self._write)(key, endpoint, value)
+        finally:
+            del flights[key]
+            flight.set_result(value)
+        return value
+
+    def _arevalidate(self, key, endpoint, loader):
+        if key in self._loop_flights():
+            return
+        task = asyncio.create_task(self._aload(key, endpoint, loader))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def invalidate(self, endpoint=None):
+        """
+        Drop cached responses.
+
+        Args:
+            endpoint (str or None): Backend endpoint to drop, or None to drop
+                                    every cached response.
+        """
+        if endpoint is None:
+            self.cache.clear()
+        else:
+            self.cache.delete(self.key_for(endpoint))
+
+
+def _build_response_cache():
+    options = getattr(settings, "RESPONSE_CACHE", {})
+    return ReadThroughCache(
+        alias=options.get("ALIAS", "default"),
+        ttls=options.get("TTLS"),
+        default_ttl=options.get("DEFAULT_TTL", 300),
+        stale_ttl=options.get("STALE_TTL", 3600),
+    )
+
+
+response_cache = _build_response_cache()
+
+
+def _build_backend_url(endpoint, **kwargs):
+    params = ""
+    if kwargs:
+        for key, value in kwargs.items():
+            params += f"{key}={value}&"
+        # Remove trailing '&' if exists
+        params = params.rstrip("&")
+
+    return (
+        f"{backend_url}/{endpoint}?{params}" if params else f"{backend_url}/{endpoint}"
+    )
+
 
 def get_request(endpoint, **kwargs):
     """
@@ -75,20 +914,11 @@ def get_request(endpoint, **kwargs):
         # Makes request to: http://localhost:3030/fetchReviews?dealer_id=123
         # Returns: {'reviews': [...]} or None if failed
     """
-    params = ""
-    if kwargs:
-        for key, value in kwargs.items():
-            params += f"{key}={value}&"
-        # Remove trailing '&' if exists
-        params = params.rstrip("&")
-
-    request_url = (
-        f"{backend_url}/{endpoint}?{params}" if params else f"{backend_url}/{endpoint}"
-    )
+    request_url = _build_backend_url(endpoint, **kwargs)
     logger.info(f"Request URL: {request_url}")
 
     try:
-        response = requests.get(request_url, timeout=10)  # Add timeout
+        response = get_session(request_url).get(request_url, timeout=request_timeout())
         response.raise_for_status()  # Raise exception for bad status codes
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -99,29 +929,59 @@ def get_request(endpoint, **kwargs):
         return None
 
 
+def get_request_cached(endpoint):
+    """
+    Makes a GET request to the backend through the read-through response cache.
+
+    Args:
+        endpoint (str): The API endpoint to call (e.g., 'fetchDealers', 'fetchDealer/3')
+
+    Returns:
+        dict or None: The cached or fresh JSON response, None if it cannot be fetched
+
+    Example:
+        >>> get_request_cached('fetchDealer/3')
+        # Served from the cache while fresh; refreshed in the background once
+        # stale; only one concurrent backend call on a cold key.
+    """
+    return response_cache.get(endpoint, lambda: get_request(endpoint))
+
+
 def analyze_review_sentiments(text):
     """
     Analyzes the sentiment of a given review text using the sentiment analyzer service.
 
+    The text is sent in the JSON body of POST /analyze, so reviews of any
+    length, or containing ``/``, ``?`` or ``#``, are analyzed as written.
+
     Args:
         text (str): The review text to analyze. Should be a string containing the review content.
 
     Returns:
         dict or None: A dictionary containing sentiment analysis results if successful.
-                     Expected format: {'sentiment': 'positive/negative/neutral', 'score': float}
+                     Expected format: {'sentiment': 'positive/negative/neutral',
+                     'compound': float, 'pos': float, 'neg': float, 'neu': float}.
+                     The scores are not cached, so every call asks the
+                     service; the label it returns is stored in the
+                     sentiment cache for the batch functions.
                      Returns None if the request fails or response cannot be parsed.
 
     Example:
         >>> analyze_review_sentiments("Great service and friendly staff!")
-        {'sentiment': 'positive', 'score': 0.8}
+        {'sentiment': 'positive', 'compound': 0.8221, 'pos': 0.717, 'neg': 0.0, 'neu': 0.283}
         >>> analyze_review_sentiments("Poor experience")
-        {'sentiment': 'negative', 'score': -0.6}
+        {'sentiment': 'negative', 'compound': -0.4767, 'pos': 0.0, 'neg': 0.756, 'neu': 0.244}
     """
-    request_url = f"{sentiment_analyzer_url}/analyze/{text}"
+    request_url = f"{sentiment_analyzer_url.rstrip('/')}/analyze"
     try:
-        response = requests.get(request_url, timeout=10)  # Add timeout
+        response = get_session(request_url).post(
+            request_url, json={"text": text}, timeout=request_timeout()
+        )
         response.raise_for_status()  # Raise exception for bad status codes
-        return response.json()
+        result = response.json()
+        if "sentiment" in result:
+            sentiment_cache.set_many({text: result["sentiment"]})
+        return result
     except requests.exceptions.RequestException as e:
         logger.error(f"Request failed: {str(e)}")
         return None
@@ -130,6 +990,121 @@ def analyze_review_sentiments(text):
         return None
 
 
+def analyze_review_sentiments_batch(texts):
+    """
+    Analyzes the sentiment of several review texts with a single request.
+
+    Texts already present in the sentiment cache are not sent to the service;
+    only the distinct cache misses are analyzed, and their results are cached.
+
+    Args:
+        texts (list[str]): The review texts to analyze.
+
+    Returns:
+        list[str] or None: One sentiment label per text, in the same order as
+                           ``texts``. Returns None if the request fails, the
+                           response cannot be parsed or its length does not
+                           match the input.
+
+    Example:
+        >>> analyze_review_sentiments_batch(["Great service!", "Poor experience"])
+        ['positive', 'negative']
+    """
+    if not texts:
+        return []
+
+    known = sentiment_cache.get_many(texts)
+    missing = [text for text in dict.fromkeys(texts) if text not in known]
+    if not missing:
+        return [known[text] for text in texts]
+
+    request_url = f"{sentiment_analyzer_url.rstrip('/')}/analyze/batch"
+    try:
+        response = get_session(request_url).post(
+            request_url, json={"texts": missing}, timeout=request_timeout()
+        )
+        response.raise_for_status()
+        sentiments = response.json()["sentiments"]
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Request failed: {str(e)}")
+        return None
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Failed to parse JSON response: {str(e)}")
+        return None
+
+    if len(sentiments) != len(missing):
+        logger.error(
+            f"Sentiment batch size mismatch: sent {len(missing)}, got {len(sentiments)}"
+        )
+        return None
+
+    analyzed = dict(zip(missing, sentiments))
+    sentiment_cache.set_many(analyzed)
+    known.update(analyzed)
+    return [known[text] for text in texts]
+
+
+def score_review_sentiments(texts):
+    """
+    Scores review texts, returning both the sentiment label and VADER compound score.
+
+    Used on the write path (add_review and the sentiment backfill) where the
+    scores are stored with the review. The labels are also added to the
+    sentiment cache.
+
+    Args:
+        texts (list[str]): The review texts to score.
+
+    Returns:
+        list[dict] or None: One {'sentiment': str, 'compound': float} per text,
+                            in order, or None if the request fails.
+
+    Example:
+        >>> score_review_sentiments(["Great service!"])
+        [{'sentiment': 'positive', 'compound': 0.6588}]
+    """
+    if not texts:
+        return []
+
+    request_url = f"{sentiment_analyzer_url.rstrip('/')}/analyze/batch"
+    try:
+        response = get_session(request_url).post(
+            request_url, json={"texts": list(texts)}, timeout=request_timeout()
+        )
+        response.raise_for_status()
+        payload = response.json()
+        scores = [
+            {"sentiment": sentiment, "compound": compound}
+            for sentiment, compound in zip(payload["sentiments"], payload["compounds"])
+        ]
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Request failed: {str(e)}")
+        return None
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"Failed to parse JSON response: {str(e)}")
+        return None
+
+    if len(scores) != len(texts):
+        logger.error(
+            f"Sentiment batch size mismatch: sent {len(texts)}, got {len(scores)}"
+        )
+        return None
+    sentiment_cache.set_many(
+        {text: score["sentiment"] for text, score in zip(texts, scores)}
+    )
+    return scores
+
+
+def get_sentiment_cache_stats():
+    """
+    Returns the hit/miss counters of the sentiment cache for this worker.
+
+    Returns:
+        dict: See ``SentimentCache.stats``.
+    """
+    return sentiment_cache.stats()
+
+
 def post_review(endpoint, data_dict):
     """
     Sends a POST request to the specified backend API endpoint with the provided data.
@@ -150,7 +1125,9 @@ def post_review(endpoint, data_dict):
 
     request_url = f"{backend_url}/{endpoint}"
     try:
-        response = requests.post(request_url, json=data_dict, timeout=10)  # Add timeout
+        response = get_session(request_url).post(
+            request_url, json=data_dict, timeout=request_timeout()
+        )
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -159,3 +1136,136 @@ def post_review(endpoint, data_dict):
     except ValueError as e:
         logger.error(f"Failed to parse JSON response: {str(e)}")
         return None
+
+
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_client():
+    """
+    Returns the pooled ``httpx.AsyncClient`` for the running event loop.
+
+    httpx clients are bound to the loop they were first used on, so one client
+    is kept per loop; under uvicorn this is a single long-lived client per
+    worker.
+
+    Returns:
+        httpx.AsyncClient: The client for the current event loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        options = _http_options()
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                options["READ_TIMEOUT"], connect=options["CONNECT_TIMEOUT"]
+            ),
+            limits=httpx.Limits(
+                max_connections=options["SENTIMENT_CONCURRENCY"]
+                + options["POOL_MAXSIZE"],
+                max_keepalive_connections=options["SENTIMENT_CONCURRENCY"],
+            ),
+            transport=_UpstreamAsyncTransport(
+                retries=options["MAX_RETRIES"],
+                backoff_factor=options["BACKOFF_FACTOR"],
+            ),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def get_request_async(endpoint, **kwargs):
+    """
+    Async variant of ``get_request``.
+
+    Args:
+        endpoint (str): The API endpoint to call (e.g., 'fetchReviews', 'fetchDealers')
+        **kwargs: Optional keyword arguments converted to URL query parameters
+
+    Returns:
+        dict or None: JSON response from the API if successful, None if request fails
+    """
+    request_url = _build_backend_url(endpoint, **kwargs)
+    logger.info(f"Request URL: {request_url}")
+
+    try:
+        response = await get_async_client().get(request_url)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPError as e:
+        logger.error(f"Request failed: {str(e)}")
+        return None
+    except ValueError as e:
+        logger.error(f"Failed to parse JSON response: {str(e)}")
+        return None
+
+
+async def get_request_cached_async(endpoint):
+    """
+    Async variant of ``get_request_cached``.
+    """
+    return await response_cache.aget(endpoint, lambda: get_request_async(endpoint))
+
+
+async def _analyze_chunk_async(texts, semaphore):
+    request_url = f"{sentiment_analyzer_url.rstrip('/')}/analyze/batch"
+    async with semaphore:
+        try:
+            response = await get_async_client().post(request_url, json={"texts": texts})
+            response.raise_for_status()
+            sentiments = response.json()["sentiments"]
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {str(e)}")
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            logger.error(f"Failed to parse JSON response: {str(e)}")
+            return None
+
+    if len(sentiments) != len(texts):
+        logger.error(
+            f"Sentiment batch size mismatch: sent {len(texts)}, got {len(sentiments)}"
+        )
+        return None
+    return sentiments
+
+
+async def analyze_review_sentiments_batch_async(texts):
+    """
+    Async variant of ``analyze_review_sentiments_batch``.
+
+    Cache misses are split into chunks of ``SENTIMENT_CHUNK_SIZE`` texts that
+    are sent to the sentiment service concurrently, at most
+    ``SENTIMENT_CONCURRENCY`` at a time, so the call takes roughly the latency
+    of the slowest chunk instead of the sum of all of them.
+
+    Args:
+        texts (list[str]): The review texts to analyze.
+
+    Returns:
+        list[str] or None: One sentiment label per text, in the same order as
+                           ``texts``, or None if any chunk fails.
+    """
+    if not texts:
+        return []
+
+    known = await sync_to_async(sentiment_cache.get_many)(texts)
+    missing = [text for text in dict.fromkeys(texts) if text not in known]
+    if not missing:
+        return [known[text] for text in texts]
+
+    options = _http_options()
+    chunk_size = max(1, options["SENTIMENT_CHUNK_SIZE"])
+    semaphore = asyncio.Semaphore(max(1, options["SENTIMENT_CONCURRENCY"]))
+    chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+    results = await asyncio.gather(
+        *(_analyze_chunk_async(chunk, semaphore) for chunk in chunks)
+    )
+    if any(result is None for result in results):
+        return None
+
+    analyzed = {}
+    for chunk, sentiments in zip(chunks, results):
+        analyzed.update(zip(chunk, sentiments))
+    await sync_to_async(sentiment_cache.set_many)(analyzed)
+    known.update(analyzed)
+    return [known[text] for text in texts]
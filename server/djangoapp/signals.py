@@ -0,0 +1,20 @@
+"""
+Signal receivers for the Car Dealership application.
+
+Keeps the cached car catalog (see ``djangoapp.catalog``) in sync with the
+CarMake and CarModel tables.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .catalog import invalidate_catalog
+from .models import CarMake, CarModel
+
+
+@receiver(post_save, sender=CarMake)
+@receiver(post_delete, sender=CarMake)
+@receiver(post_save, sender=CarModel)
+@receiver(post_delete, sender=CarModel)
+def invalidate_car_catalog(sender, **kwargs):
+    invalidate_catalog()
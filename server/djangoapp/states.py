@@ -0,0 +1,88 @@
+"""
+US State Names and Codes
+
+This module maps the state names used by the dealership data
+(``database/data/dealerships.json``) to their 2-letter postal codes, so that
+state filters can be sent to the backend as exact, indexed lookups.
+"""
+
+US_STATES = {
+    "Alabama": "AL",
+    "Alaska": "AK",
+    "Arizona": "AZ",
+    "Arkansas": "AR",
+    "California": "CA",
+    "Colorado": "CO",
+    "Connecticut": "CT",
+    "Delaware": "DE",
+    "District of Columbia": "DC",
+    "Florida": "FL",
+    "Georgia": "GA",
+    "Hawaii": "HI",
+    "Idaho": "ID",
+    "Illinois": "IL",
+    "Indiana": "IN",
+    "Iowa": "IA",
+    "Kansas": "KS",
+    "Kentucky": "KY",
+    "Louisiana": "LA",
+    "Maine": "ME",
+    "Maryland": "MD",
+    "Massachusetts": "MA",
+    "Michigan": "MI",
+    "Minnesota": "MN",
+    "Mississippi": "MS",
+    "Missouri": "MO",
+    "Montana": "MT",
+    "Nebraska": "NE",
+    "Nevada": "NV",
+    "New Hampshire": "NH",
+    "New Jersey": "NJ",
+    "New Mexico": "NM",
+    "New York": "NY",
+    "North Carolina": "NC",
+    "North Dakota": "ND",
+    "Ohio": "OH",
+    "Oklahoma": "OK",
+    "Oregon": "OR",
+    "Pennsylvania": "PA",
+    "Rhode Island": "RI",
+    "South Carolina": "SC",
+    "South Dakota": "SD",
+    "Tennessee": "TN",
+    "Texas": "TX",
+    "Utah": "UT",
+    "Vermont": "VT",
+    "Virginia": "VA",
+    "Washington": "WA",
+    "West Virginia": "WV",
+    "Wisconsin": "WI",
+    "Wyoming": "WY",
+}
+
+_CODES_BY_NAME = {name.lower(): code for name, code in US_STATES.items()}
+_CODES = set(US_STATES.values())
+
+
+def normalize_state(value):
+    """
+    Return the 2-letter code of a state given its name or code.
+
+    Matching ignores case and surrounding/repeated whitespace.
+
+    Args:
+        value (str): State name (e.g. 'new york') or code (e.g. 'ny').
+
+    Returns:
+        str or None: The upper-case state code, or None if unknown.
+
+    Example:
+        >>> normalize_state("  New   York ")
+        'NY'
+        >>> normalize_state("tx")
+        'TX'
+    """
+    cleaned = " ".join(str(value).split())
+    if cleaned.upper() in _CODES:
+        return cleaned.upper()
+    return _CODES_BY_NAME.get(cleaned.lower())
@@ -0,0 +1,223 @@
+"""
+Background Task Queue
+
+This module implements a small task queue stored in the Django database (the
+``Task`` model), so slow side-effects such as sentiment scoring can run
+outside the request/response cycle.
+
+Key Features:
+1. Registration and scheduling:
+   - @task: Registers a function as a task under its name
+   - enqueue / <task>.delay: Stores a task to be run by a worker
+2. Execution (see the run_tasks management command):
+   - claim_next: Atomically claims the next due task; safe with several
+     workers, including on SQLite (conditional UPDATE instead of row locks)
+   - run_task: Runs a claimed task, retrying failures with exponential
+     backoff and dead-lettering it (status DEAD) after max_attempts
+   - Tasks left RUNNING by a crashed worker are reclaimed after
+     settings.TASK_QUEUE["VISIBILITY_TIMEOUT"] seconds, or dead-lettered
+     if they have already used all their attempts
+3. Retention:
+   - purge_tasks: Deletes DONE and DEAD tasks last updated more than
+     settings.TASK_QUEUE["RETENTION"] seconds ago
+
+Task payloads must be JSON serializable.
+
+Example Usage:
+    @task(max_attempts=3)
+    def send_email(address):
+        ...
+
+    send_email.delay(address="john@example.com")
+"""
+
+from datetime import timedelta
+import logging
+import traceback
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Task
+from .restapis import (
+    post_review,
+    response_cache,
+    score_review_sentiments,
+)
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+
+
+def _options():
+    options = {
+        "RETRY_BACKOFF": 5,  # seconds, doubled after every failed attempt
+        "MAX_RETRY_DELAY": 60 * 60,
+        "VISIBILITY_TIMEOUT": 60 * 5,
+        "RETENTION": 60 * 60 * 24 * 7,
+    }
+    options.update(getattr(settings, "TASK_QUEUE", {}))
+    return options
+
+
+def task(max_attempts=5):
+    """
+    Register the decorated function as a task.
+
+    The function gains a ``delay(**payload)`` attribute that enqueues it.
+
+    Args:
+        max_attempts (int): Attempts before the task is dead-lettered.
+    """
+
+    def decorator(func):
+        name = func.__name__
+        _registry[name] = func
+        func.max_attempts = max_attempts
+        func.delay = lambda **payload: enqueue(name, **payload)
+        return func
+
+    return decorator
+
+
+def enqueue(name, run_at=None, **payload):
+    """
+    Store a task to be run by a worker.
+
+    Args:
+        name (str): Name of a registered task.
+        run_at (datetime or None): Earliest run time; defaults to now.
+        **payload: JSON serializable keyword arguments of the task.
+
+    Returns:
+        Task: The stored task.
+    """
+    if name not in _registry:
+        raise ValueError(f"Unknown task: {name}")
+    return Task.objects.create(
+        name=name,
+        payload=payload,
+        max_attempts=_registry[name].max_attempts,
+        run_at=run_at or timezone.now(),
+    )
+
+
+def claim_next():
+    """
+    Claim the next due task for the calling worker.
+
+    Returns:
+        Task or None: The claimed task (status RUNNING), or None if no task is due.
+    """
+    options = _options()
+    while True:
+        now = timezone.now()
+        expired = now - timedelta(seconds=options["VISIBILITY_TIMEOUT"])
+        candidate = (
+            Task.objects.filter(
+                Q(status="QUEUED", run_at__lte=now)
+                | Q(status="RUNNING", locked_at__lt=expired)
+            )
+            .order_by("run_at", "id")
+            .values_list("id", "status", "locked_at", "attempts", "max_attempts")
+            .first()
+        )
+        if candidate is None:
+            return None
+
+        pk, status, locked_at, attempts, max_attempts = candidate
+        unclaimed = Task.objects.filter(id=pk, status=status, locked_at=locked_at)
+        if status == "RUNNING" and attempts >= max_attempts:
+            # The worker running the last attempt never reported back
+            if unclaimed.update(
+                status="DEAD",
+                locked_at=None,
+                last_error=f"Visibility timeout expired on attempt {attempts}",
+                updated_at=now,
+            ):
+                logger.error(f"Task {pk} timed out after {attempts} attempts")
+            continue
+
+        claimed = unclaimed.update(
+            status="RUNNING",
+            locked_at=now,
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+        if claimed:
+            return Task.objects.get(id=pk)
+        # Another worker claimed it first; look for the next one
+
+
+def run_task(claimed):
+    """
+    Run a claimed task and record its outcome.
+
+    Args:
+        claimed (Task): A task returned by ``claim_next``.
+
+    Returns:
+        str: The resulting status: DONE, QUEUED (retry scheduled) or DEAD.
+    """
+    func = _registry.get(claimed.name)
+    try:
+        if func is None:
+            raise LookupError(f"Unknown task: {claimed.name}")
+        func(**claimed.payload)
+    except Exception as e:
+        logger.error(f"Task {claimed} failed: {str(e)}")
+        claimed.last_error = traceback.format_exc()
+        claimed.locked_at = None
+        if func is None or claimed.attempts >= claimed.max_attempts:
+            claimed.status = "DEAD"
+        else:
+            options = _options()
+            delay = min(
+                options["RETRY_BACKOFF"] * 2 ** (claimed.attempts - 1),
+                options["MAX_RETRY_DELAY"],
+            )
+            claimed.status = "QUEUED"
+            claimed.run_at = timezone.now() + timedelta(seconds=delay)
+        claimed.save(
+            update_fields=["status", "run_at", "locked_at", "last_error", "updated_at"]
+        )
+        return claimed.status
+
+    claimed.status = "DONE"
+    claimed.locked_at = None
+    claimed.save(update_fields=["status", "locked_at", "updated_at"])
+    return claimed.status
+
+
+def purge_tasks():
+    """
+    Delete finished tasks older than settings.TASK_QUEUE["RETENTION"].
+
+    Returns:
+        int: Number of tasks deleted.
+    """
+    cutoff = timezone.now() - timedelta(seconds=_options()["RETENTION"])
+    deleted, _ = Task.objects.filter(
+        status__in=("DONE", "DEAD"), updated_at__lt=cutoff
+    ).delete()
+    return deleted
+
+
+@task(max_attempts=5)
+def score_review_sentiment(review_id, text, dealer_id=None):
+    """
+    Score a stored review, save its sentiment in the backend and drop the
+    dealer's cached review list.
+    """
+    scores = score_review_sentiments([text])
+    if scores is None:
+        raise RuntimeError("Sentiment service unavailable")
+    response = post_review(
+        "update_review_sentiments", {"reviews": [{"id": review_id, **scores[0]}]}
+    )
+    if response is None:
+        raise RuntimeError("Failed to store review sentiment")
+    if dealer_id is not None:
+        response_cache.invalidate(f"fetchReviews/dealer/{dealer_id}")
@@ -0,0 +1,904 @@
+"""
+Tests for the Car Dealership application.
+
+Run from the server/ directory:
+    $ python manage.py test djangoapp
+"""
+
+import asyncio
+import csv
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management import call_command
+from django.db import DatabaseError, connection, connections
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.test.client import AsyncRequestFactory, RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+import requests
+from requests.adapters import HTTPAdapter
+
+from benchmarks.stubs import start_backend, start_sentiment
+from djangoapp import populate, restapis, tracing, views
+from djangoapp.accounts import import_users
+from djangoapp.catalog import build_catalog, get_catalog_page
+from djangoapp.models import CarMake, CarModel, Task
+from djangoapp.resilience import HALF_OPEN, OPEN, remaining_budget, upstream_budget
+from djangoapp.tasks import claim_next, purge_tasks, run_task
+
+UPSTREAM_HTTP = {
+    "CONNECT_TIMEOUT": 1,
+    "READ_TIMEOUT": 5,
+    "MAX_RETRIES": 2,
+    "BACKOFF_FACTOR": 0.05,
+    "BREAKER_FAILURE_THRESHOLD": 100,
+}
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@override_settings(UPSTREAM_HTTP=UPSTREAM_HTTP)
+class UpstreamRetryTests(SimpleTestCase):
+    """Retries of upstream calls and the request time budget."""
+
+    budget = 1.0
+    slack = 0.5  # seconds of scheduling and connection setup allowed
+
+    def setUp(self):
+        restapis.close_sessions()
+        restapis._breakers.clear()
+        self.addCleanup(restapis.close_sessions)
+        self.addCleanup(restapis._breakers.clear)
+
+    def use_backend(self, url):
+        patcher = mock.patch.object(restapis, "backend_url", url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def start_slow_backend(self, latency_ms):
+        server = start_backend(latency=latency_ms)
+        self.addCleanup(server.shutdown)
+        self.use_backend(f"http://127.0.0.1:{server.server_address[1]}")
+
+    def test_slow_backend_stays_within_budget(self):
+        self.start_slow_backend(latency_ms=3000)
+        started = time.perf_counter()
+        with upstream_budget(self.budget):
+            result = restapis.get_request("fetchDealers")
+        elapsed = time.perf_counter() - started
+        self.assertIsNone(result)
+        self.assertLess(elapsed, self.budget + self.slack)
+
+    def test_slow_backend_stays_within_budget_async(self):
+        self.start_slow_backend(latency_ms=3000)
+
+        async def call():
+            with upstream_budget(self.budget):
+                return await restapis.get_request_async("fetchDealers")
+
+        started = time.perf_counter()
+        result = asyncio.run(call())
+        elapsed = time.perf_counter() - started
+        self.assertIsNone(result)
+        self.assertLess(elapsed, self.budget + self.slack)
+
+    def test_failed_get_is_retried_and_counted_once(self):
+        self.use_backend(f"http://127.0.0.1:{_closed_port()}")
+        with mock.patch.object(
+            HTTPAdapter, "send", side_effect=requests.ConnectionError("refused")
+        ) as send:
+            self.assertIsNone(restapis.get_request("fetchDealers"))
+        self.assertEqual(send.call_count, 3)
+        self.assertEqual(restapis.get_breaker("backend").stats()["failures"], 1)
+
+    def test_failed_get_is_counted_once_async(self):
+        self.use_backend(f"http://127.0.0.1:{_closed_port()}")
+        self.assertIsNone(asyncio.run(restapis.get_request_async("fetchDealers")))
+        self.assertEqual(restapis.get_breaker("backend").stats()["failures"], 1)
+
+    def test_cancelled_probe_is_released(self):
+        self.start_slow_backend(latency_ms=3000)
+        breaker = restapis.get_breaker("backend")
+        breaker.state = OPEN
+        breaker._opened_at = time.monotonic() - breaker.reset_timeout
+
+        async def cancel_call():
+            call = asyncio.create_task(restapis.get_request_async("fetchDealers"))
+            await asyncio.sleep(0.2)
+            call.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await call
+
+        asyncio.run(cancel_call())
+        self.assertEqual(breaker.stats()["failures"], 0)
+        self.assertEqual(breaker.stats()["state"], HALF_OPEN)
+        self.assertTrue(breaker.allow())
+
+    def test_invalid_request_budget(self):
+        for value in ("", "fast", "0"):
+            self.assertIn(
+                "ImproperlyConfigured: UPSTREAM_REQUEST_BUDGET",
+                settings_error(UPSTREAM_REQUEST_BUDGET=value),
+            )
+        self.assertIsNone(settings_error(UPSTREAM_REQUEST_BUDGET="none"))
+
+    def test_fast_backend_answers(self):
+        self.start_slow_backend(latency_ms=0)
+        with upstream_budget(self.budget):
+            dealers = restapis.get_request("fetchDealers")
+        self.assertTrue(dealers)
+
+
+class SentimentTests(SimpleTestCase):
+    """Single review analysis through the sentiment service."""
+
+    def setUp(self):
+        server = start_sentiment()
+        self.addCleanup(server.shutdown)
+        patcher = mock.patch.object(
+            restapis,
+            "sentiment_analyzer_url",
+            f"http://127.0.0.1:{server.server_address[1]}/",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        restapis.sentiment_cache.clear()
+        self.addCleanup(restapis.sentiment_cache.clear)
+
+    def test_result_has_the_same_shape_when_cached(self):
+        first = restapis.analyze_review_sentiments("Great service!")
+        self.assertEqual(set(first), {"sentiment", "compound", "pos", "neg", "neu"})
+        self.assertEqual(restapis.analyze_review_sentiments("Great service!"), first)
+        self.assertEqual(
+            restapis.analyze_review_sentiments_batch(["Great service!"]),
+            [first["sentiment"]],
+        )
+
+
+class ResponseCacheTests(TransactionTestCase):
+    """Read-through caching of backend responses."""
+
+    def setUp(self):
+        self.cache = restapis.ReadThroughCache("upstream", default_ttl=60)
+        self.addCleanup(self.cache.invalidate)
+
+    def store_stale(self, endpoint, value):
+        self.cache.cache.set(
+            self.cache.key_for(endpoint),
+            {"value": value, "fresh_until": time.time() - 1},
+            600,
+        )
+
+    def join_revalidation(self, endpoint):
+        for thread in threading.enumerate():
+            if thread.name == f"revalidate {endpoint}":
+                thread.join(timeout=5)
+
+    def test_stale_entry_is_served_and_refreshed(self):
+        self.store_stale("fetchDealers", ["old"])
+        closed_in = []
+        close_all = connections.close_all
+
+        def record_close():
+            closed_in.append(threading.current_thread().name)
+            close_all()
+
+        with mock.patch.object(restapis.connections, "close_all", record_close):
+            self.assertEqual(self.cache.get("fetchDealers", lambda: ["new"]), ["old"])
+            self.join_revalidation("fetchDealers")
+        self.assertEqual(self.cache.get("fetchDealers", lambda: None), ["new"])
+        # The refresh thread closed the connection its cache write opened
+        self.assertEqual(closed_in, ["revalidate fetchDealers"])
+
+    def test_loader_error_during_revalidation_keeps_stale_entry(self):
+        self.store_stale("fetchDealers", ["old"])
+
+        def loader():
+            raise RuntimeError("backend exploded")
+
+        with self.assertLogs("djangoapp.restapis", "ERROR") as logs:
+            self.assertEqual(self.cache.get("fetchDealers", loader), ["old"])
+            self.join_revalidation("fetchDealers")
+        self.assertIn("backend exploded", logs.output[0])
+        self.assertEqual(self.cache.get("fetchDealers", lambda: None), ["old"])
+
+    def test_concurrent_misses_share_one_load(self):
+        calls, results = [], []
+        release = threading.Event()
+
+        def loader():
+            calls.append(1)
+            release.wait(timeout=5)
+            return ["dealers"]
+
+        def fetch():
+            try:
+                results.append(self.cache.get("fetchDealers", loader))
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=fetch) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [["dealers"]] * 5)
+
+    def test_failed_load_is_not_cached(self):
+        self.assertIsNone(self.cache.get("fetchDealers", lambda: None))
+        self.assertEqual(
+            self.cache.get("fetchDealers", lambda: ["dealers"]), ["dealers"]
+        )
+
+
+class CatalogPageTests(TestCase):
+    """Keyset pagination of the car catalog."""
+
+    @classmethod
+    def setUpTestData(cls):
+        makes = CarMake.objects.bulk_create(
+            [CarMake(name=f"Page Make {i}") for i in range(5)]
+        )
+        CarModel.objects.bulk_create(
+            [
+                CarModel(
+                    maker=make,
+                    name=f"Model {n}",
+                    year=2015 + n % 11,
+                    type_car=("SEDAN", "SUV", "WAGON")[n % 3],
+                )
+                for make in makes
+                for n in range(40)
+            ]
+        )
+
+    def walk(self, **filters):
+        cars, after = [], None
+        while True:
+            page, after = get_catalog_page(after=after, limit=7, **filters)
+            cars.extend(page)
+            if after is None:
+                return cars
+
+    def expected(self, queryset):
+        return [
+            {"CarModel": name, "CarMake": make}
+            for name, make in queryset.order_by(
+                "-year", "maker_id", "name", "id"
+            ).values_list("name", "maker__name")
+        ]
+
+    def test_pages_cover_the_catalog_in_order(self):
+        self.assertEqual(self.walk(), self.expected(CarModel.objects.all()))
+
+    def test_pages_cover_the_filtered_catalog(self):
+        self.assertEqual(
+            self.walk(make="page make 2", type_car="suv", year_min=2017),
+            self.expected(
+                CarModel.objects.filter(
+                    maker__name="Page Make 2", type_car="SUV", year__gte=2017
+                )
+            ),
+        )
+
+    def test_pages_follow_the_full_catalog_order(self):
+        body, _ = build_catalog()
+        self.assertEqual(self.walk(), json.loads(body)["CarModels"])
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            get_catalog_page(after="not-a-cursor")
+
+    def assert_pages_use_index(self, **filters):
+        _, after = get_catalog_page(limit=7, **filters)
+        for cursor in (None, after):
+            with CaptureQueriesContext(connection) as queries:
+                get_catalog_page(after=cursor, limit=7, **filters)
+            page_queries = [
+                q["sql"] for q in queries if '"djangoapp_carmodel"' in q["sql"]
+            ]
+            self.assertTrue(page_queries)
+            for sql in page_queries:
+                with connection.cursor() as cursor_:
+                    cursor_.execute(f"EXPLAIN QUERY PLAN {sql}")
+                    plan = " | ".join(row[-1] for row in cursor_.fetchall())
+                self.assertRegex(plan, r"carmodel_(catalog|maker|type)_page_idx", sql)
+                self.assertNotIn("TEMP B-TREE", plan, sql)
+
+    def test_pages_are_read_from_the_index(self):
+        self.assert_pages_use_index()
+        self.assert_pages_use_index(type_car="SUV", year_max=2020)
+        self.assert_pages_use_index(make="Page Make 3")
+
+
+class ReadRowsTests(SimpleTestCase):
+    """Streaming catalog rows from JSON documents."""
+
+    def write_json(self, document):
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", delete=False, encoding="utf-8"
+        ) as f:
+            f.write(document)
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def test_json_rows_are_read_in_chunks(self):
+        document = json.dumps(
+            {
+                "meta": {"cars": [0], "total": 12345},
+                "cars": [{"make": "A ]}", "year": 2020.5}, {"make": "B"}, []],
+            }
+        )
+        path = self.write_json(document)
+        for chunk_size in (1, 2, 3, 64):
+            with mock.patch.object(populate, "JSON_CHUNK_SIZE", chunk_size):
+                self.assertEqual(
+                    list(populate.read_rows(path)), json.loads(document)["cars"]
+                )
+
+    def test_json_list_and_missing_key(self):
+        self.assertEqual(list(populate.read_rows(self.write_json("[1, 2]"))), [1, 2])
+        with self.assertRaises(KeyError):
+            list(populate.read_rows(self.write_json('{"rows": []}')))
+        with self.assertRaises(ValueError):
+            list(populate.read_rows(self.write_json('{"cars": [1 2]}')))
+
+
+class RegistrationTests(TransactionTestCase):
+    """User registration through the register view."""
+
+    def register(self, username):
+        return self.client.post(
+            "/djangoapp/register",
+            json.dumps(
+                {
+                    "userName": username,
+                    "password": "Register-Pass-1",
+                    "email": "new@example.com",
+                    "firstName": "New",
+                    "lastName": "User",
+                }
+            ),
+            content_type="application/json",
+        )
+
+    def test_register_and_duplicate(self):
+        response = self.register("newuser")
+        self.assertEqual(
+            response.json(), {"userName": "newuser", "status": "Registered"}
+        )
+        self.assertTrue(
+            User.objects.get(username="newuser").check_password("Register-Pass-1")
+        )
+        response = self.register("newuser")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "User already exists"})
+
+    def test_password_is_hashed_outside_the_transaction(self):
+        in_transaction = []
+
+        def hash_password(password):
+            in_transaction.append(connection.in_atomic_block)
+            return make_password(password)
+
+        with mock.patch("djangoapp.views.make_password", hash_password):
+            self.register("hashed")
+        self.assertEqual(in_transaction, [False])
+
+
+def settings_error(**env):
+    """Import the settings with ``env`` set; return the error, if any."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import djangoproj.settings"],
+        cwd=settings.BASE_DIR,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+    )
+    return result.stderr.strip().splitlines()[-1] if result.returncode else None
+
+
+class AuthenticationSettingsTests(SimpleTestCase):
+    """Password hasher and session engine selection from the environment."""
+
+    def test_defaults(self):
+        self.assertEqual(
+            settings.PASSWORD_HASHERS[0], "djangoapp.hashers.Argon2PasswordHasher"
+        )
+        self.assertEqual(settings.SESSION_ENGINE, "django.contrib.sessions.backends.db")
+
+    def test_unknown_hasher(self):
+        error = settings_error(DJANGO_PASSWORD_HASHER="argon")
+        self.assertIn("ImproperlyConfigured: DJANGO_PASSWORD_HASHER", error)
+        self.assertIn("argon2, scrypt, pbkdf2", error)
+
+    def test_unknown_session_engine(self):
+        error = settings_error(DJANGO_SESSION_ENGINE="redis")
+        self.assertIn("ImproperlyConfigured: DJANGO_SESSION_ENGINE", error)
+
+    def test_cached_sessions_need_a_shared_cache(self):
+        error = settings_error(DJANGO_SESSION_ENGINE="cached_db")
+        self.assertIn("DJANGO_SESSION_CACHE_URL", error)
+        self.assertIsNone(
+            settings_error(
+                DJANGO_SESSION_ENGINE="cached_db",
+                DJANGO_SESSION_CACHE_URL="redis://localhost:6379/1",
+            )
+        )
+
+
+class LoginTests(TestCase):
+    """Login rehashing and logout through the login and logout views."""
+
+    def login(self, username, password):
+        return self.client.post(
+            "/djangoapp/login",
+            json.dumps({"userName": username, "password": password}),
+            content_type="application/json",
+        )
+
+    def test_login_rehashes_pbkdf2_password(self):
+        user = User.objects.create(
+            username="legacy",
+            password=make_password("Legacy-Pass-1", hasher="pbkdf2_sha256"),
+        )
+        response = self.login("legacy", "Legacy-Pass-1")
+        self.assertEqual(response.json()["status"], "Authenticated")
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith("argon2$"))
+        self.assertTrue(user.check_password("Legacy-Pass-1"))
+
+    def test_wrong_password_keeps_hash(self):
+        hashed = make_password("Legacy-Pass-1", hasher="pbkdf2_sha256")
+        User.objects.create(username="legacy", password=hashed)
+        response = self.login("legacy", "wrong")
+        self.assertNotEqual(response.json().get("status"), "Authenticated")
+        self.assertEqual(User.objects.get(username="legacy").password, hashed)
+
+    def test_logout_revokes_the_session(self):
+        User.objects.create_user("member", password="Member-Pass-1")
+        self.login("member", "Member-Pass-1")
+        session_key = self.client.cookies[settings.SESSION_COOKIE_NAME].value
+        self.assertIsNotNone(SessionStore(session_key).get(SESSION_KEY))
+        self.client.get("/djangoapp/logout")
+        self.assertIsNone(SessionStore(session_key).get(SESSION_KEY))
+
+
+class ImportUsersTests(TestCase):
+    """Bulk user import with pre-hashed passwords."""
+
+    def write_csv(self, rows):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["username", "password", "email"])
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def test_counts_only_inserted_users(self):
+        User.objects.create_user("existing", password="Existing-Pass-1")
+        hashed = make_password("Import-Pass-1")
+        path = self.write_csv(
+            [
+                {"username": "existing", "password": hashed, "email": ""},
+                {"username": "staff1", "password": hashed, "email": "s1@x.com"},
+                {"username": "staff2", "password": hashed, "email": "s2@x.com"},
+                {"username": "staff3", "password": hashed, "email": "s3@x.com"},
+                {"username": "plain", "password": "not-a-hash", "email": ""},
+            ]
+        )
+
+        stats = import_users(path, batch_size=2)
+
+        self.assertEqual(
+            stats,
+            {"read": 5, "created": 3, "existing": 1, "duplicates": 0, "skipped": 1},
+        )
+        self.assertTrue(
+            User.objects.get(username="staff2").check_password("Import-Pass-1")
+        )
+        self.assertEqual(import_users(path)["created"], 0)
+
+    def test_conflicting_rows_are_not_counted(self):
+        hashed = make_password("Import-Pass-1")
+        path = self.write_csv(
+            [
+                {"username": f"staff{i}", "password": hashed, "email": ""}
+                for i in range(3)
+            ]
+        )
+        User.objects.create_user("staff1")
+        real_filter = User.objects.filter
+        lookups = []
+
+        def filter(*args, **kwargs):
+            # The first lookup runs before another request registers staff1
+            lookups.append(kwargs)
+            users = real_filter(*args, **kwargs)
+            return users.exclude(username="staff1") if len(lookups) == 1 else users
+
+        with mock.patch.object(User.objects, "filter", filter):
+            stats = import_users(path)
+
+        self.assertEqual(
+            stats,
+            {"read": 3, "created": 2, "existing": 1, "duplicates": 0, "skipped": 0},
+        )
+        self.assertEqual(len(lookups), 2)  # the batch was retried once
+        self.assertEqual(User.objects.filter(username__startswith="staff").count(), 3)
+
+    def test_repeated_usernames_are_created_once(self):
+        path = self.write_csv(
+            [
+                {
+                    "username": "staff1",
+                    "password": make_password("First-1"),
+                    "email": "",
+                },
+                {
+                    "username": "staff2",
+                    "password": make_password("Other-2"),
+                    "email": "",
+                },
+                {
+                    "username": "staff1",
+                    "password": make_password("Second-1"),
+                    "email": "",
+                },
+                {
+                    "username": "staff1",
+                    "password": make_password("Third-1"),
+                    "email": "",
+                },
+            ]
+        )
+
+        stats = import_users(path, batch_size=2)
+
+        self.assertEqual(
+            stats,
+            {"read": 4, "created": 2, "existing": 0, "duplicates": 2, "skipped": 0},
+        )
+        self.assertTrue(User.objects.get(username="staff1").check_password("First-1"))
+
+
+class ReviewStreamTests(SimpleTestCase):
+    """Streaming dealer reviews from the sync and async views."""
+
+    databases = {"default"}  # shared tier of the sentiment cache
+    path = "/djangoapp/reviews/dealer/15?stream=ndjson&limit=2"
+
+    def setUp(self):
+        backend = start_backend()
+        self.addCleanup(backend.shutdown)
+        sentiment = start_sentiment()
+        self.addCleanup(sentiment.shutdown)
+        self.use_upstream("backend_url", backend.server_address[1])
+        self.use_upstream("sentiment_analyzer_url", sentiment.server_address[1])
+        restapis.close_sessions()
+        restapis._breakers.clear()
+        restapis.sentiment_cache.clear()
+        restapis.sentiment_cache.shared.clear()
+        self.addCleanup(restapis.close_sessions)
+        self.addCleanup(restapis._breakers.clear)
+        self.addCleanup(restapis.sentiment_cache.clear)
+        self.addCleanup(restapis.sentiment_cache.shared.clear)
+        self.seen = []
+
+    def use_upstream(self, name, port):
+        patcher = mock.patch.object(restapis, name, f"http://127.0.0.1:{port}")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def record(self, func):
+        """Wrap ``func`` to record the budget and span it is called with."""
+
+        def wrapper(*args, **kwargs):
+            self.seen.append((remaining_budget(), tracing.current_span()))
+            return func(*args, **kwargs)
+
+        async def async_wrapper(*args, **kwargs):
+            self.seen.append((remaining_budget(), tracing.current_span()))
+            return await func(*args, **kwargs)
+
+        return async_wrapper if asyncio.iscoroutinefunction(func) else wrapper
+
+    def build_response(self, view, request):
+        """Call ``view`` inside a request's budget and trace span."""
+        span = tracing.Span("GET reviews", "server", "ab" * 16)
+        token = tracing._current_span.set(span)
+        try:
+            with upstream_budget(5):
+                response = view(request, dealer_id=15)
+        finally:
+            tracing._current_span.reset(token)
+        return response, span
+
+    def assert_streamed_in_request_context(self, lines, span):
+        self.assertEqual(remaining_budget(), None)
+        self.assertGreater(len(self.seen), 1)
+        for budget, current in self.seen:
+            self.assertIsNotNone(budget)
+            self.assertIs(current, span)
+        self.assertTrue(lines)
+        self.assertTrue(all("id" in line for line in lines))
+
+    def test_sync_stream_keeps_budget_and_span(self):
+        with mock.patch.object(views, "get_request", self.record(views.get_request)):
+            response, span = self.build_response(
+                views.get_dealer_reviews, RequestFactory().get(self.path)
+            )
+            body = b"".join(response.streaming_content)
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assert_streamed_in_request_context(lines, span)
+
+    def test_async_stream_keeps_budget_and_span(self):
+        async def stream():
+            response, span = await self.build_async_response()
+            body = b"".join([chunk async for chunk in response.streaming_content])
+            return body, span
+
+        with mock.patch.object(
+            views, "get_request_async", self.record(views.get_request_async)
+        ):
+            body, span = asyncio.run(stream())
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assert_streamed_in_request_context(lines, span)
+
+    async def build_async_response(self):
+        span = tracing.Span("GET reviews", "server", "ab" * 16)
+        token = tracing._current_span.set(span)
+        try:
+            with upstream_budget(5):
+                response = await views.get_dealer_reviews_async(
+                    AsyncRequestFactory().get(self.path), dealer_id=15
+                )
+        finally:
+            tracing._current_span.reset(token)
+        return response, span
+
+    def test_sync_stream_without_sentiment_service(self):
+        self.use_upstream("sentiment_analyzer_url", _closed_port())
+        response = views.get_dealer_reviews(RequestFactory().get(self.path), 15)
+        lines = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertTrue(lines)
+        self.assertTrue(all(line["sentiment"] is None for line in lines))
+
+    def test_async_stream_without_sentiment_service(self):
+        self.use_upstream("sentiment_analyzer_url", _closed_port())
+
+        async def stream():
+            response = await views.get_dealer_reviews_async(
+                AsyncRequestFactory().get(self.path), dealer_id=15
+            )
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        lines = [json.loads(line) for line in asyncio.run(stream()).splitlines()]
+        self.assertTrue(lines)
+        self.assertTrue(all(line["sentiment"] is None for line in lines))
+
+
+class AddReviewTests(TestCase):
+    """Writing reviews through the add_review view."""
+
+    review = {
+        "name": "Reviewer",
+        "dealership": 15,
+        "review": "Great service",
+        "purchase": False,
+        "purchase_date": "",
+        "car_make": "",
+        "car_model": "",
+        "car_year": "",
+    }
+
+    def setUp(self):
+        self.backend = start_backend()
+        self.addCleanup(self.backend.shutdown)
+        sentiment = start_sentiment()
+        self.addCleanup(sentiment.shutdown)
+        for name, server in (
+            ("backend_url", self.backend),
+            ("sentiment_analyzer_url", sentiment),
+        ):
+            patcher = mock.patch.object(
+                restapis, name, f"http://127.0.0.1:{server.server_address[1]}"
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        restapis.close_sessions()
+        restapis._breakers.clear()
+        self.addCleanup(restapis.close_sessions)
+        self.addCleanup(restapis._breakers.clear)
+        self.client.force_login(User.objects.create_user("reviewer"))
+
+    def add_review(self):
+        return self.client.post(
+            "/djangoapp/add_review",
+            json.dumps(self.review),
+            content_type="application/json",
+        )
+
+    def stored_reviews(self):
+        return self.backend.data["reviews_by_dealer"][15]
+
+    def test_inline_mode_stores_the_sentiment(self):
+        count = len(self.stored_reviews())
+        response = self.add_review()
+        self.assertEqual(response.json()["status"], 200)
+        self.assertEqual(len(self.stored_reviews()), count + 1)
+        self.assertIn("sentiment", self.stored_reviews()[-1])
+
+    def test_inline_mode_without_sentiment_service(self):
+        with mock.patch.object(
+            restapis, "sentiment_analyzer_url", f"http://127.0.0.1:{_closed_port()}"
+        ):
+            response = self.add_review()
+        self.assertEqual(response.json()["status"], 200)
+        self.assertNotIn("sentiment", self.stored_reviews()[-1])
+
+    @override_settings(REVIEW_SENTIMENT_MODE="queue")
+    def test_queue_mode_scores_in_the_background(self):
+        review = self.add_review().json()["review"]
+        self.assertNotIn("sentiment", self.stored_reviews()[-1])
+        task = Task.objects.get(name="score_review_sentiment")
+        self.assertEqual(
+            task.payload,
+            {"review_id": review["id"], "text": "Great service", "dealer_id": 15},
+        )
+        self.assertEqual(run_task(claim_next()), "DONE")
+
+    @override_settings(REVIEW_SENTIMENT_MODE="queue")
+    def test_queue_failure_still_reports_the_stored_review(self):
+        count = len(self.stored_reviews())
+        with mock.patch(
+            "djangoapp.views.score_review_sentiment.delay",
+            side_effect=DatabaseError("database is locked"),
+        ):
+            with self.assertLogs("djangoapp.views", "ERROR"):
+                response = self.add_review()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.stored_reviews()), count + 1)
+
+    def test_new_review_drops_the_cached_review_list(self):
+        restapis.response_cache.get("fetchReviews/dealer/15", lambda: ["cached"])
+        self.add_review()
+        self.assertEqual(
+            restapis.response_cache.get("fetchReviews/dealer/15", lambda: ["fresh"]),
+            ["fresh"],
+        )
+
+    def test_anonymous_user_is_rejected(self):
+        self.client.logout()
+        self.assertEqual(self.add_review().status_code, 403)
+
+
+@override_settings(TASK_QUEUE={"VISIBILITY_TIMEOUT": 60, "RETENTION": 3600})
+class TaskQueueTests(TestCase):
+    """Claiming tasks from the database task queue."""
+
+    def stale_task(self, attempts, max_attempts=3):
+        locked_at = timezone.now() - timedelta(seconds=120)
+        return Task.objects.create(
+            name="score_review_sentiment",
+            payload={"review_id": 1, "text": "Great"},
+            status="RUNNING",
+            attempts=attempts,
+            max_attempts=max_attempts,
+            run_at=locked_at,
+            locked_at=locked_at,
+        )
+
+    def test_expired_task_is_reclaimed(self):
+        stale = self.stale_task(attempts=1)
+        claimed = claim_next()
+        self.assertEqual(
+            (claimed.pk, claimed.status, claimed.attempts), (stale.pk, "RUNNING", 2)
+        )
+
+    def test_expired_last_attempt_is_dead_lettered(self):
+        stale = self.stale_task(attempts=3)
+        self.assertIsNone(claim_next())
+        stale.refresh_from_db()
+        self.assertEqual((stale.status, stale.attempts), ("DEAD", 3))
+        self.assertIsNone(stale.locked_at)
+
+    def finished_task(self, status, age):
+        task = Task.objects.create(
+            name="score_review_sentiment", status=status, run_at=timezone.now()
+        )
+        updated_at = timezone.now() - timedelta(seconds=age)
+        Task.objects.filter(pk=task.pk).update(updated_at=updated_at)
+        return task
+
+    def test_purge_deletes_only_old_finished_tasks(self):
+        old_done = self.finished_task("DONE", 7200)
+        old_dead = self.finished_task("DEAD", 7200)
+        recent_done = self.finished_task("DONE", 60)
+        old_queued = self.finished_task("QUEUED", 7200)
+        self.assertEqual(purge_tasks(), 2)
+        self.assertQuerySetEqual(
+            Task.objects.order_by("pk").values_list("pk", flat=True),
+            [recent_done.pk, old_queued.pk],
+        )
+        self.assertFalse(Task.objects.filter(pk__in=[old_done.pk, old_dead.pk]))
+
+
+@override_settings(TASK_QUEUE={"RETENTION": 3600})
+class RunTasksCommandTests(TransactionTestCase):
+    """The run_tasks worker command (its threads use their own connections)."""
+
+    finished_task = TaskQueueTests.finished_task
+
+    def test_burst_run_counts_outcomes_and_purges(self):
+        self.finished_task("DONE", 7200)
+        unknown = Task.objects.create(name="missing_task", run_at=timezone.now())
+        out = io.StringIO()
+        call_command("run_tasks", "--burst", "--purge", stdout=out)
+        unknown.refresh_from_db()
+        self.assertEqual(unknown.status, "DEAD")
+        self.assertIn("Purged 1 finished tasks", out.getvalue())
+        self.assertIn("Tasks done: 0, retried: 0, dead-lettered: 1", out.getvalue())
+
+
+class TraceReportTests(SimpleTestCase):
+    """The trace_report command over span files."""
+
+    def test_malformed_spans_are_skipped_and_counted(self):
+        trace = "ab" * 16
+        lines = [
+            {"trace_id": trace, "span_id": "1", "name": "GET /", "duration_ms": 90},
+            {
+                "trace_id": trace,
+                "span_id": "2",
+                "parent_id": "1",
+                "name": "GET fetchDealers",
+                "service": "djangoapp",
+                "duration_ms": 60.5,
+            },
+            {"trace_id": trace, "span_id": "3", "name": "GET /analyze"},
+            {"trace_id": trace, "span_id": "4", "name": "x", "duration_ms": "5"},
+            {"trace_id": None, "span_id": "5", "name": "x", "duration_ms": 5},
+            {"message": "a JSON log line"},
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+            f.write("plain log line\n")
+            f.writelines(json.dumps(line) + "\n" for line in lines)
+        self.addCleanup(os.remove, f.name)
+
+        out, err = io.StringIO(), io.StringIO()
+        call_command("trace_report", f.name, stdout=out, stderr=err)
+        self.assertIn(f"{trace}       90.0 ms  GET /  (2 spans)", out.getvalue())
+        self.assertIn("slowest hop: djangoapp GET fetchDealers 60.5 ms", out.getvalue())
+        self.assertIn("Skipped 3 malformed spans", err.getvalue())
@@ -0,0 +1,231 @@
+"""
+Request Tracing
+
+This module correlates a Django request with the upstream calls it makes to
+the Node backend and the sentiment service. It follows the W3C Trace Context
+format, so the services only exchange a single ``traceparent`` header:
+
+    traceparent: 00-<32 hex trace id>-<16 hex parent span id>-01
+
+Key Features:
+1. Server spans (tracing_middleware):
+   - Continues the trace of an incoming ``traceparent`` header, or starts a
+     new trace, and records one span per request
+   - Returns the trace id in the ``X-Trace-Id`` response header
+2. Client spans (hooked into the restapis HTTP sessions and async clients):
+   - Records one child span per upstream call and sends its ``traceparent``
+     so the backend and the sentiment service log the same trace id
+3. Export:
+   - Finished spans are appended as JSON lines to settings.TRACING["EXPORT_PATH"]
+     (which a log shipper or collector can tail); the trace_report management
+     command lists the slowest hop of each trace
+
+The current span is kept in a ``contextvars.ContextVar`` so it follows the
+request across sync views, async views and ``sync_to_async`` calls.
+
+Configuration:
+- settings.TRACING["ENABLED"]: Turns span recording and propagation on
+- settings.TRACING["EXPORT_PATH"]: JSON lines file spans are appended to
+  (no export when empty)
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.decorators import sync_and_async_middleware
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_HEADER = "traceparent"
+TRACE_ID_HEADER = "X-Trace-Id"
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_current_span = ContextVar("djangoapp_current_span", default=None)
+_export_lock = threading.Lock()
+
+
+def _options():
+    options = {"ENABLED": False, "EXPORT_PATH": ""}
+    options.update(getattr(settings, "TRACING", {}))
+    return options
+
+
+def enabled():
+    """Returns True when tracing is enabled in the settings."""
+    return bool(_options()["ENABLED"])
+
+
+class Span:
+    """
+    A timed operation belonging to a trace.
+
+    Args:
+        name (str): Operation name, e.g. the view name or "GET /fetchDealers"
+        kind (str): "server" for incoming requests, "client" for upstream calls
+        trace_id (str): 32 hex digit trace id
+        parent_id (str or None): Span id of the parent span
+    """
+
+    def __init__(self, name, kind, trace_id, parent_id=None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = {}
+        self.start = time.time()
+        self._started = time.perf_counter()
+        self.duration_ms = None
+
+    @property
+    def traceparent(self):
+        """The ``traceparent`` header value naming this span as parent."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def finish(self):
+        """Records the duration of the span and exports it."""
+        self.duration_ms = round((time.perf_counter() - self._started) * 1000, 3)
+        export(self)
+
+    def to_dict(self):
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "service": "djangoapp",
+            "start": self.start,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+        }
+
+
+def parse_traceparent(value):
+    """
+    Parses a ``traceparent`` header.
+
+    Args:
+        value (str or None): Header value
+
+    Returns:
+        tuple or None: (trace_id, parent_span_id), or None when the header
+                       is missing or malformed
+    """
+    match = _TRACEPARENT.match((value or "").strip().lower())
+    if match is None or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2)
+
+
+def current_span():
+    """Returns the span of the running request or upstream call, if any."""
+    return _current_span.get()
+
+
+def export(span):
+    """
+    Appends a finished span to the export file, if one is configured.
+
+    Args:
+        span (Span): Finished span
+    """
+    path = _options()["EXPORT_PATH"]
+    if not path:
+        return
+    line = json.dumps(span.to_dict()) + "\n"
+    try:
+        with _export_lock, open(path, "a") as f:
+            f.write(line)
+    except OSError as e:
+        logger.warning(f"Failed to export span: {str(e)}")
+
+
+@contextmanager
+def client_span(name, headers, **attributes):
+    """
+    Records a client span for an upstream call and injects its traceparent.
+
+    Does nothing when tracing is disabled or no request span is active.
+
+    Args:
+        name (str): Operation name
+        headers (MutableMapping): Outgoing request headers; ``traceparent``
+                                  is set on them
+        **attributes: Attributes stored with the span
+
+    Yields:
+        Span or None: The client span, so the caller can add attributes
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    span = Span(name, "client", parent.trace_id, parent.span_id)
+    span.attributes.update(attributes)
+    headers[TRACEPARENT_HEADER] = span.traceparent
+    try:
+        yield span
+    except Exception as e:
+        span.attributes["error"] = type(e).__name__
+        raise
+    finally:
+        span.finish()
+
+
+def _start_server_span(request):
+    incoming = parse_traceparent(request.headers.get(TRACEPARENT_HEADER))
+    trace_id, parent_id = incoming if incoming else (os.urandom(16).hex(), None)
+    span = Span(f"{request.method} {request.path}", "server", trace_id, parent_id)
+    span.attributes["http.method"] = request.method
+    span.attributes["http.path"] = request.path
+    return span, _current_span.set(span)
+
+
+def _finish_server_span(request, response, span, token):
+    match = getattr(request, "resolver_match", None)
+    if match is not None:
+        span.name = match.view_name
+    span.attributes["http.status_code"] = response.status_code
+    response[TRACE_ID_HEADER] = span.trace_id
+    _current_span.reset(token)
+    span.finish()
+
+
+@sync_and_async_middleware
+def tracing_middleware(get_response):
+    """
+    Middleware recording a server span for every request.
+
+    Works with both sync and async views.
+    """
+    if not enabled():
+        raise MiddlewareNotUsed
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            span, token = _start_server_span(request)
+            response = await get_response(request)
+            _finish_server_span(request, response, span, token)
+            return response
+
+        return middleware
+
+    def middleware(request):
+        span, token = _start_server_span(request)
+        response = get_response(request)
+        _finish_server_span(request, response, span, token)
+        return response
+
+    return middleware
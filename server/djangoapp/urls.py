@@ -23,8 +23,12 @@ URL Patterns:
         - /reviews/dealer/<int:dealer_id>: Get all reviews for a specific dealer
         - /add_review: Submit a new dealer review (requires authentication)
             Includes sentiment analysis through IBM Cloud integration
+        - /sentiment_cache_stats: Hit/miss counters of the review sentiment cache
+        - /metrics: Request and upstream latency metrics (Prometheus format)
 
 Note:
+    - With settings.ASYNC_VIEWS enabled (ASGI deployments), the dealer and
+      review endpoints are served by their async view variants
     - All paths are prefixed with 'djangoapp/' due to the app_name setting
     - Static and media files are served using Django's static file handling in development
     - Authentication is required for submitting reviews
@@ -36,6 +40,15 @@ from django.urls import path
 
 from . import views
 
+if settings.ASYNC_VIEWS:
+    dealerships_view = views.get_dealerships_async
+    dealer_details_view = views.get_dealer_details_async
+    dealer_reviews_view = views.get_dealer_reviews_async
+else:
+    dealerships_view = views.get_dealerships
+    dealer_details_view = views.get_dealer_details
+    dealer_reviews_view = views.get_dealer_reviews
+
 app_name = "djangoapp"
 urlpatterns = [
     # Authentication endpoints
@@ -45,22 +58,28 @@ urlpatterns = [
     # Car management endpoints
     path(route="get_cars", view=views.get_cars, name="get_cars"),
     # Dealer management endpoints
-    path(route="get_dealers", view=views.get_dealerships, name="get_dealers"),
+    path(route="get_dealers", view=dealerships_view, name="get_dealers"),
     path(
         route="get_dealers/<str:state>",
-        view=views.get_dealerships,
+        view=dealerships_view,
         name="get_dealers_by_state",
     ),
     path(
         route="get_dealer/<int:dealer_id>",
-        view=views.get_dealer_details,
+        view=dealer_details_view,
         name="get_dealer_details",
     ),
     # Review system endpoints with sentiment analysis
     path(
         route="reviews/dealer/<int:dealer_id>",
-        view=views.get_dealer_reviews,
+        view=dealer_reviews_view,
         name="get_dealer_reviews",
     ),
     path(route="add_review", view=views.add_review, name="add_review"),
+    path(
+        route="sentiment_cache_stats",
+        view=views.sentiment_cache_stats,
+        name="sentiment_cache_stats",
+    ),
+    path(route="metrics", view=views.metrics, name="metrics"),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -9,19 +9,45 @@ The views interact with both the local database through Django models and an ext
 backend service through REST API calls.
 """
 
+import asyncio
+import contextvars
 import json
 import logging
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth import logout
 from django.contrib.auth import authenticate, login
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from django.http import JsonResponse
+from django.db import IntegrityError, transaction
+from django.http import (
+    HttpResponse,
+    HttpResponseNotModified,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.http.request import BadRequest
+from django.utils.http import parse_etags
 from django.views.decorators.csrf import csrf_exempt
 
-from djangoapp.models import CarMake, CarModel
-from djangoapp.populate import initiate
-from djangoapp.restapis import analyze_review_sentiments, get_request, post_review
+from djangoapp.catalog import get_catalog, get_catalog_page
+from djangoapp.metrics import enabled as metrics_enabled, render as render_metrics
+from djangoapp.mirror import read_dealer, read_dealerships
+from djangoapp.restapis import (
+    analyze_review_sentiments_batch,
+    analyze_review_sentiments_batch_async,
+    get_request,
+    get_request_async,
+    get_request_cached,
+    get_request_cached_async,
+    get_sentiment_cache_stats,
+    post_review,
+    response_cache,
+    score_review_sentiments,
+)
+from djangoapp.states import normalize_state
+from djangoapp.tasks import score_review_sentiment
 
 # Get an instance of a logger
 logger = logging.getLogger(__name__)
@@ -35,6 +61,10 @@ def login_user(request):
     Processes POST requests containing user credentials and authenticates the user.
     CSRF protection is disabled for this view to allow external requests.
 
+    Passwords stored with another hasher than settings.PASSWORD_HASHER, or
+    with outdated cost parameters, are rehashed by ``authenticate`` on a
+    successful login (see djangoapp.hashers).
+
     Args:
         request: HTTP request object containing user credentials in POST data
 
@@ -93,6 +123,11 @@ def registration(request):
     Processes POST requests containing new user information and creates a user account.
     CSRF protection is disabled to allow external requests.
 
+    The password is hashed first, then the account is created with a single
+    INSERT that relies on the unique username constraint: a taken username
+    (including one registered by a concurrent request) raises IntegrityError,
+    answered with a 400.
+
     Args:
         request: HTTP request object containing user registration data in POST
 
@@ -108,23 +143,26 @@ def registration(request):
         email = data["email"]
         firstName = data["firstName"]
         lastName = data["lastName"]
-        user_exists = User.objects.filter(username=userName).exists()
-        if user_exists:
-            logger.error(f"User {userName} already exists")
-            return JsonResponse({"error": "User already exists"}, status=400)
         try:
-            user = User.objects.create_user(
-                username=userName,
-                password=password,
-                email=email,
+            # Hash before the transaction so the write lock is only held for
+            # the INSERT, not for the tens of milliseconds of hashing
+            user = User(
+                username=User.normalize_username(userName),
+                password=make_password(password),
+                email=User.objects.normalize_email(email),
                 first_name=firstName,
                 last_name=lastName,
             )
+            with transaction.atomic():
+                user.save(force_insert=True)
             login(request, user)
             logger.info(f"User {userName} registered successfully")
             return JsonResponse(
                 {"userName": userName, "status": "Registered"}, safe=True
             )
+        except IntegrityError:
+            logger.error(f"User {userName} already exists")
+            return JsonResponse({"error": "User already exists"}, status=400)
         except Exception as e:
             logger.error(f"Failed to register user: {str(e)}")
             return JsonResponse({"error": "Registration failed"}, status=500)
@@ -134,15 +172,26 @@ def get_cars(request):
     """
     Retrieve all cars from the database.
 
-    If the database is empty, it will be populated with initial data using
-    the initiate() function. Returns a list of cars with their make and model
-    information.
+    The catalog is seeded by a data migration, serialized once and served from
+    the catalog cache (see ``djangoapp.catalog``) until a CarMake or CarModel
+    changes. Responses carry an ETag; clients sending a matching
+    If-None-Match header receive a 304 without a body.
+
+    When any of the query parameters below is given, a single page of the
+    filtered catalog is returned instead, along with the cursor of the next
+    page ("next", null on the last page).
 
     Args:
         request: HTTP request object
+            Query parameters (all optional):
+                make: Car make name (case-insensitive)
+                type: Car type (SEDAN, SUV or WAGON)
+                year_min, year_max: Inclusive year range
+                limit: Page size (default 50, max 200)
+                after: Cursor returned as "next" by the previous page
 
     Returns:
-        JsonResponse: List of cars with their details
+        HttpResponse: List of cars with their details
             Format: {
                 "CarModels": [
                     {
@@ -153,15 +202,318 @@ def get_cars(request):
                 ]
             }
     """
-    count = CarMake.objects.count()
-    if count == 0:
-        initiate()
-    car_models = CarModel.objects.select_related("maker")
-    cars = []
-    for car_model in car_models:
-        cars.append({"CarModel": car_model.name, "CarMake": car_model.maker.name})
+    if any(param in request.GET for param in CATALOG_QUERY_PARAMS):
+        return _get_cars_page(request)
+
+    body, etag = get_catalog()
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    return response
+
+
+CATALOG_QUERY_PARAMS = ("make", "type", "year_min", "year_max", "limit", "after")
+
+
+def _get_cars_page(request):
+    """Return one page of the filtered car catalog for ``get_cars``."""
+    params = request.GET
+    try:
+        year_min = int(params["year_min"]) if params.get("year_min") else None
+        year_max = int(params["year_max"]) if params.get("year_max") else None
+        limit = int(params["limit"]) if params.get("limit") else None
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be positive")
+        cars, next_cursor = get_catalog_page(
+            make=params.get("make"),
+            type_car=params.get("type"),
+            year_min=year_min,
+            year_max=year_max,
+            after=params.get("after"),
+            limit=limit,
+        )
+    except ValueError as e:
+        logger.error(f"Invalid catalog query: {str(e)}")
+        return JsonResponse({"error": "Invalid query parameters"}, status=400)
+    return JsonResponse({"CarModels": cars, "next": next_cursor})
+
+
+def _state_code(state):
+    """
+    Return the 2-letter code of ``state``, or None for 'All'.
+
+    Raises:
+        BadRequest: If ``state`` is not a known state name or code.
+    """
+    if state == "All":
+        return None
+    code = normalize_state(state)
+    if code is None:
+        raise BadRequest(f"Unknown state: {state}")
+    return code
+
+
+def _dealerships_endpoint(state_code):
+    """
+    Return the backend endpoint listing the dealerships of a state.
+
+    States are looked up by code with the backend's exact-match endpoint.
+    """
+    endpoint = "fetchDealers"
+    if state_code is not None:
+        endpoint = f"{endpoint}/st/{state_code}"
+    return endpoint
+
+
+REVIEW_MAX_PAGE_SIZE = 500
+REVIEW_STREAM_BATCH_SIZE = 100
+REVIEW_STREAM_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def _reviews_endpoint(dealer_id):
+    return f"/fetchReviews/dealer/{dealer_id}"
+
+
+def _review_query(request):
+    """
+    Parse the pagination and streaming parameters of the reviews views.
+
+    Returns:
+        tuple: (limit or None, after or None, stream format or None)
+
+    Raises:
+        BadRequest: If a parameter is invalid.
+    """
+    params = request.GET
+    try:
+        limit = int(params["limit"]) if params.get("limit") else None
+        after = int(params["after"]) if params.get("after") else None
+    except ValueError:
+        raise BadRequest("limit and after must be integers")
+    if limit is not None and not 1 <= limit <= REVIEW_MAX_PAGE_SIZE:
+        raise BadRequest(f"limit must be between 1 and {REVIEW_MAX_PAGE_SIZE}")
+    stream = params.get("stream") or None
+    if stream is not None and stream not in REVIEW_STREAM_FORMATS:
+        raise BadRequest(f"stream must be one of {', '.join(REVIEW_STREAM_FORMATS)}")
+    return limit, after, stream
+
+
+def _review_page_kwargs(limit, after):
+    """Return the backend query parameters selecting one page of reviews."""
+    kwargs = {}
+    if limit is not None:
+        kwargs["limit"] = limit
+    if after is not None:
+        kwargs["after"] = after
+    return kwargs
+
+
+def _reviews_payload(reviews_detail, limit):
+    """Return the JSON body of a (possibly paginated) reviews response."""
+    payload = {"status": 200, "reviews": reviews_detail}
+    if limit is not None:
+        full_page = len(reviews_detail) == limit
+        payload["next"] = reviews_detail[-1]["id"] if full_page else None
+    return payload
+
+
+def _stream_prefix(stream):
+    return b'{"status": 200, "reviews": [' if stream == "json" else b""
+
+
+def _stream_suffix(stream, error):
+    if stream == "ndjson":
+        if error is None:
+            return b""
+        return json.dumps({"error": error}).encode("utf-8") + b"\n"
+    if error is None:
+        return b"]}"
+    return b'], "error": ' + json.dumps(error).encode("utf-8") + b"}"
+
+
+def _encode_stream_item(item, stream, first):
+    if stream == "ndjson":
+        return json.dumps(item).encode("utf-8") + b"\n"
+    return (b"" if first else b",") + json.dumps(item).encode("utf-8")
+
+
+def _stream_reviews(dealer_id, limit, after, stream):
+    """
+    Yield the encoded reviews of a dealer, one backend page at a time.
+
+    Errors after the response has started are reported in-band: as a final
+    {"error": ...} line for NDJSON, or an "error" key for JSON.
+    """
+    batch_size = limit or REVIEW_STREAM_BATCH_SIZE
+    endpoint = _reviews_endpoint(dealer_id)
+    first = True
+    error = None
+    yield _stream_prefix(stream)
+    while True:
+        reviews = get_request(endpoint, **_review_page_kwargs(batch_size, after))
+        if reviews is None:
+            error = "Failed to get reviews"
+            break
+        sentiments = _sentiments_or_none(
+            reviews, analyze_review_sentiments_batch(_unscored_texts(reviews))
+        )
+        for detail in _merge_sentiments(reviews, sentiments):
+            yield _encode_stream_item(detail, stream, first)
+            first = False
+        if len(reviews) < batch_size:
+            break
+        after = reviews[-1]["id"]
+
+    if error is not None:
+        logger.error(f"Error while streaming reviews of dealer {dealer_id}: {error}")
+    yield _stream_suffix(stream, error)
+
+
+async def _stream_reviews_async(dealer_id, limit, after, stream):
+    """Async variant of ``_stream_reviews``."""
+    batch_size = limit or REVIEW_STREAM_BATCH_SIZE
+    endpoint = _reviews_endpoint(dealer_id)
+    first = True
+    error = None
+    yield _stream_prefix(stream)
+    while True:
+        reviews = await get_request_async(
+            endpoint, **_review_page_kwargs(batch_size, after)
+        )
+        if reviews is None:
+            error = "Failed to get reviews"
+            break
+        sentiments = _sentiments_or_none(
+            reviews,
+            await analyze_review_sentiments_batch_async(_unscored_texts(reviews)),
+        )
+        for detail in _merge_sentiments(reviews, sentiments):
+            yield _encode_stream_item(detail, stream, first)
+            first = False
+        if len(reviews) < batch_size:
+            break
+        after = reviews[-1]["id"]
+
+    if error is not None:
+        logger.error(f"Error while streaming reviews of dealer {dealer_id}: {error}")
+    yield _stream_suffix(stream, error)
+
 
-    return JsonResponse({"CarModels": cars})
+def _in_request_context(chunks):
+    """
+    Return an iterator over ``chunks`` that runs in a copy of the current
+    context.
+
+    A streaming response is consumed after the view and its middleware have
+    returned, so the upstream calls made while streaming would otherwise run
+    outside the request's upstream budget and trace span. Call this while
+    building the response to keep both.
+    """
+    context = contextvars.copy_context()
+
+    def iterate():
+        try:
+            while True:
+                try:
+                    chunk = context.run(next, chunks)
+                except StopIteration:
+                    return
+                yield chunk
+        finally:
+            context.run(chunks.close)
+
+    return iterate()
+
+
+async def _next_chunk(chunks):
+    return await chunks.__anext__()
+
+
+async def _close_chunks(chunks):
+    await chunks.aclose()
+
+
+def _in_request_context_async(chunks):
+    """Async variant of ``_in_request_context``."""
+    context = contextvars.copy_context()
+
+    async def iterate():
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.create_task(
+                        _next_chunk(chunks), context=context
+                    )
+                except StopAsyncIteration:
+                    return
+                yield chunk
+        finally:
+            await asyncio.create_task(_close_chunks(chunks), context=context)
+
+    return iterate()
+
+
+def _streaming_reviews_response(chunks, stream):
+    if hasattr(chunks, "__aiter__"):
+        chunks = _in_request_context_async(chunks)
+    else:
+        chunks = _in_request_context(chunks)
+    return StreamingHttpResponse(chunks, content_type=REVIEW_STREAM_FORMATS[stream])
+
+
+def _review_detail(review, sentiment):
+    """Return the public representation of a backend review."""
+    return {
+        "id": review["id"],
+        "name": review["name"],
+        "review": review["review"],
+        "purchase": review["purchase"],
+        "purchase_date": review["purchase_date"],
+        "car_make": review["car_make"],
+        "car_model": review["car_model"],
+        "car_year": review["car_year"],
+        "sentiment": sentiment,
+        "compound": review.get("compound"),
+    }
+
+
+def _unscored_texts(reviews):
+    """Return the texts of the reviews stored without a precomputed sentiment."""
+    return [review["review"] for review in reviews if not review.get("sentiment")]
+
+
+def _sentiments_or_none(reviews, sentiments):
+    """
+    Return ``sentiments``, or one None per unscored review when the sentiment
+    service failed (or its circuit is open), so the reviews are still served
+    with "sentiment": null instead of failing the whole page.
+    """
+    if sentiments is not None:
+        return sentiments
+    unscored = _unscored_texts(reviews)
+    if unscored:
+        logger.warning(
+            f"Sentiment unavailable, serving {len(unscored)} reviews without it"
+        )
+    return [None] * len(unscored)
+
+
+def _merge_sentiments(reviews, sentiments):
+    """
+    Return the review details, using the stored sentiment of each review when
+    present and the next of ``sentiments`` (computed for
+    ``_unscored_texts(reviews)``) otherwise.
+    """
+    computed = iter(sentiments)
+    return [
+        _review_detail(review, review.get("sentiment") or next(computed))
+        for review in reviews
+    ]
 
 
 def get_dealerships(request, state="All"):
@@ -169,7 +521,9 @@ def get_dealerships(request, state="All"):
     Fetch dealerships from the backend API, optionally filtered by state.
 
     Makes a request to the backend service to retrieve dealership information.
-    Can filter dealerships by state if specified.
+    Can filter dealerships by state if specified. Served from the local
+    dealership mirror when it is enabled and fresh, otherwise from the
+    read-through response cache.
 
     Args:
         request: HTTP request object
@@ -178,16 +532,14 @@ def get_dealerships(request, state="All"):
     Returns:
         JsonResponse: JSON object containing status and dealerships data
             Success: {"status": 200, "dealers": dealerships_data}
-            Error: {"error": error_message}
+            Error: {"error": error_message} (400 for an unknown state)
     """
     try:
-        # Construct endpoint based on state parameter
-        endpoint = "fetchDealers"
-        if state != "All":
-            endpoint = f"{endpoint}/{state}"
-
-        # Get dealerships from backend
-        dealerships = get_request(endpoint)
+        state_code = _state_code(state)
+        dealerships = read_dealerships(state_code)
+        if dealerships is None:
+            # Get dealerships from backend
+            dealerships = get_request_cached(_dealerships_endpoint(state_code))
 
         if dealerships is None:
             logger.error("Failed to fetch dealerships from backend")
@@ -195,6 +547,9 @@ def get_dealerships(request, state="All"):
 
         return JsonResponse({"status": 200, "dealers": dealerships})
 
+    except BadRequest as e:
+        logger.error(f"Invalid request in get_dealerships: {str(e)}")
+        return JsonResponse({"error": str(e)}, status=400)
     except Exception as e:
         logger.error(f"Error in get_dealerships: {str(e)}")
         return JsonResponse({"error": "Internal server error"}, status=500)
@@ -205,6 +560,8 @@ def get_dealer_details(request, dealer_id):
     Fetch dealer details from the backend API.
 
     Makes a request to the backend service to retrieve dealer information.
+    Served from the local dealership mirror when it is enabled, fresh and has
+    the dealer, otherwise from the read-through response cache.
 
     Args:
         request: HTTP request object
@@ -217,8 +574,9 @@ def get_dealer_details(request, dealer_id):
     """
     try:
         if dealer_id:
-            endpoint = f"fetchDealer/{dealer_id}"
-            dealer = get_request(endpoint)
+            dealer = read_dealer(dealer_id)
+            if dealer is None:
+                dealer = get_request_cached(f"fetchDealer/{dealer_id}")
             if dealer is None:
                 logger.error("Failed to get dealer from backend")
                 return JsonResponse(
@@ -238,65 +596,218 @@ def get_dealer_reviews(request, dealer_id):
     """
     Fetch dealer reviews from the backend API.
 
-    Makes a request to the backend service to retrieve all reviews for a given dealer.
-    Analyzes the sentiment of each review using the sentiment analyzer service.
+    Makes a request to the backend service to retrieve the reviews of a given dealer.
+    Reviews carry the sentiment computed when they were written; any review
+    stored without one is analyzed with a single batched call to the
+    sentiment analyzer service. If that service fails, is slow past the
+    request's time budget or has its circuit open, those reviews are
+    returned with "sentiment": null rather than failing the page.
+
+    Without query parameters every review is returned at once. With "limit"
+    (and "after") a single page is returned together with the cursor of the
+    next one. With "stream" the reviews are fetched, enriched and written in
+    batches of "limit" (default 100), so the first bytes go out before the
+    last page is fetched.
 
     Args:
         request: HTTP request object
+            Query parameters (all optional):
+                limit: Page size (max 500)
+                after: Review id returned as "next" by the previous page
+                stream: "ndjson" (one review per line) or "json"
         dealer_id (int): ID of the dealer to fetch reviews for.
 
     Returns:
-        JsonResponse: JSON object containing status and dealer reviews
-            Success: {"status": 200, "dealerReviews": dealer_reviews}
+        JsonResponse or StreamingHttpResponse: JSON object containing status and dealer reviews
+            Success: {"status": 200, "reviews": dealer_reviews}
+                     (plus "next": review_id or null when paginated)
             Error: {"error": error_message}
     """
     try:
         if dealer_id:
+            limit, after, stream = _review_query(request)
+            if stream:
+                return _streaming_reviews_response(
+                    _stream_reviews(dealer_id, limit, after, stream), stream
+                )
+
             reviews_detail = []
-            endpoint = f"/fetchReviews/dealer/{dealer_id}"
-            reviews = get_request(endpoint)
+            endpoint = _reviews_endpoint(dealer_id)
+            reviews = get_request(endpoint, **_review_page_kwargs(limit, after))
             if reviews is None:
                 logger.error("Failed to get reviews from backend")
                 return JsonResponse(
                     {"error": "Failed to get reviews", "status": 500}, status=500
                 )
 
-            for review in reviews:
+            sentiments = _sentiments_or_none(
+                reviews, analyze_review_sentiments_batch(_unscored_texts(reviews))
+            )
 
-                response = analyze_review_sentiments(review["review"])
-                if response is None:
-                    raise Exception("Failed to analyze review sentiment")
+            reviews_detail.extend(_merge_sentiments(reviews, sentiments))
 
-                reviews_detail.append(
-                    {
-                        "id": review["id"],
-                        "name": review["name"],
-                        "review": review["review"],
-                        "purchase": review["purchase"],
-                        "purchase_date": review["purchase_date"],
-                        "car_make": review["car_make"],
-                        "car_model": review["car_model"],
-                        "car_year": review["car_year"],
-                        "sentiment": response["sentiment"],
-                    }
+            return JsonResponse(_reviews_payload(reviews_detail, limit))
+        raise BadRequest("Reviews not found")
+    except BadRequest as e:
+        logger.error(f"Invalid request in get_dealer_reviews: {str(e)}")
+        return JsonResponse({"error": str(e), "status": 400}, status=400)
+    except Exception as e:
+        logger.error(f"Error in get_dealer_reviews: {str(e)}")
+        return JsonResponse(
+            {"error": "Internal server error", "status": 500}, status=500
+        )
+
+
+async def get_dealerships_async(request, state="All"):
+    """
+    Async variant of ``get_dealerships`` for ASGI deployments.
+
+    Args:
+        request: HTTP request object
+        state (str): State to filter dealerships by. Defaults to 'All' for all dealerships.
+
+    Returns:
+        JsonResponse: Same payload as ``get_dealerships``
+    """
+    try:
+        state_code = _state_code(state)
+        dealerships = await sync_to_async(read_dealerships)(state_code)
+        if dealerships is None:
+            dealerships = await get_request_cached_async(
+                _dealerships_endpoint(state_code)
+            )
+
+        if dealerships is None:
+            logger.error("Failed to fetch dealerships from backend")
+            return JsonResponse({"error": "Failed to fetch dealerships"}, status=500)
+
+        return JsonResponse({"status": 200, "dealers": dealerships})
+
+    except BadRequest as e:
+        logger.error(f"Invalid request in get_dealerships_async: {str(e)}")
+        return JsonResponse({"error": str(e)}, status=400)
+    except Exception as e:
+        logger.error(f"Error in get_dealerships_async: {str(e)}")
+        return JsonResponse({"error": "Internal server error"}, status=500)
+
+
+async def get_dealer_details_async(request, dealer_id):
+    """
+    Async variant of ``get_dealer_details`` for ASGI deployments.
+
+    Args:
+        request: HTTP request object
+        dealer_id (int): ID of the dealer to fetch details for.
+
+    Returns:
+        JsonResponse: Same payload as ``get_dealer_details``
+    """
+    try:
+        if dealer_id:
+            dealer = await sync_to_async(read_dealer)(dealer_id)
+            if dealer is None:
+                dealer = await get_request_cached_async(f"fetchDealer/{dealer_id}")
+            if dealer is None:
+                logger.error("Failed to get dealer from backend")
+                return JsonResponse(
+                    {"error": "Failed to get dealer", "status": 500}, status=500
+                )
+
+            return JsonResponse({"status": 200, "dealer": dealer})
+        raise BadRequest("Dealer not found")
+    except Exception as e:
+        logger.error(f"Error in get_dealer_details_async: {str(e)}")
+        return JsonResponse(
+            {"error": "Internal server error", "status": 500}, status=500
+        )
+
+
+async def get_dealer_reviews_async(request, dealer_id):
+    """
+    Async variant of ``get_dealer_reviews`` for ASGI deployments.
+
+    Sentiment for the uncached reviews is requested concurrently, so the page
+    costs roughly the slowest sentiment call rather than the sum of them.
+    Accepts the same "limit", "after" and "stream" query parameters.
+
+    Args:
+        request: HTTP request object
+        dealer_id (int): ID of the dealer to fetch reviews for.
+
+    Returns:
+        JsonResponse or StreamingHttpResponse: Same payload as ``get_dealer_reviews``
+    """
+    try:
+        if dealer_id:
+            limit, after, stream = _review_query(request)
+            if stream:
+                return _streaming_reviews_response(
+                    _stream_reviews_async(dealer_id, limit, after, stream), stream
+                )
+
+            reviews = await get_request_async(
+                _reviews_endpoint(dealer_id), **_review_page_kwargs(limit, after)
+            )
+            if reviews is None:
+                logger.error("Failed to get reviews from backend")
+                return JsonResponse(
+                    {"error": "Failed to get reviews", "status": 500}, status=500
                 )
 
-            return JsonResponse({"status": 200, "reviews": reviews_detail})
+            sentiments = _sentiments_or_none(
+                reviews,
+                await analyze_review_sentiments_batch_async(_unscored_texts(reviews)),
+            )
+
+            reviews_detail = _merge_sentiments(reviews, sentiments)
+            return JsonResponse(_reviews_payload(reviews_detail, limit))
         raise BadRequest("Reviews not found")
+    except BadRequest as e:
+        logger.error(f"Invalid request in get_dealer_reviews_async: {str(e)}")
+        return JsonResponse({"error": str(e), "status": 400}, status=400)
     except Exception as e:
-        logger.error(f"Error in get_dealer_reviews: {str(e)}")
+        logger.error(f"Error in get_dealer_reviews_async: {str(e)}")
         return JsonResponse(
             {"error": "Internal server error", "status": 500}, status=500
         )
 
 
+def _queue_review_scoring(review):
+    """
+    Queue the sentiment scoring of a review stored without it.
+
+    The review is already saved, so a failure to queue must not fail the
+    request (the client would retry and store it twice): the review stays
+    unscored until ``backfill_review_sentiments`` picks it up.
+    """
+    try:
+        score_review_sentiment.delay(
+            review_id=review["id"],
+            text=review["review"],
+            dealer_id=review["dealership"],
+        )
+    except Exception as e:
+        logger.error(f"Failed to queue scoring of review {review['id']}: {str(e)}")
+
+
+def _invalidate_dealer_reviews(dealer_id):
+    """Drop the cached review list of a dealer after one of its reviews changed."""
+    try:
+        response_cache.invalidate(_reviews_endpoint(dealer_id))
+    except Exception as e:
+        logger.warning(f"Review cache invalidation failed: {str(e)}")
+
+
 def add_review(request):
     """
     Add a review to the backend API.
 
     This view function processes a POST request to add a review for a dealer.
     The request should contain JSON data with review details. Only authenticated
-    users can add reviews.
+    users can add reviews. The sentiment and compound score of the review are
+    computed here and stored with it, or, with settings.REVIEW_SENTIMENT_MODE
+    set to "queue", by a background task so the response does not wait for
+    the sentiment service.
 
     Args:
         request: HTTP request object containing user authentication and review data
@@ -309,6 +820,14 @@ def add_review(request):
     if not request.user.is_anonymous:
         data = json.loads(request.body)
         try:
+            queued = settings.REVIEW_SENTIMENT_MODE == "queue"
+            if not queued:
+                # Score once on write so reads are pure lookups; if the
+                # sentiment service is unavailable the review is stored
+                # unscored and picked up by backfill_review_sentiments.
+                scores = score_review_sentiments([data.get("review", "")])
+                if scores is not None:
+                    data.update(scores[0])
             response = post_review("insert_review", data)
             if response is None:
                 logger.error("Failed to add review")
@@ -316,6 +835,10 @@ def add_review(request):
                     {"error": "Failed to add review", "status": 500}, status=500
                 )
 
+            if queued:
+                _queue_review_scoring(response)
+            _invalidate_dealer_reviews(response["dealership"])
+
             return JsonResponse({"status": 200, "review": response})
         except Exception as e:
             logger.error(f"Error in add_review: {str(e)}")
@@ -324,3 +847,33 @@ def add_review(request):
             )
     else:
         return JsonResponse({"error": "Unauthorized", "status": 403}, status=403)
+
+
+def sentiment_cache_stats(request):
+    """
+    Report the sentiment cache counters of the worker serving the request.
+
+    Args:
+        request: HTTP request object
+
+    Returns:
+        JsonResponse: JSON object containing the cache counters
+            Success: {"status": 200, "stats": {"local_hits": ..., "misses": ...}}
+    """
+    return JsonResponse({"status": 200, "stats": get_sentiment_cache_stats()})
+
+
+def metrics(request):
+    """
+    Expose the request and upstream latency metrics of the worker serving the request.
+
+    Args:
+        request: HTTP request object
+
+    Returns:
+        HttpResponse: Metrics in the Prometheus text exposition format, or a
+            404 JSON error when metrics are disabled in the settings
+    """
+    if not metrics_enabled():
+        return JsonResponse({"error": "Metrics disabled", "status": 404}, status=404)
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4")
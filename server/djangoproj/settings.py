@@ -12,6 +12,9 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
 
 import os
 from pathlib import Path
+import re
+
+from django.core.exceptions import ImproperlyConfigured
 
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -52,6 +55,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "djangoapp.tracing.tracing_middleware",
+    "djangoapp.metrics.metrics_middleware",
+    "djangoapp.resilience.upstream_budget_middleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -86,15 +92,252 @@ WSGI_APPLICATION = "djangoproj.wsgi.application"
 
 
 # Database
-# https://docs.djangoproject.com/en/3.2/ref/settings/#databases
+# https://docs.djangoproject.com/en/5.1/ref/settings/#databases
+#
+# DB_ENGINE=postgres selects PostgreSQL (DB_NAME, DB_USER, DB_PASSWORD, DB_HOST,
+# DB_PORT); otherwise SQLite at DB_PATH. Connections are kept open for
+# DB_CONN_MAX_AGE seconds and checked before reuse; set it to 0 when serving
+# with uvicorn (ASGI), where Django does not support persistent connections.
+
+DB_ENGINES = ("sqlite", "postgres")
+DB_ENGINE = os.getenv("DB_ENGINE", "sqlite")
+if DB_ENGINE not in DB_ENGINES:
+    raise ImproperlyConfigured(
+        f"DB_ENGINE must be one of {', '.join(DB_ENGINES)}, not {DB_ENGINE!r}"
+    )
+_conn_max_age = os.getenv("DB_CONN_MAX_AGE", "60")
+if not _conn_max_age.isdigit():
+    raise ImproperlyConfigured(
+        f"DB_CONN_MAX_AGE must be a number of seconds (0 or more), "
+        f"not {_conn_max_age!r}"
+    )
+DB_CONN_MAX_AGE = int(_conn_max_age)
+
+# Run on every new SQLite connection. WAL lets readers proceed while a worker
+# writes; synchronous=NORMAL only syncs at checkpoints (still safe in WAL
+# mode); busy_timeout makes a writer wait for the lock instead of failing
+# with "database is locked"; reads go through a 128 MiB memory map.
+SQLITE_INIT_COMMAND = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA busy_timeout=10000;"
+    "PRAGMA mmap_size=134217728;"
+)
+
+if DB_ENGINE == "postgres":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.getenv("DB_NAME", "dealership"),
+            "USER": os.getenv("DB_USER", "postgres"),
+            "PASSWORD": os.getenv("DB_PASSWORD", ""),
+            "HOST": os.getenv("DB_HOST", "localhost"),
+            "PORT": os.getenv("DB_PORT", "5432"),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {"connect_timeout": 5},  # seconds
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.getenv("DB_PATH", BASE_DIR / "db.sqlite3"),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                "init_command": SQLITE_INIT_COMMAND,
+                # Take the write lock when a transaction starts, so that
+                # busy_timeout applies instead of failing when a read
+                # transaction later tries to write
+                "transaction_mode": "IMMEDIATE",
+            },
+        }
+    }
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
 
-DATABASES = {
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Shared by every worker process; create the table with `createcachetable`.
+    "sentiment": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "sentiment_cache",
+        "TIMEOUT": 60 * 60 * 24,
+        "OPTIONS": {"MAX_ENTRIES": 100000},
+    },
+    # Serialized car catalog served by the get_cars view.
+    "catalog": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "catalog_cache",
+        "TIMEOUT": None,
+    },
+    # Backend responses cached by djangoapp.restapis.ReadThroughCache.
+    "upstream": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "upstream_cache",
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+}
+
+# Cache of the cached_db and cache session engines. It must be shared by every
+# worker process: a session deleted by a logout on one worker would otherwise
+# stay valid on the others.
+SESSION_CACHE_URL = os.getenv("DJANGO_SESSION_CACHE_URL", "")  # redis://host:6379/1
+if SESSION_CACHE_URL:
+    CACHES["sessions"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": SESSION_CACHE_URL,
     }
+
+# Cache alias holding the serialized car catalog (see djangoapp.catalog).
+CAR_CATALOG_CACHE = "catalog"
+
+# Read-through cache for backend GETs. Entries are fresh for the TTL of their
+# endpoint and may be served for STALE_TTL more seconds while refreshed.
+RESPONSE_CACHE = {
+    "ALIAS": "upstream",
+    "TTLS": {
+        "fetchDealers": 60 * 10,
+        "fetchDealer": 60 * 30,
+    },
+    "DEFAULT_TTL": 60,
+    "STALE_TTL": 60 * 60,
+}
+
+# Review sentiment cache used by djangoapp.restapis
+SENTIMENT_CACHE = {
+    "MAX_ENTRIES": 10000,  # in-process LRU tier, per worker
+    "TTL": 60 * 60 * 24,  # seconds
+    "SHARED_CACHE": "sentiment",  # CACHES alias, or None to disable
+}
+
+# Seconds a request may spend on upstream calls in total ("none": no limit)
+_request_budget = os.getenv("UPSTREAM_REQUEST_BUDGET", "5").strip()
+if _request_budget.lower() == "none":
+    _request_budget = None
+elif re.fullmatch(r"\d+(\.\d+)?", _request_budget) and float(_request_budget) > 0:
+    _request_budget = float(_request_budget)
+else:
+    raise ImproperlyConfigured(
+        "UPSTREAM_REQUEST_BUDGET must be a number of seconds greater than 0 or "
+        f"'none', not {_request_budget!r}"
+    )
+
+# Pooled HTTP sessions used by djangoapp.restapis for the Node backend and the
+# sentiment service. Each gunicorn worker keeps one keep-alive pool per host;
+# sync workers serve one request at a time, so the pool only needs to hold one
+# connection per worker thread.
+UPSTREAM_HTTP = {
+    "POOL_CONNECTIONS": 2,  # distinct hosts: backend and sentiment service
+    "POOL_MAXSIZE": int(os.getenv("GUNICORN_THREADS", "1")),
+    "CONNECT_TIMEOUT": 3.05,  # seconds
+    "READ_TIMEOUT": 10,  # seconds
+    "MAX_RETRIES": 2,  # GET requests only
+    "BACKOFF_FACTOR": 0.2,
+    # Async views only: concurrent sentiment requests and texts per request
+    "SENTIMENT_CONCURRENCY": 8,
+    "SENTIMENT_CHUNK_SIZE": 25,
+    # Per-upstream circuit breakers: consecutive failures (errors, timeouts,
+    # 5xx) that open a circuit, and seconds before a probe call is let through
+    "BREAKER_FAILURE_THRESHOLD": 5,
+    "BREAKER_RESET_TIMEOUT": 30,
+    # Seconds a request may spend on upstream calls in total (None: no limit)
+    "REQUEST_BUDGET": _request_budget,
+}
+
+# Local mirror of the backend dealerships, refreshed by the sync_dealerships
+# management command. When enabled, dealer reads are served from it as long as
+# the last sync is at most MAX_STALENESS seconds old.
+DEALERSHIP_MIRROR = {
+    "ENABLED": os.getenv("DEALERSHIP_MIRROR", "false").lower() in ("1", "true", "yes"),
+    "MAX_STALENESS": 60 * 60,  # seconds
+}
+
+# Background task queue (djangoapp.tasks), processed by `manage.py run_tasks`.
+TASK_QUEUE = {
+    "RETRY_BACKOFF": 5,  # seconds, doubled after every failed attempt
+    "MAX_RETRY_DELAY": 60 * 60,  # seconds
+    "VISIBILITY_TIMEOUT": 60 * 5,  # seconds before a stuck task is retried
+    "RETENTION": 60 * 60 * 24 * 7,  # seconds done/dead tasks are kept
+}
+
+# How add_review computes review sentiment: "inline" scores it during the
+# request, "queue" stores the review at once and scores it with a background
+# task (requires a `manage.py run_tasks` worker).
+REVIEW_SENTIMENT_MODE = os.getenv("REVIEW_SENTIMENT_MODE", "inline")
+
+# Serve the dealer and review endpoints with their async views. Only useful
+# when running under an ASGI server (see the uvicorn CMD in the Dockerfile).
+ASYNC_VIEWS = os.getenv("DJANGO_ASYNC_VIEWS", "false").lower() in ("1", "true", "yes")
+
+# Request and upstream latency histograms (djangoapp.metrics), exposed in the
+# Prometheus text format at /djangoapp/metrics.
+METRICS = {
+    "ENABLED": os.getenv("DJANGO_METRICS", "true").lower() in ("1", "true", "yes"),
+    "BUCKETS": (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),  # seconds
+}
+
+# Request tracing (djangoapp.tracing): spans of each request and of its calls to
+# the backend and sentiment service, appended as JSON lines to EXPORT_PATH.
+TRACING = {
+    "ENABLED": os.getenv("DJANGO_TRACING", "false").lower() in ("1", "true", "yes"),
+    "EXPORT_PATH": os.getenv("DJANGO_TRACE_FILE", ""),
+}
+
+# Password hashing (djangoapp.hashers). PASSWORD_HASHER picks the algorithm for
+# new passwords: "argon2" (needs argon2-cffi), "scrypt" or "pbkdf2" (Django's
+# default). The other hashers stay listed so existing hashes still verify; they
+# are rehashed with the chosen one on the user's next successful login, as are
+# hashes made with different cost parameters.
+PASSWORD_HASHER = os.getenv("DJANGO_PASSWORD_HASHER", "argon2")
+PASSWORD_HASHER_CLASSES = {
+    "argon2": "djangoapp.hashers.Argon2PasswordHasher",
+    "scrypt": "django.contrib.auth.hashers.ScryptPasswordHasher",
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "pbkdf2_sha1": "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+}
+if PASSWORD_HASHER not in PASSWORD_HASHER_CLASSES:
+    raise ImproperlyConfigured(
+        f"DJANGO_PASSWORD_HASHER must be one of "
+        f"{', '.join(PASSWORD_HASHER_CLASSES)}, not {PASSWORD_HASHER!r}"
+    )
+PASSWORD_HASHERS = [PASSWORD_HASHER_CLASSES[PASSWORD_HASHER]] + [
+    path for name, path in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER
+]
+# Cost parameters of djangoapp.hashers. Argon2id with 19 MiB, 2 passes and one
+# lane is the minimum OWASP's password storage cheat sheet recommends; Django's
+# defaults (100 MiB, 8 lanes) cost several times more CPU and memory per login
+# without a matching gain at this size. One hash costs a CPU core roughly 40 ms,
+# against 340 ms with Django's scrypt (N=2**14, r=8, p=5) and 500 ms with PBKDF2
+# (870,000 iterations). Run `python -m benchmarks.login` after changing them.
+PASSWORD_HASHING = {
+    "ARGON2": {"TIME_COST": 2, "MEMORY_COST": 19 * 1024, "PARALLELISM": 1},  # 19 MiB
 }
 
+# Sessions: "db" (the default) reads the session from the django_session table
+# on every authenticated request; "cached_db" reads it from the "sessions"
+# cache and falls back to the table on a miss; "signed_cookies" keeps it in the
+# client's cookie (no storage at all, but a session cannot be revoked server
+# side before it expires). "cached_db" and "cache" need DJANGO_SESSION_CACHE_URL.
+SESSION_ENGINES = ("db", "cached_db", "signed_cookies", "cache", "file")
+_session_engine = os.getenv("DJANGO_SESSION_ENGINE", "db")
+if _session_engine not in SESSION_ENGINES:
+    raise ImproperlyConfigured(
+        f"DJANGO_SESSION_ENGINE must be one of {', '.join(SESSION_ENGINES)}, "
+        f"not {_session_engine!r}"
+    )
+if _session_engine in ("cached_db", "cache") and not SESSION_CACHE_URL:
+    raise ImproperlyConfigured(
+        f"DJANGO_SESSION_ENGINE={_session_engine} needs a cache shared by every "
+        "worker; set DJANGO_SESSION_CACHE_URL"
+    )
+SESSION_ENGINE = f"django.contrib.sessions.backends.{_session_engine}"
+SESSION_CACHE_ALIAS = "sessions"
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -4,5 +4,6 @@
 echo "Making migrations and migrating the database. "
 python manage.py makemigrations --noinput
 python manage.py migrate --noinput
+python manage.py createcachetable
 python manage.py collectstatic --noinput
 exec "$@"
\ No newline at end of file